@@ -11,7 +11,7 @@ import time
 import gc
 import psutil
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QMainWindow
-from PyQt6.QtCore import Qt, QTimer, QEasingCurve, QPropertyAnimation
+from PyQt6.QtCore import Qt, QObject, QTimer, QEasingCurve, QPropertyAnimation
 
 # Добавляем родительский каталог в путь для импорта
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -22,6 +22,9 @@ sys.path.insert(0, parent_dir)
 from transparent_scroller import (
     VerticalScrollBar,
     HorizontalScrollBar,
+    ScrollBarAnimationEngine,
+    ScrollBarOpacityAnimation,
+    ScrollBarDelayTimer,
 )
 
 # Количество тестовых циклов
@@ -89,6 +92,10 @@ class AnimationTest:
         # Создаем скроллер с auto_hide=False
         v_scrollbar_2 = VerticalScrollBar(auto_hide=False)
         
+        # Анимации создаются при первом показе скроллбара
+        v_scrollbar_1.animation_manager.start_show_animation()
+        v_scrollbar_2.animation_manager.start_show_animation()
+        
         # Проверяем, что анимации созданы только для скроллера с auto_hide=True
         has_animations_when_auto_hide = (
             hasattr(v_scrollbar_1.animation_manager, 'show_animation') and
@@ -232,6 +239,10 @@ class AnimationTest:
         # Создаем виджет с auto_hide=True
         v_scrollbar_1 = VerticalScrollBar(auto_hide=True)
         
+        # До первого показа анимации не создаются
+        not_created_before_show = v_scrollbar_1.animation_manager.show_animation is None
+        v_scrollbar_1.animation_manager.start_show_animation()
+        
         # Проверяем, что у него созданы анимации
         has_animations_true = (
             hasattr(v_scrollbar_1.animation_manager, 'show_animation') and
@@ -251,10 +262,139 @@ class AnimationTest:
             v_scrollbar_2.animation_manager.hide_animation is not None
         )
         
+        print(f"Анимации отсутствуют до первого показа: {not_created_before_show}")
         print(f"Скроллер с auto_hide=True имеет анимации: {has_animations_true}")
         print(f"Скроллер с auto_hide=False имеет анимации: {has_animations_false}")
         
-        return has_animations_true and not has_animations_false
+        return not_created_before_show and has_animations_true and not has_animations_false
+    
+    def _measure_construction(self, num_bars, eager):
+        """Создает num_bars скроллбаров и возвращает время создания и прирост объектов"""
+        gc.collect()
+        qobjects_before = sum(1 for obj in gc.get_objects() if isinstance(obj, QObject))
+        animations_before = sum(1 for obj in gc.get_objects()
+                                if isinstance(obj, (ScrollBarOpacityAnimation, ScrollBarDelayTimer)))
+        
+        start = time.perf_counter()
+        scrollbars = []
+        for _ in range(num_bars):
+            scrollbar = VerticalScrollBar(auto_hide=True)
+            if eager:
+                # Прежнее поведение: анимации создаются вместе со скроллбаром
+                scrollbar.animation_manager._ensureAnimations()
+            scrollbars.append(scrollbar)
+        elapsed = time.perf_counter() - start
+        
+        gc.collect()
+        qobjects = sum(1 for obj in gc.get_objects() if isinstance(obj, QObject)) - qobjects_before
+        animations = sum(1 for obj in gc.get_objects()
+                         if isinstance(obj, (ScrollBarOpacityAnimation, ScrollBarDelayTimer))) - animations_before
+        
+        for scrollbar in scrollbars:
+            scrollbar.deleteLater()
+        self.app.processEvents()
+        return elapsed, qobjects, animations
+    
+    def test_construction_cost(self, num_bars=1000):
+        """Сравнивает стоимость создания скроллбаров с ленивыми и сразу созданными анимациями"""
+        print(f"\nТестирование стоимости создания {num_bars} скроллбаров...")
+        
+        lazy_time, lazy_qobjects, lazy_animations = self._measure_construction(num_bars, eager=False)
+        eager_time, eager_qobjects, eager_animations = self._measure_construction(num_bars, eager=True)
+        
+        print(f"Ленивое создание: {lazy_time * 1000:.1f} мс, QObject: {lazy_qobjects}, "
+              f"объектов анимации: {lazy_animations}")
+        print(f"Создание сразу:   {eager_time * 1000:.1f} мс, QObject: {eager_qobjects}, "
+              f"объектов анимации: {eager_animations}")
+        
+        # Без первого показа скроллбары не создают ни анимаций, ни дополнительных QObject
+        return lazy_animations == 0 and lazy_qobjects <= num_bars and eager_animations == 3 * num_bars
+    
+    def _run_fade(self, opacity_levels, num_bars=50, duration=1000, frame_interval=16):
+        """Прогоняет кадры затухания для набора видимых скроллбаров и возвращает число перерисовок"""
+        window = QWidget()
+        window.resize(num_bars * 10, 400)
+        scrollbars = []
+        for i in range(num_bars):
+            scrollbar = VerticalScrollBar(auto_hide=False, opacity_levels=opacity_levels)
+            scrollbar.setParent(window)
+            scrollbar.setGeometry(i * 10, 0, 8, 400)
+            scrollbar.setRange(0, 1000)
+            scrollbar.setPageStep(100)
+            scrollbars.append(scrollbar)
+        window.show()
+        self.app.processEvents()
+        
+        base_paints = sum(s.getCacheStats()["paints"] for s in scrollbars)
+        
+        # Кадры анимации скрытия с той же кривой, что и у менеджера анимаций
+        curve = QEasingCurve(QEasingCurve.Type.InCubic)
+        for elapsed in range(0, duration + frame_interval, frame_interval):
+            progress = min(1.0, elapsed / duration)
+            opacity = 1.0 - curve.valueForProgress(progress)
+            for scrollbar in scrollbars:
+                scrollbar.setOpacity(opacity)
+            self.app.processEvents()
+        
+        paints = sum(s.getCacheStats()["paints"] for s in scrollbars) - base_paints
+        skipped = sum(s.getCacheStats()["skipped_opacity_repaints"] for s in scrollbars)
+        window.close()
+        return paints, skipped
+    
+    def test_opacity_quantization(self, levels=16):
+        """Проверяет, что квантование прозрачности сокращает число перерисовок при затухании"""
+        print("\nТестирование квантования прозрачности при затухании...")
+        
+        plain_paints, _ = self._run_fade(0)
+        quantized_paints, skipped = self._run_fade(levels)
+        
+        print(f"Перерисовок без квантования: {plain_paints}")
+        print(f"Перерисовок с {levels} уровнями: {quantized_paints} (пропущено кадров: {skipped})")
+        
+        # Каждый скроллбар перерисовывается не чаще одного раза на уровень
+        return quantized_paints <= 50 * (levels + 1) and quantized_paints < plain_paints
+
+    
+    def test_shared_animation_engine(self, num_bars=50, duration=300):
+        """Проверяет, что анимации всех скроллбаров продвигаются одним таймером за кадр"""
+        print("\nТестирование общего движка анимаций...")
+        
+        window = QWidget()
+        window.resize(num_bars * 10, 400)
+        scrollbars = []
+        for i in range(num_bars):
+            scrollbar = VerticalScrollBar(auto_hide=True, show_duration=duration)
+            scrollbar.setParent(window)
+            scrollbar.setGeometry(i * 10, 0, 8, 400)
+            scrollbars.append(scrollbar)
+        window.show()
+        self.app.processEvents()
+        
+        engine = ScrollBarAnimationEngine.instance()
+        engine.resetStats()
+        active_before = engine.activeAnimationCount()
+        
+        for scrollbar in scrollbars:
+            scrollbar.animation_manager.start_show_animation()
+        active = engine.activeAnimationCount() - active_before
+        
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.start(duration + 100)
+        while timer.isActive():
+            self.app.processEvents()
+        
+        stats = engine.getStats()
+        window.close()
+        
+        print(f"Активных анимаций после запуска: {active}")
+        print(f"Кадров движка: {stats['frames']}, средняя стоимость кадра: {stats['avg_frame_us']:.1f} мкс, "
+              f"максимальная: {stats['max_frame_us']:.1f} мкс")
+        
+        all_shown = all(scrollbar.opacity == 1.0 for scrollbar in scrollbars)
+        # Число кадров определяется длительностью анимации, а не количеством скроллбаров
+        return (active == num_bars and all_shown and stats["active_animations"] == 0
+                and 0 < stats["frames"] <= duration // ScrollBarAnimationEngine.FRAME_INTERVAL + 5)
 
 
 if __name__ == "__main__":
@@ -262,11 +402,17 @@ if __name__ == "__main__":
     lazy_init_result = tester.test_lazy_animation_init()
     performance_result = tester.test_animation_performance()
     lazy_impl_result = tester.test_lazy_init_implementation()
+    quantization_result = tester.test_opacity_quantization()
+    engine_result = tester.test_shared_animation_engine()
+    construction_result = tester.test_construction_cost()
     
     print("\nИтоговые результаты тестов:")
     print(f"Ленивая инициализация анимаций: {'[УСПЕХ]' if lazy_init_result else '[НЕУДАЧА]'}")
     print(f"Анимации работают корректно: {'[УСПЕХ]' if performance_result else '[НЕУДАЧА]'}")
     print(f"Реализация ленивой инициализации: {'[УСПЕХ]' if lazy_impl_result else '[НЕУДАЧА]'}")
-    print(f"Общий результат: {'[УСПЕХ]' if all([lazy_init_result, performance_result, lazy_impl_result]) else '[НЕУДАЧА]'}")
+    print(f"Квантование прозрачности: {'[УСПЕХ]' if quantization_result else '[НЕУДАЧА]'}")
+    print(f"Общий движок анимаций: {'[УСПЕХ]' if engine_result else '[НЕУДАЧА]'}")
+    print(f"Стоимость создания скроллбаров: {'[УСПЕХ]' if construction_result else '[НЕУДАЧА]'}")
+    print(f"Общий результат: {'[УСПЕХ]' if all([lazy_init_result, performance_result, lazy_impl_result, quantization_result, engine_result, construction_result]) else '[НЕУДАЧА]'}")
     
     sys.exit(0) 
\ No newline at end of file
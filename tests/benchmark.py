@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Набор бенчмарков скроллбаров для запуска без дисплея (QT_QPA_PLATFORM=offscreen).
+
+Каждый сценарий выполняет одну операцию на итерацию (расчет ползунка, перерисовка,
+кадр прокрутки), время каждой итерации измеряется через perf_counter_ns. После
+прогрева собираются повторы и вычисляются медиана, p95 и p99. Случайные
+последовательности значений строятся от фиксированного начального значения,
+поэтому все запуски выполняют одинаковую работу.
+
+Примеры:
+    python benchmark.py --output results.json
+    python benchmark.py --baseline results.json --threshold 15
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import platform
+import argparse
+import statistics
+
+# Бенчмарки рассчитаны на запуск без дисплея
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QWidget, QLabel
+from PyQt6.QtCore import Qt, QPoint, QPointF, QT_VERSION_STR, PYQT_VERSION_STR
+from PyQt6.QtGui import QWheelEvent, QInputDevice, QPointingDevice
+
+# Добавляем родительский каталог в путь для импорта
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+sys.path.insert(0, current_dir)
+
+from transparent_scroller import VerticalScrollBar, OverlayScrollArea, VirtualOverlayScrollArea
+from performance_test import RawScrollBar, PixmapOptimizedScrollBar
+from real_world_test import TestWindow
+
+# Начальное значение генератора случайных чисел
+RANDOM_SEED = 42
+# Количество итераций прогрева по умолчанию
+DEFAULT_WARMUP = 50
+# Количество измеряемых итераций по умолчанию
+DEFAULT_REPEAT = 500
+# Допустимое ухудшение относительно базового результата (%)
+DEFAULT_THRESHOLD = 10.0
+# Версия формата JSON с результатами
+RESULTS_FORMAT = 1
+
+# Зарегистрированные сценарии: имя -> (описание, функция подготовки)
+BENCHMARKS = {}
+
+
+def benchmark(name, description):
+    """Регистрирует сценарий
+
+    Функция подготовки получает генератор случайных чисел и число итераций и
+    возвращает пару (операция, завершение). Операция принимает номер итерации.
+    """
+    def register(setup):
+        BENCHMARKS[name] = (description, setup)
+        return setup
+    return register
+
+
+def _show_scrollbar(scrollbar):
+    """Размещает скроллбар в окне и показывает его"""
+    window = QWidget()
+    window.resize(50, 450)
+    scrollbar.setParent(window)
+    scrollbar.setGeometry(0, 0, 20, 400)
+    scrollbar.setRange(0, 1000)
+    scrollbar.setPageStep(100)
+    window.show()
+    QApplication.processEvents()
+    return window
+
+
+@benchmark("slider_rect", "Изменение значения и расчет прямоугольника ползунка")
+def _setup_slider_rect(rng, iterations):
+    scrollbar = VerticalScrollBar(auto_hide=False)
+    scrollbar.resize(20, 400)
+    scrollbar.setRange(0, 1000)
+    scrollbar.setPageStep(100)
+    values = [rng.randint(0, 1000) for _ in range(iterations)]
+
+    def operation(i):
+        scrollbar.setValue(values[i])
+        scrollbar._calculateSliderRect()
+
+    return operation, scrollbar.deleteLater
+
+
+def _setup_paint(scrollbar, rng, iterations):
+    """Перерисовка скроллбара после изменения значения"""
+    window = _show_scrollbar(scrollbar)
+    values = [rng.randint(0, 1000) for _ in range(iterations)]
+
+    def operation(i):
+        scrollbar.setValue(values[i])
+        scrollbar.repaint()
+
+    return operation, window.close
+
+
+@benchmark("paint_raw", "Перерисовка скроллбара без оптимизаций")
+def _setup_paint_raw(rng, iterations):
+    return _setup_paint(RawScrollBar(Qt.Orientation.Vertical), rng, iterations)
+
+
+@benchmark("paint_pixmap", "Перерисовка скроллбара только с кэшем QPixmap")
+def _setup_paint_pixmap(rng, iterations):
+    return _setup_paint(PixmapOptimizedScrollBar(Qt.Orientation.Vertical), rng, iterations)
+
+
+@benchmark("paint_full", "Перерисовка VerticalScrollBar")
+def _setup_paint_full(rng, iterations):
+    return _setup_paint(VerticalScrollBar(auto_hide=False), rng, iterations)
+
+
+def _setup_window_scroll(use_custom_scrollbars, rng, iterations):
+    """Кадр прокрутки окна с визуально богатыми виджетами"""
+    window = TestWindow(use_custom_scrollbars=use_custom_scrollbars)
+    window.show()
+    QApplication.processEvents()
+    scrollbar = window.scroll_area.verticalScrollBar()
+    values = [rng.randint(scrollbar.minimum(), scrollbar.maximum()) for _ in range(iterations)]
+
+    def operation(i):
+        scrollbar.setValue(values[i])
+        QApplication.processEvents()
+
+    return operation, window.close
+
+
+@benchmark("qt_scroll_frame", "Кадр прокрутки QScrollArea со стандартными скроллбарами")
+def _setup_qt_scroll_frame(rng, iterations):
+    return _setup_window_scroll(False, rng, iterations)
+
+
+@benchmark("overlay_scroll_frame", "Кадр прокрутки OverlayScrollArea")
+def _setup_overlay_scroll_frame(rng, iterations):
+    return _setup_window_scroll(True, rng, iterations)
+
+
+@benchmark("virtual_scroll_frame", "Кадр прокрутки VirtualOverlayScrollArea на миллион строк")
+def _setup_virtual_scroll_frame(rng, iterations):
+    area = VirtualOverlayScrollArea(1000000, QLabel, lambda label, index: label.setText(str(index)),
+                                    row_height=24)
+    area.resize(400, 600)
+    area.show()
+    QApplication.processEvents()
+    maximum = area._v_scroll.logicalMaximum()
+    offsets = [rng.randint(0, maximum) for _ in range(iterations)]
+
+    def operation(i):
+        area.setScrollOffset(offsets[i])
+        QApplication.processEvents()
+
+    return operation, area.close
+
+
+@benchmark("pixel_wheel_event", "Обработка события тачпада с pixelDelta")
+def _setup_pixel_wheel_event(rng, iterations):
+    content = QWidget()
+    content.setMinimumSize(300, 100000)
+    area = OverlayScrollArea(content)
+    area.resize(300, 400)
+    area.show()
+    QApplication.processEvents()
+    viewport = area.viewport()
+    deltas = [rng.choice((-3, -2, -1, 1, 2, 3)) for _ in range(iterations)]
+    # pixelDelta учитывается только для устройств с точной прокруткой
+    touchpad = QPointingDevice("touchpad", 1, QInputDevice.DeviceType.TouchPad, QPointingDevice.PointerType.Finger,
+                               QInputDevice.Capability.Position | QInputDevice.Capability.Scroll
+                               | QInputDevice.Capability.PixelScroll, 5, 0)
+
+    def operation(i):
+        event = QWheelEvent(QPointF(50, 50), QPointF(50, 50), QPoint(0, deltas[i]), QPoint(0, deltas[i] * 4),
+                            Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier,
+                            Qt.ScrollPhase.ScrollUpdate, False,
+                            Qt.MouseEventSource.MouseEventNotSynthesized, touchpad)
+        QApplication.sendEvent(viewport, event)
+
+    return operation, area.close
+
+
+def percentile(sorted_samples, fraction):
+    """Возвращает перцентиль отсортированной выборки с линейной интерполяцией"""
+    if not sorted_samples:
+        return 0
+    position = (len(sorted_samples) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_samples[lower]
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (position - lower)
+
+
+def summarize(samples):
+    """Вычисляет статистику выборки времени итераций (нс)"""
+    ordered = sorted(samples)
+    return {
+        "samples": len(ordered),
+        "min_ns": ordered[0],
+        "max_ns": ordered[-1],
+        "mean_ns": statistics.fmean(ordered),
+        "stdev_ns": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "median_ns": statistics.median(ordered),
+        "p95_ns": percentile(ordered, 0.95),
+        "p99_ns": percentile(ordered, 0.99)
+    }
+
+
+def run_benchmark(name, warmup, repeat, seed):
+    """Выполняет один сценарий и возвращает статистику"""
+    description, setup = BENCHMARKS[name]
+    rng = random.Random(f"{seed}:{name}")
+    operation, teardown = setup(rng, warmup + repeat)
+
+    for i in range(warmup):
+        operation(i)
+
+    samples = []
+    clock = time.perf_counter_ns
+    for i in range(warmup, warmup + repeat):
+        start = clock()
+        operation(i)
+        samples.append(clock() - start)
+
+    teardown()
+    QApplication.processEvents()
+
+    result = summarize(samples)
+    result["description"] = description
+    return result
+
+
+def run_benchmarks(names, warmup=DEFAULT_WARMUP, repeat=DEFAULT_REPEAT, seed=RANDOM_SEED):
+    """Выполняет выбранные сценарии и возвращает результаты в формате JSON"""
+    results = {}
+    for name in names:
+        results[name] = run_benchmark(name, warmup, repeat, seed)
+        print_result(name, results[name])
+
+    return {
+        "format": RESULTS_FORMAT,
+        "environment": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "pyqt": PYQT_VERSION_STR,
+            "platform": platform.platform(),
+            "qpa_platform": QApplication.platformName()
+        },
+        "settings": {"warmup": warmup, "repeat": repeat, "seed": seed},
+        "benchmarks": results
+    }
+
+
+def print_result(name, result):
+    """Выводит строку таблицы результатов (мкс)"""
+    print(f"{name:<24} {result['median_ns'] / 1000:>10.1f} {result['p95_ns'] / 1000:>10.1f} "
+          f"{result['p99_ns'] / 1000:>10.1f}   {result['description']}")
+
+
+def compare_with_baseline(current, baseline, threshold, metric="median_ns"):
+    """Сравнивает результаты с базовыми
+
+    Возвращает список регрессий: сценарии, у которых metric вырос больше
+    чем на threshold процентов.
+    """
+    regressions = []
+    print(f"\nСравнение с базовыми результатами ({metric}, порог {threshold:.1f}%):")
+    for name, result in current["benchmarks"].items():
+        base = baseline.get("benchmarks", {}).get(name)
+        if base is None or base.get(metric, 0) <= 0:
+            print(f"{name:<24} нет базового результата")
+            continue
+
+        change = (result[metric] - base[metric]) / base[metric] * 100
+        regression = change > threshold
+        status = "[РЕГРЕССИЯ]" if regression else "[OK]"
+        print(f"{name:<24} {base[metric] / 1000:>10.1f} -> {result[metric] / 1000:>10.1f} мкс "
+              f"({'+' if change > 0 else ''}{change:.1f}%) {status}")
+        if regression:
+            regressions.append((name, change))
+    return regressions
+
+
+def main(argv=None):
+    """Запускает бенчмарки; возвращает 1 при регрессии относительно базовых результатов"""
+    parser = argparse.ArgumentParser(description="Бенчмарки прозрачных скроллбаров")
+    parser.add_argument("--output", help="Файл для записи результатов в формате JSON")
+    parser.add_argument("--baseline", help="Файл с базовыми результатами для сравнения")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Допустимое ухудшение относительно базы, %% (по умолчанию %(default)s)")
+    parser.add_argument("--metric", default="median_ns", choices=["median_ns", "p95_ns", "p99_ns"],
+                        help="Показатель для сравнения с базой (по умолчанию %(default)s)")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="Итераций прогрева")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Измеряемых итераций")
+    parser.add_argument("--seed", type=int, default=RANDOM_SEED, help="Начальное значение генератора")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Запустить только эти сценарии")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    print(f"Бенчмарки скроллбаров: прогрев {args.warmup}, повторов {args.repeat}, seed {args.seed}")
+    print(f"{'Сценарий':<24} {'медиана':>10} {'p95':>10} {'p99':>10}   (мкс)")
+    names = args.only or list(BENCHMARKS)
+    current = run_benchmarks(names, args.warmup, args.repeat, args.seed)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(current, file, ensure_ascii=False, indent=2)
+        print(f"\nРезультаты записаны в {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare_with_baseline(current, baseline, args.threshold, args.metric)
+        if regressions:
+            print(f"\nРегрессий: {len(regressions)} [НЕУДАЧА]")
+            return 1
+        print("\nРегрессий нет [УСПЕХ]")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Тест отложенного отслеживания при перетаскивании ползунка OverlayScrollArea.
+
+Перетаскивание с частотой движений мыши 1000 Гц сравнивается для прежнего
+режима (прокрутка содержимого на каждое движение), ограниченной частоты
+прокрутки и прокрутки только при отпускании кнопки.
+"""
+
+import sys
+import os
+import time
+import unittest
+from PyQt6.QtWidgets import QApplication, QWidget, QStyle, QStyleOptionSlider
+from PyQt6.QtCore import Qt, QEvent, QPoint, QPointF
+
+# Добавляем родительский каталог в путь для импорта
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from transparent_scroller import OverlayScrollArea, VirtualOverlayScrollArea
+from PyQt6.QtGui import QMouseEvent, QWheelEvent
+
+# Количество движений мыши при перетаскивании
+NUM_DRAG_MOVES = 300
+# Частота движений мыши (Гц)
+MOVE_RATE = 1000
+# Интервал прокрутки содержимого в режиме ограниченной частоты (мс)
+DRAG_UPDATE_INTERVAL = 50
+
+
+class HeavyContent(QWidget):
+    """Содержимое, которое считает перемещения при прокрутке"""
+
+    def __init__(self):
+        super().__init__()
+        self.moves = 0
+        self.setMinimumSize(300, 50000)
+
+    def moveEvent(self, event):
+        self.moves += 1
+        super().moveEvent(event)
+
+
+def send_mouse(widget, event_type, y, buttons=Qt.MouseButton.LeftButton):
+    """Отправляет скроллбару событие мыши в точке (центр по ширине, y)"""
+    position = QPointF(widget.width() / 2, y)
+    button = Qt.MouseButton.NoButton if event_type == QEvent.Type.MouseMove else Qt.MouseButton.LeftButton
+    event = QMouseEvent(event_type, position, widget.mapToGlobal(position), button, buttons,
+                        Qt.KeyboardModifier.NoModifier)
+    QApplication.sendEvent(widget, event)
+
+
+def style_slider_top(scroll_bar):
+    """Возвращает координату, на которой стиль распознает нажатие на ползунок"""
+    option = QStyleOptionSlider()
+    scroll_bar.initStyleOption(option)
+    rect = scroll_bar.style().subControlRect(QStyle.ComplexControl.CC_ScrollBar, option,
+                                             QStyle.SubControl.SC_ScrollBarSlider, scroll_bar)
+    return rect.center().y()
+
+
+def drag_handle(scroll_bar, distance):
+    """Перетаскивает ползунок на distance пикселей с частотой MOVE_RATE
+
+    Возвращает значение содержимого перед отпусканием кнопки.
+    """
+    start_y = style_slider_top(scroll_bar)
+    send_mouse(scroll_bar, QEvent.Type.MouseButtonPress, start_y)
+
+    start = time.perf_counter()
+    for i in range(NUM_DRAG_MOVES):
+        send_mouse(scroll_bar, QEvent.Type.MouseMove, start_y + distance * (i + 1) / NUM_DRAG_MOVES)
+        while time.perf_counter() - start < (i + 1) / MOVE_RATE:
+            QApplication.processEvents()
+    return start_y + distance
+
+
+class DeferredDragTest(unittest.TestCase):
+    """Тесты отложенного отслеживания"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def _create_area(self, **kwargs):
+        content = HeavyContent()
+        area = OverlayScrollArea(content, **kwargs)
+        area.resize(300, 400)
+        area.show()
+        self.app.processEvents()
+        content.moves = 0
+        return area, content
+
+    def _run_drag(self, **kwargs):
+        area, content = self._create_area(**kwargs)
+        scroll_bar = area._v_scroll
+        end_y = drag_handle(scroll_bar, 200)
+        position = scroll_bar.sliderPosition()
+        handle_center = scroll_bar._calculateSliderRect().center().y()
+        value_before_release = area.verticalScrollBar().value()
+        send_mouse(scroll_bar, QEvent.Type.MouseButtonRelease, end_y, Qt.MouseButton.NoButton)
+        self.app.processEvents()
+
+        result = {
+            "stats": area.getDragStats(),
+            "moves": content.moves,
+            "position": position,
+            "handle_center": handle_center,
+            "value_before_release": value_before_release,
+            "final_value": area.verticalScrollBar().value()
+        }
+        area.close()
+        return result
+
+    def test_deferred_drag_caps_content_scrolls(self):
+        """Содержимое прокручивается с ограниченной частотой, а ползунок следует за мышью"""
+        immediate = self._run_drag()
+        capped = self._run_drag(deferred_drag=True, drag_update_interval=DRAG_UPDATE_INTERVAL)
+        on_release = self._run_drag(deferred_drag=True, drag_update_interval=0)
+
+        print(f"\nДвижений мыши при перетаскивании: {immediate['stats']['drag_moves']}")
+        for name, result in (("Каждое движение", immediate),
+                             (f"Не чаще раза в {DRAG_UPDATE_INTERVAL} мс", capped),
+                             ("При отпускании", on_release)):
+            stats = result["stats"]
+            print(f"{name}: {stats['content_scrolls']} прокруток содержимого, "
+                  f"{stats['content_scrolls_per_second']:.0f} в секунду, "
+                  f"сдвигов виджета: {result['moves']}")
+
+        # Итоговое положение одинаково во всех режимах
+        self.assertGreater(immediate["final_value"], 0)
+        self.assertEqual(capped["final_value"], immediate["final_value"])
+        self.assertEqual(on_release["final_value"], immediate["final_value"])
+
+        # Ограниченная частота: не больше одной прокрутки за интервал (плюс итоговая)
+        drag_ms = capped["stats"]["drag_time"] * 1000
+        self.assertLessEqual(capped["stats"]["content_scrolls"], drag_ms / DRAG_UPDATE_INTERVAL + 2)
+        self.assertLess(capped["stats"]["content_scrolls"] * 5, immediate["stats"]["content_scrolls"])
+
+        # Только при отпускании: до отпускания содержимое не прокручивалось
+        self.assertEqual(on_release["value_before_release"], 0)
+        self.assertEqual(on_release["stats"]["content_scrolls"], 1)
+
+    def test_handle_follows_mouse_without_scrolling(self):
+        """Ползунок рисуется по положению мыши, пока значение не изменилось"""
+        immediate = self._run_drag()
+        on_release = self._run_drag(deferred_drag=True, drag_update_interval=0)
+        self.assertEqual(on_release["position"], immediate["position"])
+        self.assertEqual(on_release["handle_center"], immediate["handle_center"])
+
+    def test_content_scrolls_count_only_drag(self):
+        """Прокрутка колесиком и синхронизация скроллбаров не учитываются как прокрутки при перетаскивании"""
+        area, content = self._create_area(deferred_drag=True, drag_update_interval=DRAG_UPDATE_INTERVAL)
+        area.resetDragStats()
+        for _ in range(5):
+            event = QWheelEvent(QPointF(50, 50), QPointF(50, 50), QPoint(0, 0), QPoint(0, -120),
+                                Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier,
+                                Qt.ScrollPhase.NoScrollPhase, False)
+            QApplication.sendEvent(area.viewport(), event)
+        area.verticalScrollBar().setValue(1000)
+        area._updateScrollBars()
+        self.app.processEvents()
+        self.assertGreater(content.moves, 0)
+        self.assertEqual(area.getDragStats()["content_scrolls"], 0)
+
+        # Нажатие и отпускание без движения не сдвигает содержимое
+        scroll_bar = area._v_scroll
+        y = style_slider_top(scroll_bar)
+        send_mouse(scroll_bar, QEvent.Type.MouseButtonPress, y)
+        send_mouse(scroll_bar, QEvent.Type.MouseButtonRelease, y, Qt.MouseButton.NoButton)
+        self.app.processEvents()
+        self.assertEqual(area.getDragStats()["content_scrolls"], 0)
+        area.close()
+
+    def test_drag_tooltip(self):
+        """Подсказка с положением показывается во время перетаскивания"""
+        area, _ = self._create_area(deferred_drag=True, drag_tooltip=True)
+        scroll_bar = area._v_scroll
+        text = area._dragTooltipText(scroll_bar, scroll_bar.maximum() // 2)
+        self.assertEqual(text, "50%")
+        end_y = drag_handle(scroll_bar, 50)
+        send_mouse(scroll_bar, QEvent.Type.MouseButtonRelease, end_y, Qt.MouseButton.NoButton)
+        self.assertGreater(area.verticalScrollBar().value(), 0)
+        area.close()
+
+    def test_virtual_area_deferred_drag(self):
+        """Виртуальная область обновляет строки с ограниченной частотой"""
+        area = VirtualOverlayScrollArea(1000000, QWidget, lambda widget, index: None, row_height=20,
+                                        deferred_drag=True, drag_update_interval=DRAG_UPDATE_INTERVAL)
+        area.resize(300, 400)
+        area.show()
+        self.app.processEvents()
+        area.resetDragStats()
+        area.resetVirtualStats()
+
+        scroll_bar = area._v_scroll
+        end_y = drag_handle(scroll_bar, 100)
+        send_mouse(scroll_bar, QEvent.Type.MouseButtonRelease, end_y, Qt.MouseButton.NoButton)
+        self.app.processEvents()
+
+        stats = area.getDragStats()
+        self.assertGreater(area.scrollOffset(), 0)
+        self.assertLess(stats["content_scrolls"] * 5, stats["drag_moves"])
+        self.assertLessEqual(area.getVirtualStats()["layout_passes"], stats["content_scrolls"] + 1)
+        area.close()
+
+
+if __name__ == "__main__":
+    result = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if result.wasSuccessful() else 1)
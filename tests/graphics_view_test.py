@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Тест скроллбаров QGraphicsView на большой сцене.
+"""
+
+import sys
+import os
+import time
+import unittest
+from PyQt6.QtWidgets import QApplication, QGraphicsView, QGraphicsScene
+from PyQt6.QtCore import Qt, QEvent, QPointF
+from PyQt6.QtGui import QMouseEvent
+
+# Добавляем родительский каталог в путь для импорта
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from graphics_view_scroller import (
+    apply_scrollbars_to_graphics_view,
+    GraphicsViewVerticalScrollBar,
+    GraphicsViewHorizontalScrollBar,
+    GraphicsViewScrollManager,
+)
+
+# Количество элементов на сцене (без явного sceneRect)
+NUM_ITEMS = 20000
+# Количество синтетических движений мыши
+NUM_MOUSE_MOVES = 1000
+# Количество шагов сеанса панорамирования и масштабирования
+NUM_PAN_ZOOM_STEPS = 200
+
+
+def send_mouse_moves(widget, count):
+    """Отправляет виджету заданное количество событий движения мыши"""
+    for i in range(count):
+        position = QPointF(10 + i % 100, 10 + i % 50)
+        event = QMouseEvent(QEvent.Type.MouseMove, position, widget.mapToGlobal(position),
+                            Qt.MouseButton.NoButton, Qt.MouseButton.NoButton,
+                            Qt.KeyboardModifier.NoModifier)
+        QApplication.sendEvent(widget, event)
+
+
+class GraphicsViewVisibilityTest(unittest.TestCase):
+    """Тесты кэширования необходимости скроллбаров QGraphicsView"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.scene = QGraphicsScene()
+        for i in range(NUM_ITEMS):
+            self.scene.addRect((i % 200) * 12, (i // 200) * 12, 10, 10)
+        self.view = QGraphicsView(self.scene)
+        self.view.resize(400, 300)
+        # Отслеживание мыши, как при элементах с hover-эффектами
+        self.view.viewport().setMouseTracking(True)
+        self.vsb, self.hsb = apply_scrollbars_to_graphics_view(self.view, auto_hide=True)
+        self.view.show()
+        self.app.processEvents()
+
+    def tearDown(self):
+        self.view.close()
+        self.app.processEvents()
+
+    def _scene_queries(self):
+        return (self.vsb.get_visibility_stats()["scene_queries"] +
+                self.hsb.get_visibility_stats()["scene_queries"])
+
+    def test_mouse_moves_do_not_query_scene(self):
+        """Движения мыши над viewport не обращаются к sceneRect"""
+        self.vsb.reset_visibility_stats()
+        self.hsb.reset_visibility_stats()
+
+        start = time.perf_counter()
+        send_mouse_moves(self.view.viewport(), NUM_MOUSE_MOVES)
+        elapsed = time.perf_counter() - start
+
+        checks = self.vsb.get_visibility_stats()["visibility_checks"]
+        print(f"\nДвижений мыши: {NUM_MOUSE_MOVES}, проверок видимости: {checks}, "
+              f"запросов к сцене: {self._scene_queries()}, "
+              f"{elapsed / NUM_MOUSE_MOVES * 1e6:.1f} мкс на движение")
+        self.assertGreater(self.vsb.get_hover_stats()["mouse_moves"], 0)
+        self.assertEqual(self._scene_queries(), 0)
+        self.assertTrue(self.vsb.isVisible())
+
+    def test_scene_rect_change_updates_visibility(self):
+        """Изменение границ сцены пересчитывает необходимость скроллбара"""
+        small_scene = QGraphicsScene()
+        small_scene.addRect(0, 0, 100, 100)
+        self.view.setScene(small_scene)
+        self.app.processEvents()
+        self.assertFalse(self.vsb.isVisible())
+
+        self.vsb.reset_visibility_stats()
+        small_scene.addRect(0, 0, 100, 5000)
+        self.app.processEvents()
+        self.assertTrue(self.vsb.isVisible())
+        self.assertGreater(self.vsb.get_visibility_stats()["scene_queries"], 0)
+
+    def test_transform_change_updates_visibility(self):
+        """Изменение масштаба пересчитывает необходимость скроллбара"""
+        self.assertTrue(self.vsb.isVisible())
+        self.vsb.reset_visibility_stats()
+        self.view.scale(0.01, 0.01)
+        self.app.processEvents()
+        self.assertFalse(self.vsb.isVisible())
+        self.assertEqual(self.vsb.get_visibility_stats()["scene_queries"], 1)
+
+    def test_viewport_resize_updates_visibility(self):
+        """Изменение размера viewport пересчитывает необходимость скроллбара"""
+        self.view.scale(0.5, 0.5)
+        self.app.processEvents()
+        self.assertTrue(self.vsb.isVisible())
+
+        self.view.resize(400, 1000)
+        self.app.processEvents()
+        self.assertFalse(self.vsb.isVisible())
+
+    def test_high_rate_mouse_moves(self):
+        """Движения мыши с частотой 1000 Гц выполняют показ только при смене состояния"""
+        viewport = self.view.viewport()
+        send_mouse_moves(viewport, 1)
+        self.vsb.reset_hover_stats()
+
+        # 1000 движений с интервалом 1 мс
+        start = time.perf_counter()
+        for i in range(NUM_MOUSE_MOVES):
+            send_mouse_moves(viewport, 1)
+            # Курсор ушел на скроллбар и вернулся: запланировано скрытие
+            if i == NUM_MOUSE_MOVES // 2:
+                self.vsb.start_hide_timer()
+            while time.perf_counter() - start < (i + 1) / 1000:
+                self.app.processEvents()
+        stats = self.vsb.get_hover_stats()
+
+        # Прежний путь: полный показ на каждое движение
+        direct_start = time.perf_counter()
+        for _ in range(NUM_MOUSE_MOVES):
+            self.vsb.show_scrollbar()
+            self.hsb.show_scrollbar()
+        direct_elapsed = time.perf_counter() - direct_start
+
+        filtered_start = time.perf_counter()
+        for _ in range(NUM_MOUSE_MOVES):
+            self.vsb.handle_hover_move()
+            self.hsb.handle_hover_move()
+        filtered_elapsed = time.perf_counter() - filtered_start
+
+        print(f"\nДвижений мыши: {stats['mouse_moves']}, показов: {stats['hover_actions']}")
+        print(f"Показ на каждое движение: {direct_elapsed / NUM_MOUSE_MOVES * 1e6:.1f} мкс, "
+              f"обработка движения с фильтрацией: {filtered_elapsed / NUM_MOUSE_MOVES * 1e6:.1f} мкс")
+        self.assertGreaterEqual(stats["mouse_moves"], NUM_MOUSE_MOVES)
+        # Показ при первом движении и отмена запланированного скрытия
+        self.assertLessEqual(stats["hover_actions"], 2)
+        self.assertFalse(self.vsb._hide_timer.isActive())
+
+    def test_resize_events_coalesce_into_one_pass(self):
+        """Серия изменений размера приводит к одному проходу геометрии на кадр"""
+        manager = self.view._scroll_manager
+        manager.resetGeometryStats()
+
+        # Несколько изменений размера до возврата в цикл событий
+        for i in range(50):
+            self.view.resize(400 + i, 300 + i)
+        self.app.processEvents()
+
+        stats = manager.getGeometryStats()
+        self.assertGreaterEqual(stats["requests"], 50)
+        self.assertEqual(stats["scheduled"], 1)
+        self.assertEqual(stats["executed"], 1)
+
+        # Перетаскивание окна: по три изменения размера на кадр
+        manager.resetGeometryStats()
+        for frame in range(30):
+            for i in range(3):
+                self.view.resize(500 + frame * 3 + i, 400)
+            self.app.processEvents()
+
+        stats = manager.getGeometryStats()
+        print(f"\nИзменений размера: {stats['requests']}, запланировано проходов: {stats['scheduled']}, "
+              f"выполнено: {stats['executed']}")
+        self.assertEqual(stats["scheduled"], 30)
+        self.assertEqual(stats["executed"], 30)
+        viewport_rect = self.view.viewport().rect()
+        self.assertEqual(self.vsb.geometry().height(), viewport_rect.height())
+
+
+class GraphicsViewEventFilterTest(unittest.TestCase):
+    """Тест количества вызовов фильтров событий при панорамировании и масштабировании"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def _create_view(self):
+        scene = QGraphicsScene()
+        for i in range(2000):
+            scene.addRect((i % 50) * 40, (i // 50) * 40, 30, 30)
+        view = QGraphicsView(scene)
+        view.resize(400, 300)
+        view.viewport().setMouseTracking(True)
+        return view
+
+    def _run_session(self, view):
+        """Панорамирует и масштабирует view, возвращает длительность сеанса"""
+        viewport = view.viewport()
+        start = time.perf_counter()
+        for step in range(NUM_PAN_ZOOM_STEPS):
+            factor = 1.02 if (step // 50) % 2 == 0 else 1 / 1.02
+            view.scale(factor, factor)
+            view.verticalScrollBar().setValue(step * 5)
+            view.horizontalScrollBar().setValue(step * 3)
+            send_mouse_moves(viewport, 5)
+            self.app.processEvents()
+        return time.perf_counter() - start
+
+    def test_single_dispatcher_filter_calls(self):
+        """Один диспетчер на view вызывается реже, чем отдельные фильтры скроллбаров"""
+        # Прежняя схема: фильтры обоих скроллбаров и менеджера на view и viewport
+        legacy_view = self._create_view()
+        legacy_vsb = GraphicsViewVerticalScrollBar()
+        legacy_hsb = GraphicsViewHorizontalScrollBar()
+        legacy_vsb.setGraphicsView(legacy_view)
+        legacy_hsb.setGraphicsView(legacy_view)
+        legacy_manager = GraphicsViewScrollManager(legacy_view, legacy_vsb, legacy_hsb)
+        legacy_view.show()
+        self.app.processEvents()
+        legacy_manager.resetEventStats()
+        legacy_before = (legacy_vsb.get_filter_stats()["filter_calls"] +
+                         legacy_hsb.get_filter_stats()["filter_calls"])
+        legacy_time = self._run_session(legacy_view)
+        legacy_calls = (legacy_vsb.get_filter_stats()["filter_calls"] +
+                        legacy_hsb.get_filter_stats()["filter_calls"] - legacy_before +
+                        legacy_manager.getEventStats()["filter_calls"])
+        legacy_view.close()
+
+        view = self._create_view()
+        vsb, hsb = apply_scrollbars_to_graphics_view(view)
+        view.show()
+        self.app.processEvents()
+        manager = view._scroll_manager
+        manager.resetEventStats()
+        session_time = self._run_session(view)
+        stats = manager.getEventStats()
+        view.close()
+
+        print(f"\nПрежняя схема: {legacy_calls} вызовов eventFilter, "
+              f"{legacy_calls / legacy_time:.0f} в секунду")
+        print(f"Один диспетчер: {stats['filter_calls']} вызовов eventFilter, "
+              f"{stats['filter_calls'] / session_time:.0f} в секунду, "
+              f"передано скроллбарам: {stats['dispatched_events']}")
+        self.assertEqual(vsb.get_filter_stats()["filter_calls"], 0)
+        self.assertEqual(hsb.get_filter_stats()["filter_calls"], 0)
+        self.assertLessEqual(stats["filter_calls"] * 2, legacy_calls)
+
+
+if __name__ == "__main__":
+    result = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if result.wasSuccessful() else 1)
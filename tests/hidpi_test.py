@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Тест отрисовки скроллбаров на экранах с высокой плотностью пикселей.
+
+Для каждого devicePixelRatio (1, 1.5, 2) тест запускается в отдельном процессе
+на платформе offscreen с QT_SCALE_FACTOR и сравнивает стоимость отрисовки
+фрагментов в физическом разрешении с прежним пиксмапом в логическом
+разрешении, который Qt масштабирует при каждом выводе.
+"""
+
+import sys
+import os
+import json
+import math
+import time
+import subprocess
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPainter, QPixmap
+
+# Добавляем родительский каталог в путь для импорта
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from transparent_scroller import VerticalScrollBar
+
+# Проверяемые значения devicePixelRatio
+DEVICE_PIXEL_RATIOS = ["1", "1.5", "2"]
+# Количество перерисовок в замере
+NUM_PAINTS = 2000
+
+
+class LogicalPixmapScrollBar(VerticalScrollBar):
+    """Скроллбар с прежним кэшем: пиксмап размером с виджет без учета devicePixelRatio"""
+
+    def paintEvent(self, event):
+        if self._pixmap_cache is None or self._pixmap_cache_dirty:
+            pixmap = QPixmap(self.size())
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.fillRect(self.rect(), self._bg_color)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._handle_color)
+            painter.drawRoundedRect(self._calculateSliderRect(), 4, 4)
+            painter.end()
+            self._pixmap_cache = pixmap
+            self._pixmap_cache_dirty = False
+
+        painter = QPainter(self)
+        painter.setOpacity(self._opacity)
+        painter.drawPixmap(0, 0, self._pixmap_cache)
+
+
+def measure_paint_time(scrollbar_class):
+    """Возвращает среднее время одной перерисовки скроллбара (мкс)"""
+    window = QWidget()
+    window.resize(40, 820)
+    scrollbar = scrollbar_class(auto_hide=False)
+    scrollbar.setParent(window)
+    scrollbar.setGeometry(0, 0, 8, 800)
+    scrollbar.setRange(0, 1000)
+    scrollbar.setPageStep(100)
+    scrollbar.setValue(300)
+    window.show()
+    QApplication.processEvents()
+
+    # Прогрев
+    for _ in range(50):
+        scrollbar.repaint()
+
+    start = time.perf_counter_ns()
+    for _ in range(NUM_PAINTS):
+        scrollbar.repaint()
+    elapsed = time.perf_counter_ns() - start
+
+    result = {
+        "dpr": scrollbar.devicePixelRatioF(),
+        "paint_us": elapsed / NUM_PAINTS / 1000
+    }
+    if scrollbar_class is VerticalScrollBar:
+        track_pixmap = scrollbar._pixmap_cache[0]
+        result["track_pixels"] = [track_pixmap.width(), track_pixmap.height()]
+        result["expected_pixels"] = [math.ceil(8 * result["dpr"]), math.ceil(800 * result["dpr"])]
+    window.close()
+    return result
+
+
+def run_worker():
+    """Выполняет замер в текущем процессе и выводит результат в JSON"""
+    app = QApplication(sys.argv)
+    physical = measure_paint_time(VerticalScrollBar)
+    logical = measure_paint_time(LogicalPixmapScrollBar)
+    print(json.dumps({"physical": physical, "logical": logical}))
+    return 0
+
+
+def run_test():
+    """Запускает замеры для всех devicePixelRatio и сравнивает результаты"""
+    print("Тест отрисовки скроллбаров с учетом devicePixelRatio")
+    print("=" * 60)
+
+    success = True
+    for dpr in DEVICE_PIXEL_RATIOS:
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen", QT_SCALE_FACTOR=dpr)
+        process = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker"],
+            capture_output=True, text=True, env=env, check=False
+        )
+        if process.returncode != 0:
+            print(f"DPR {dpr}: ошибка запуска\n{process.stderr}")
+            success = False
+            continue
+
+        result = json.loads(process.stdout.strip().splitlines()[-1])
+        physical = result["physical"]
+        logical = result["logical"]
+        sharp = physical["track_pixels"] == physical["expected_pixels"]
+        success = success and sharp
+
+        print(f"DPR {physical['dpr']}:")
+        print(f"  Фрагменты в физическом разрешении: {physical['paint_us']:.1f} мкс на кадр, "
+              f"пиксмап {physical['track_pixels'][0]}x{physical['track_pixels'][1]}")
+        print(f"  Пиксмап в логическом разрешении:   {logical['paint_us']:.1f} мкс на кадр")
+        print(f"  Разрешение фрагментов: {'[УСПЕХ]' if sharp else '[НЕУДАЧА]'}")
+
+    print(f"\nОбщий результат: {'[УСПЕХ]' if success else '[НЕУДАЧА]'}")
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    if "--worker" in sys.argv:
+        sys.exit(run_worker())
+    sys.exit(run_test())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Тест необязательных замеров отрисовки скроллбаров.
+"""
+
+import sys
+import os
+import gc
+import time
+import unittest
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QEvent
+
+# Добавляем родительский каталог в путь для импорта
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from transparent_scroller import VerticalScrollBar, HorizontalScrollBar, ScrollBarInstrumentation
+from graphics_view_scroller import GraphicsViewVerticalScrollBar
+
+# Количество перерисовок в замере
+NUM_PAINTS = 500
+
+
+def create_scrollbar(scrollbar_class, width=8, height=400):
+    """Создает видимый скроллбар с диапазоном прокрутки"""
+    scrollbar = scrollbar_class(auto_hide=False)
+    scrollbar.resize(width, height)
+    scrollbar.setRange(0, 1000)
+    scrollbar.setPageStep(100)
+    scrollbar.show()
+    QApplication.processEvents()
+    return scrollbar
+
+
+def repaint(scrollbar, count):
+    """Перерисовывает скроллбар count раз с изменением значения"""
+    for i in range(count):
+        scrollbar.setValue(i % 900)
+        scrollbar.repaint()
+
+
+class InstrumentationTest(unittest.TestCase):
+    """Тесты замеров отрисовки"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def tearDown(self):
+        ScrollBarInstrumentation.setEnabled(False)
+
+    def test_disabled_by_default(self):
+        """По умолчанию замеры выключены и ничего не записывают"""
+        self.assertFalse(ScrollBarInstrumentation.isEnabled())
+        scrollbar = create_scrollbar(VerticalScrollBar)
+        repaint(scrollbar, 10)
+        stats = scrollbar.getPaintStats()
+        self.assertEqual(stats["paints"], 0)
+        self.assertEqual(stats["renders"], 0)
+        scrollbar.close()
+
+    def test_records_paint_time(self):
+        """При включенных замерах учитываются отрисовки, время и объем пиксмапов"""
+        ScrollBarInstrumentation.setEnabled(True)
+        for scrollbar in (create_scrollbar(VerticalScrollBar), create_scrollbar(GraphicsViewVerticalScrollBar)):
+            scrollbar.resetPaintStats() if hasattr(scrollbar, "resetPaintStats") else scrollbar.reset_paint_stats()
+            repaint(scrollbar, 20)
+            stats = scrollbar.getPaintStats() if hasattr(scrollbar, "getPaintStats") else scrollbar.get_paint_stats()
+            self.assertEqual(stats["paints"], 20)
+            self.assertGreater(stats["renders"], 0)
+            self.assertGreater(stats["total_paint_us"], 0)
+            self.assertGreaterEqual(stats["max_paint_us"], stats["avg_paint_us"])
+            self.assertGreater(stats["pixmap_bytes"], 0)
+            scrollbar.close()
+
+    def test_graphics_view_renders_only_new_tiles(self):
+        """Скроллбар QGraphicsView учитывает рендер только при смене фрагментов"""
+        ScrollBarInstrumentation.setEnabled(True)
+        scrollbar = create_scrollbar(GraphicsViewVerticalScrollBar)
+        scrollbar.reset_paint_stats()
+        repaint(scrollbar, 20)
+        stats = scrollbar.get_paint_stats()
+        self.assertEqual(stats["paints"], 20)
+        self.assertEqual(stats["renders"], 1)
+
+        # Смена цвета ползунка дает новые фрагменты
+        scrollbar.applyStyle(handle_alpha=200)
+        repaint(scrollbar, 5)
+        self.assertEqual(scrollbar.get_paint_stats()["renders"], 2)
+        scrollbar.close()
+
+    def test_aggregate_across_live_instances(self):
+        """Замеры собираются по всем живым скроллбарам одним вызовом"""
+        ScrollBarInstrumentation.setEnabled(True)
+        # Скроллбары, удаленные предыдущими тестами, не должны исчезнуть посреди замера
+        QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        gc.collect()
+        instances_before = ScrollBarInstrumentation.aggregateStats()["instances"]
+
+        scrollbars = [create_scrollbar(VerticalScrollBar) for _ in range(5)]
+        scrollbars.append(create_scrollbar(HorizontalScrollBar, 400, 8))
+        scrollbars.append(create_scrollbar(GraphicsViewVerticalScrollBar))
+        ScrollBarInstrumentation.resetStats()
+        for scrollbar in scrollbars:
+            repaint(scrollbar, 10)
+
+        stats = ScrollBarInstrumentation.aggregateStats()
+        print(f"\nСкроллбаров: {stats['instances']}, отрисовок: {stats['paints']}, "
+              f"среднее: {stats['avg_paint_us']:.1f} мкс, максимум: {stats['max_paint_us']:.1f} мкс, "
+              f"пиксмапы: {stats['pixmap_bytes']} байт (уникальных {stats['unique_pixmap_bytes']})")
+        self.assertEqual(stats["instances"], instances_before + len(scrollbars))
+        self.assertEqual(stats["paints"], 10 * len(scrollbars))
+        # Одинаковые скроллбары разделяют фрагменты общего кэша
+        self.assertLess(stats["unique_pixmap_bytes"], stats["pixmap_bytes"])
+
+        # Удаленные скроллбары не учитываются
+        for scrollbar in scrollbars:
+            scrollbar.close()
+            scrollbar.deleteLater()
+        scrollbars.clear()
+        del scrollbar
+        QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        gc.collect()
+        # Скроллбары других тестов могут удаляться тут же, поэтому проверяется только убыль
+        self.assertLessEqual(ScrollBarInstrumentation.aggregateStats()["instances"], instances_before)
+
+    def test_disabled_overhead(self):
+        """Выключенные замеры не добавляют заметной стоимости отрисовке"""
+        scrollbar = create_scrollbar(VerticalScrollBar)
+        repaint(scrollbar, 50)
+
+        timings = {}
+        for enabled in (False, True, False):
+            ScrollBarInstrumentation.setEnabled(enabled)
+            start = time.perf_counter()
+            repaint(scrollbar, NUM_PAINTS)
+            timings[enabled] = (time.perf_counter() - start) / NUM_PAINTS * 1e6
+        print(f"\nОтрисовка: без замеров {timings[False]:.1f} мкс, с замерами {timings[True]:.1f} мкс")
+        self.assertEqual(scrollbar.getPaintStats()["paints"], NUM_PAINTS)
+        scrollbar.close()
+
+
+if __name__ == "__main__":
+    result = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if result.wasSuccessful() else 1)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Тест логического диапазона скроллбара для содержимого больше предела int QScrollBar.
+"""
+
+import sys
+import os
+import unittest
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt, QPoint, QPointF
+from PyQt6.QtGui import QWheelEvent
+
+# Добавляем родительский каталог в путь для импорта
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from transparent_scroller import VerticalScrollBar
+
+# Терабайт строк по одному пикселю
+HUGE_RANGE = 10 ** 12
+# Высота видимой области (пикселей)
+PAGE_STEP = 800
+
+
+class LogicalRangeTest(unittest.TestCase):
+    """Тесты логического диапазона"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.scrollbar = VerticalScrollBar(auto_hide=False)
+        self.scrollbar.resize(8, 400)
+        self.scrollbar.setLogicalRange(0, HUGE_RANGE, PAGE_STEP)
+        self.emitted = []
+        self.scrollbar.logicalValueChanged.connect(self.emitted.append)
+
+    def test_handle_position_follows_logical_value(self):
+        """Положение ползунка вычисляется по логическому значению"""
+        top = self.scrollbar._calculateSliderRect()
+        self.scrollbar.setLogicalValue(HUGE_RANGE // 2)
+        middle = self.scrollbar._calculateSliderRect()
+        self.scrollbar.setLogicalValue(HUGE_RANGE)
+        bottom = self.scrollbar._calculateSliderRect()
+
+        self.assertEqual(top.top(), 2)
+        self.assertEqual(bottom.bottom(), self.scrollbar.height() - 3)
+        self.assertAlmostEqual(middle.center().y(), self.scrollbar.height() / 2, delta=2)
+
+    def test_logical_value_is_exact(self):
+        """Логическое значение хранится и передается без потери точности"""
+        value = HUGE_RANGE - 12345
+        self.scrollbar.setLogicalValue(value)
+        self.assertEqual(self.scrollbar.logicalValue(), value)
+        self.assertEqual(self.emitted, [value])
+
+        # Сдвиг на одну строку меньше разрешения прокси, но тоже передается
+        self.scrollbar.setLogicalValue(value + 1)
+        self.assertEqual(self.scrollbar.logicalValue(), value + 1)
+        self.assertEqual(self.emitted[-1], value + 1)
+
+    def test_logical_value_is_clamped(self):
+        """Логическое значение ограничивается диапазоном"""
+        self.scrollbar.setLogicalValue(HUGE_RANGE * 10)
+        self.assertEqual(self.scrollbar.logicalValue(), HUGE_RANGE)
+        self.scrollbar.setLogicalValue(-1)
+        self.assertEqual(self.scrollbar.logicalValue(), 0)
+
+    def test_user_scroll_maps_to_logical_value(self):
+        """Прокрутка пользователем переводится в логическую позицию"""
+        self.scrollbar.setValue(self.scrollbar.maximum() // 4)
+        self.assertEqual(self.scrollbar.logicalValue(), HUGE_RANGE // 4)
+        self.assertEqual(self.emitted, [HUGE_RANGE // 4])
+        self.assertIsInstance(self.scrollbar.logicalValue(), int)
+
+        # Шаг клавиш соответствует десятой части страницы
+        self.scrollbar.setLogicalValue(0)
+        self.scrollbar.triggerAction(self.scrollbar.SliderAction.SliderSingleStepAdd)
+        self.assertGreater(self.scrollbar.logicalValue(), 0)
+        self.assertLessEqual(self.scrollbar.logicalValue(), PAGE_STEP)
+
+    def test_wheel_scrolls_in_logical_steps(self):
+        """Колесо прокручивает на логические шаги, а не на шаг прокси"""
+        event = QWheelEvent(QPointF(4, 100), QPointF(4, 100), QPoint(0, 0), QPoint(0, -120),
+                            Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier,
+                            Qt.ScrollPhase.NoScrollPhase, False)
+        QApplication.sendEvent(self.scrollbar, event)
+        expected = QApplication.wheelScrollLines() * self.scrollbar.logicalSingleStep()
+        self.assertEqual(self.scrollbar.logicalValue(), expected)
+
+    def test_float_range(self):
+        """Логический диапазон может быть вещественным"""
+        self.scrollbar.setLogicalRange(0.0, 1e18, 1e6)
+        self.scrollbar.setLogicalValue(2.5e17)
+        rect = self.scrollbar._calculateSliderRect()
+        self.assertAlmostEqual(self.scrollbar.logicalValue(), 2.5e17)
+        self.assertGreater(rect.top(), 2)
+
+    def test_clear_logical_range(self):
+        """После отключения логического диапазона скроллбар работает как обычно"""
+        self.scrollbar.clearLogicalRange()
+        self.scrollbar.setRange(0, 1000)
+        self.scrollbar.setPageStep(100)
+        self.scrollbar.setValue(500)
+        self.assertFalse(self.scrollbar.hasLogicalRange())
+        self.assertEqual(self.scrollbar.logicalValue(), 500)
+        self.assertEqual(self.emitted, [])
+
+    def test_clear_restores_native_range(self):
+        """Отключение логического диапазона возвращает прежний диапазон и значение"""
+        scrollbar = VerticalScrollBar(auto_hide=False)
+        scrollbar.setRange(0, 500)
+        scrollbar.setPageStep(50)
+        scrollbar.setValue(120)
+        scrollbar.setLogicalRange(0, HUGE_RANGE, PAGE_STEP)
+        scrollbar.setLogicalValue(HUGE_RANGE // 10)
+        # Повторное включение не затирает сохраненный обычный диапазон
+        scrollbar.setLogicalRange(0, HUGE_RANGE * 2, PAGE_STEP)
+        scrollbar.clearLogicalRange()
+
+        self.assertEqual((scrollbar.minimum(), scrollbar.maximum()), (0, 500))
+        self.assertEqual(scrollbar.pageStep(), 50)
+        self.assertEqual(scrollbar.value(), 120)
+        self.assertEqual(scrollbar.logicalMaximum(), 500)
+
+    def test_integer_range_keeps_integer_steps(self):
+        """Шаг по умолчанию для целочисленного диапазона остается целым"""
+        huge = 10 ** 400
+        self.scrollbar.setLogicalRange(0, huge, huge // 7)
+        step = self.scrollbar.logicalSingleStep()
+        self.assertIsInstance(step, int)
+        self.assertEqual(step, huge // 7 // 10)
+
+        self.scrollbar.setLogicalRange(0, HUGE_RANGE)
+        self.assertIsInstance(self.scrollbar.logicalSingleStep(), int)
+        self.scrollbar.setLogicalRange(0.0, 1e18, 1e6)
+        self.assertEqual(self.scrollbar.logicalSingleStep(), 1e5)
+
+
+if __name__ == "__main__":
+    result = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if result.wasSuccessful() else 1)
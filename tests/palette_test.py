@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Тест общих неизменяемых палитр скроллбаров.
+"""
+
+import sys
+import os
+import gc
+import time
+import unittest
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QColor
+
+# Добавляем родительский каталог в путь для импорта
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+import transparent_scroller
+from transparent_scroller import VerticalScrollBar, ScrollBarPalette, ScrollBarPixmapCache
+import graphics_view_scroller
+from graphics_view_scroller import GraphicsViewVerticalScrollBar
+
+# Количество скроллбаров при смене темы
+NUM_SCROLLBARS = 1000
+# Количество уровней прозрачности в замере отрисовки
+OPACITY_LEVELS = 8
+
+
+class CountingColor(QColor):
+    """QColor, который считает созданные цвета
+
+    Учитываются и конструктор, и статический fromRgba (он возвращает
+    обычный QColor, минуя __init__).
+    """
+
+    created = 0
+
+    def __init__(self, *args):
+        CountingColor.created += 1
+        super().__init__(*args)
+
+    @staticmethod
+    def fromRgba(rgba):
+        CountingColor.created += 1
+        return QColor.fromRgba(rgba)
+
+
+class ScrollBarPaletteTest(unittest.TestCase):
+    """Тесты палитр"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        # Считаем цвета, создаваемые обоими модулями
+        CountingColor.created = 0
+        self._original_colors = (transparent_scroller.QColor, graphics_view_scroller.QColor)
+        transparent_scroller.QColor = CountingColor
+        graphics_view_scroller.QColor = CountingColor
+
+    def tearDown(self):
+        transparent_scroller.QColor, graphics_view_scroller.QColor = self._original_colors
+
+    def _switch_themes(self, scroll_bars, dark_value, light_value):
+        """Переключает тему всех скроллбаров туда и обратно
+
+        Возвращает число новых цветов, новых палитр и затраченное время.
+        """
+        CountingColor.created = 0
+        palettes_before = ScrollBarPalette.getStats()["created"]
+        start = time.perf_counter()
+        for value in (dark_value, light_value):
+            for scroll_bar in scroll_bars:
+                scroll_bar.setTheme(value)
+        elapsed = time.perf_counter() - start
+        palettes = ScrollBarPalette.getStats()["created"] - palettes_before
+        return CountingColor.created, palettes, elapsed
+
+    def _paint_frames(self, scroll_bar):
+        """Перерисовывает скроллбар на каждом уровне прозрачности и в каждом состоянии"""
+        for value in range(0, 1000, 100):
+            scroll_bar.setValue(value)
+            for level in range(1, OPACITY_LEVELS + 1):
+                scroll_bar.setOpacity(level / OPACITY_LEVELS)
+                scroll_bar.grab()
+        scroll_bar._mouse_over = True
+        scroll_bar.grab()
+        scroll_bar._mouse_pressed = True
+        scroll_bar.grab()
+        scroll_bar._mouse_over = scroll_bar._mouse_pressed = False
+
+    def test_theme_switch_allocates_constant_colors(self):
+        """Смена темы 1000 скроллбаров создает O(1) цветов"""
+        for count in (10, NUM_SCROLLBARS):
+            scroll_bars = [VerticalScrollBar(auto_hide=False, handle_alpha=91) for _ in range(count)]
+            created, palettes, elapsed = self._switch_themes(scroll_bars, True, False)
+            print(f"\nСкроллбаров: {count}, создано цветов при смене темы: {created}, "
+                  f"палитр: {palettes}, {elapsed / (2 * count) * 1e6:.1f} мкс на скроллбар")
+            # Не больше двух новых палитр (светлая и темная) независимо от числа
+            # скроллбаров, а значения ARGB палитры берутся без создания QColor
+            self.assertLessEqual(palettes, 2)
+            self.assertEqual(created, 0)
+
+            palette = scroll_bars[0]._palette
+            for scroll_bar in scroll_bars:
+                self.assertIs(scroll_bar._palette, palette)
+                self.assertEqual(scroll_bar._bg_color.rgba(), palette.rgba[0])
+
+        graphics_bars = [GraphicsViewVerticalScrollBar(auto_hide=False) for _ in range(NUM_SCROLLBARS)]
+        created, palettes, _ = self._switch_themes(graphics_bars, "dark", "light")
+        self.assertLessEqual(palettes, 2)
+        self.assertEqual(created, 0)
+
+    def test_counting_color_sees_from_rgba(self):
+        """Счетчик цветов учитывает и QColor.fromRgba"""
+        palette = ScrollBarPalette.get(transparent_scroller.LIGHT_THEME, 30, 80, 120, 160)
+        CountingColor.created = 0
+        palette.bg_color
+        transparent_scroller.QColor(0, 0, 0)
+        self.assertEqual(CountingColor.created, 2)
+
+    def test_repaint_does_not_allocate_colors(self):
+        """Перерисовка с фрагментами из кэша не создает QColor"""
+        scroll_bars = [
+            VerticalScrollBar(auto_hide=False, opacity_levels=OPACITY_LEVELS),
+            VerticalScrollBar(auto_hide=False),
+            GraphicsViewVerticalScrollBar(auto_hide=False, opacity_levels=OPACITY_LEVELS),
+            GraphicsViewVerticalScrollBar(auto_hide=False)
+        ]
+        for scroll_bar in scroll_bars:
+            scroll_bar.resize(8, 400)
+            scroll_bar.setRange(0, 1000)
+            scroll_bar.setPageStep(100)
+
+            # Первый проход растеризует фрагменты: цвет создается только при промахе
+            ScrollBarPixmapCache.instance().clear()
+            CountingColor.created = 0
+            self._paint_frames(scroll_bar)
+            self.assertGreater(CountingColor.created, 0)
+
+            # Повторные кадры берут фрагменты из кэша по значениям ARGB палитры
+            CountingColor.created = 0
+            self._paint_frames(scroll_bar)
+            self.assertEqual(CountingColor.created, 0, type(scroll_bar).__name__)
+
+    def test_graphics_view_bars_do_not_share_mutations(self):
+        """Прозрачность одного скроллбара QGraphicsView не меняет цвета других"""
+        light_alpha = graphics_view_scroller.LIGHT_THEME["handle_color"].alpha()
+        first = GraphicsViewVerticalScrollBar(handle_alpha=10)
+        second = GraphicsViewVerticalScrollBar(handle_alpha=200)
+        self.assertEqual(first._handle_color.alpha(), 10)
+        self.assertEqual(second._handle_color.alpha(), 200)
+        # Общие словари тем не изменяются
+        self.assertEqual(graphics_view_scroller.LIGHT_THEME["handle_color"].alpha(), light_alpha)
+
+        first.applyStyle(handle_alpha=50)
+        self.assertEqual(first._handle_color.alpha(), 50)
+        self.assertEqual(second._handle_color.alpha(), 200)
+
+    def test_palettes_are_interned_and_immutable(self):
+        """Одинаковые настройки дают один экземпляр палитры, который нельзя изменить"""
+        theme = transparent_scroller.LIGHT_THEME
+        palette = ScrollBarPalette.get(theme, 30, 80, 120, 160)
+        self.assertIs(ScrollBarPalette.get(theme, 30, 80, 120, 160), palette)
+        self.assertIsNot(ScrollBarPalette.get(theme, 31, 80, 120, 160), palette)
+        self.assertEqual(palette.pressed_color.alpha(), 160)
+        with self.assertRaises(AttributeError):
+            palette.bg_color = QColor(0, 0, 0)
+        with self.assertRaises(AttributeError):
+            palette._rgba = (0, 0, 0, 0)
+
+        # Производный цвет (квантование прозрачности) - новое значение, палитра не меняется
+        handle_rgba = palette.rgba[ScrollBarPalette.HANDLE]
+        faded = ScrollBarPalette.faded(handle_rgba, 0.5)
+        self.assertEqual(faded >> 24, 40)
+        self.assertEqual(faded & 0xFFFFFF, handle_rgba & 0xFFFFFF)
+        self.assertEqual(palette.handle_color.alpha(), 80)
+
+    def test_color_mutation_does_not_leak(self):
+        """Изменение полученного цвета не меняет палитру и другие скроллбары"""
+        first = VerticalScrollBar(auto_hide=False, handle_alpha=90)
+        second = VerticalScrollBar(auto_hide=False, handle_alpha=90)
+        self.assertIs(first._palette, second._palette)
+
+        first._palette.handle_color.setAlpha(1)
+        first._handle_color.setAlpha(2)
+        self.assertEqual(first._handle_color.alpha(), 90)
+        self.assertEqual(second._handle_color.alpha(), 90)
+        self.assertEqual(second._palette.handle_color.alpha(), 90)
+
+    def test_unused_palettes_are_released(self):
+        """Палитры, которые не использует ни один скроллбар, не накапливаются"""
+        gc.collect()
+        before = ScrollBarPalette.getStats()["palettes"]
+        scroll_bar = VerticalScrollBar(auto_hide=False)
+        for alpha in range(256):
+            scroll_bar.applyStyle(handle_alpha=alpha)
+        gc.collect()
+        self.assertLessEqual(ScrollBarPalette.getStats()["palettes"], before + 1)
+        self.assertGreaterEqual(ScrollBarPalette.getStats()["created"], 256)
+
+
+if __name__ == "__main__":
+    result = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if result.wasSuccessful() else 1)
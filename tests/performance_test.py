@@ -3,8 +3,8 @@ import os
 import time
 import random
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QScrollArea, QScrollBar
-from PyQt6.QtCore import Qt, QRect
-from PyQt6.QtGui import QPainter, QColor
+from PyQt6.QtCore import Qt, QRect, QObject, QEvent
+from PyQt6.QtGui import QPainter, QColor, QPixmap
 
 # Добавляем родительскую директорию в путь для доступа к модулю
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -14,6 +14,8 @@ from transparent_scroller import LIGHT_THEME, DARK_THEME, VerticalScrollBar
 
 # Количество тестовых итераций
 NUM_ITERATIONS = 5000
+# Начальное значение генератора случайных чисел (одинаковые сценарии для всех реализаций)
+RANDOM_SEED = 42
 
 class RawScrollBar(QScrollBar):
     """Версия скроллера без оптимизаций - максимально близкая к оригинальному коду до оптимизаций"""
@@ -249,17 +251,54 @@ class PixmapOptimizedScrollBar(RawScrollBar):
         painter.setOpacity(self._opacity)
         painter.drawPixmap(0, 0, self._pixmap_cache)
 
+class PaintCounter(QObject):
+    """Фильтр событий, подсчитывающий кадры и площадь перерисовки виджета"""
+    
+    def __init__(self):
+        super().__init__()
+        self.frames = 0
+        self.pixels = 0
+    
+    def reset(self):
+        """Сбрасывает счетчики"""
+        self.frames = 0
+        self.pixels = 0
+    
+    def pixels_per_frame(self):
+        """Среднее число пикселей, композируемых за кадр"""
+        return self.pixels / self.frames if self.frames > 0 else 0
+    
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            rect = event.rect()
+            self.frames += 1
+            self.pixels += rect.width() * rect.height()
+        return False
+
+
+def report_pixels(counter):
+    """Выводит статистику композиции для сценария"""
+    print(f"    кадров: {counter.frames}, пикселей на кадр: {counter.pixels_per_frame():.0f}")
+    return counter.pixels_per_frame()
+
+
 # Функция для тестирования производительности рендеринга
-def test_rendering_performance(scroll_class):
+def measure_rendering_performance(scroll_class):
     """Тестирует производительность рендеринга скроллера"""
     # Создаём временный скроллбар для теста
     if scroll_class == RawScrollBar or scroll_class == PixmapOptimizedScrollBar:
         scrollbar = scroll_class(Qt.Orientation.Vertical)
     else:  # VerticalScrollBar уже имеет фиксированную ориентацию
-        scrollbar = scroll_class()
+        # Без автоскрытия, чтобы скроллбар был виден и отрисовывался как остальные
+        scrollbar = scroll_class(auto_hide=False)
     
     scrollbar.resize(20, 400)
     
+    # Подсчет кадров и площади перерисовки
+    counter = PaintCounter()
+    scrollbar.installEventFilter(counter)
+    pixels_per_frame = {}
+    
     # Задаем диапазон
     scrollbar.setMinimum(0)
     scrollbar.setMaximum(1000)
@@ -269,19 +308,24 @@ def test_rendering_performance(scroll_class):
     window = QWidget()
     scrollbar.setParent(window)
     window.resize(50, 450)
+    window.show()
+    
+    # Одинаковая последовательность значений для всех реализаций
+    random.seed(RANDOM_SEED)
     
     # Прогрев (чтобы исключить влияние начальной инициализации)
     print("  Прогрев...", end="", flush=True)
     for _ in range(100):
         scrollbar.setValue(random.randint(0, 900))
-        app.processEvents()
+        QApplication.processEvents()
     print(" готово")
     
     # Разделяем тест на несколько сценариев, более близких к реальному использованию
     
     # Сценарий 1: Плавный скроллинг (имитация прокрутки колесиком мыши)
     print("  Тест плавного скроллинга...", end="", flush=True)
-    start_time = time.time()
+    counter.reset()
+    start_time = time.perf_counter()
     
     for i in range(NUM_ITERATIONS // 5):
         # Плавное изменение значения
@@ -291,35 +335,30 @@ def test_rendering_performance(scroll_class):
         
         for step in range(steps):
             scrollbar.setValue(current + (target - current) * step // steps)
-            
-            # Небольшая задержка между обновлениями для реалистичности
-            if i % 10 == 0:
-                time.sleep(0.001)
-                
-            app.processEvents()
+            QApplication.processEvents()
     
-    smooth_time = time.time() - start_time
+    smooth_time = time.perf_counter() - start_time
     print(" готово")
+    pixels_per_frame["smooth"] = report_pixels(counter)
     
     # Сценарий 2: Прыжки к произвольным позициям (имитация кликов по скроллбару)
     print("  Тест скачкообразной прокрутки...", end="", flush=True)
-    start_time = time.time()
+    counter.reset()
+    start_time = time.perf_counter()
     
     for i in range(NUM_ITERATIONS // 10):
         # Резко меняем значение на случайное
         scrollbar.setValue(random.randint(0, 1000))
-        app.processEvents()
-        
-        # Каждые несколько итераций делаем паузу
-        if i % 5 == 0:
-            time.sleep(0.002)
+        QApplication.processEvents()
     
-    jump_time = time.time() - start_time
+    jump_time = time.perf_counter() - start_time
     print(" готово")
+    pixels_per_frame["jump"] = report_pixels(counter)
     
     # Сценарий 3: Длинная серия маленьких перемещений (типичный сценарий скроллинга в приложении)
     print("  Тест серии малых перемещений...", end="", flush=True)
-    start_time = time.time()
+    counter.reset()
+    start_time = time.perf_counter()
     
     # Маленькие перемещения вверх-вниз
     value = 500
@@ -330,10 +369,11 @@ def test_rendering_performance(scroll_class):
         scrollbar.setValue(value)
         
         if i % 20 == 0:
-            app.processEvents()
+            QApplication.processEvents()
     
-    small_time = time.time() - start_time
+    small_time = time.perf_counter() - start_time
     print(" готово")
+    pixels_per_frame["small"] = report_pixels(counter)
     
     # Закрываем окно
     window.close()
@@ -341,53 +381,64 @@ def test_rendering_performance(scroll_class):
     # Общее время - взвешенная сумма разных сценариев
     total_time = smooth_time * 0.4 + jump_time * 0.2 + small_time * 0.4
     
-    return total_time
+    return total_time, pixels_per_frame
+
+def main():
+    """Запускает сравнение производительности реализаций скроллбара"""
+    # Запускаем приложение Qt
+    app = QApplication.instance() or QApplication(sys.argv)
+    
+
+    print("Тестирование производительности рендеринга скроллеров")
+    print("-" * 50)
+
+    # Тестируем неоптимизированный скроллер
+    print(f"Тест без оптимизаций ({NUM_ITERATIONS} итераций)...")
+    time_raw, pixels_raw = measure_rendering_performance(RawScrollBar)
+    print(f"Время: {time_raw:.4f} секунд")
 
-# Запускаем приложение Qt
-app = QApplication(sys.argv)
+    # Тестируем скроллер только с оптимизацией QPixmap
+    print(f"\nТест только с оптимизацией QPixmap ({NUM_ITERATIONS} итераций)...")
+    time_pixmap_only, pixels_pixmap_only = measure_rendering_performance(PixmapOptimizedScrollBar)
+    print(f"Время: {time_pixmap_only:.4f} секунд")
 
-print("Тестирование производительности рендеринга скроллеров")
-print("-" * 50)
+    # Тестируем полностью оптимизированный скроллер
+    print(f"\nТест с полными оптимизациями ({NUM_ITERATIONS} итераций)...")
+    time_full_opt, pixels_full_opt = measure_rendering_performance(VerticalScrollBar)
+    print(f"Время: {time_full_opt:.4f} секунд")
 
-# Тестируем неоптимизированный скроллер
-print(f"Тест без оптимизаций ({NUM_ITERATIONS} итераций)...")
-time_raw = test_rendering_performance(RawScrollBar)
-print(f"Время: {time_raw:.4f} секунд")
+    # Сравниваем результаты
+    print("\nРезультаты тестов производительности:")
+    print(f"Базовая реализация: {time_raw:.4f} секунд")
+    print(f"С оптимизацией QPixmap: {time_pixmap_only:.4f} секунд")
+    print(f"Полная реализация (VerticalScrollBar): {time_full_opt:.4f} секунд")
 
-# Тестируем скроллер только с оптимизацией QPixmap
-print(f"\nТест только с оптимизацией QPixmap ({NUM_ITERATIONS} итераций)...")
-time_pixmap_only = test_rendering_performance(PixmapOptimizedScrollBar)
-print(f"Время: {time_pixmap_only:.4f} секунд")
+    print("\nПикселей, композируемых за кадр (плавный / скачки / малые перемещения):")
+    for title, pixels in [("Базовая реализация", pixels_raw),
+                          ("С оптимизацией QPixmap", pixels_pixmap_only),
+                          ("Полная реализация (VerticalScrollBar)", pixels_full_opt)]:
+        print(f"{title}: {pixels['smooth']:.0f} / {pixels['jump']:.0f} / {pixels['small']:.0f}")
 
-# Тестируем полностью оптимизированный скроллер
-print(f"\nТест с полными оптимизациями ({NUM_ITERATIONS} итераций)...")
-time_full_opt = test_rendering_performance(VerticalScrollBar)
-print(f"Время: {time_full_opt:.4f} секунд")
+    print("\nОтносительная производительность:")
 
-# Сравниваем результаты
-print("\nРезультаты тестов производительности:")
-print(f"Базовая реализация: {time_raw:.4f} секунд")
-print(f"С оптимизацией QPixmap: {time_pixmap_only:.4f} секунд")
-print(f"Полная реализация (VerticalScrollBar): {time_full_opt:.4f} секунд")
+    # Сравнение QPixmap с базовой реализацией
+    pixmap_improvement = (time_raw - time_pixmap_only) / time_raw * 100
+    pixmap_speedup = time_raw / time_pixmap_only if time_pixmap_only > 0 else float('inf')
+    print(f"QPixmap vs Базовая: {'+' if pixmap_improvement > 0 else ''}{pixmap_improvement:.2f}% ({pixmap_speedup:.2f}x)")
 
-print("\nОтносительная производительность:")
+    # Сравнение полной реализации с базовой
+    full_improvement = (time_raw - time_full_opt) / time_raw * 100
+    full_speedup = time_raw / time_full_opt if time_full_opt > 0 else float('inf')
+    print(f"VerticalScrollBar vs Базовая: {'+' if full_improvement > 0 else ''}{full_improvement:.2f}% ({full_speedup:.2f}x)")
 
-# Сравнение QPixmap с базовой реализацией
-pixmap_improvement = (time_raw - time_pixmap_only) / time_raw * 100
-pixmap_speedup = time_raw / time_pixmap_only if time_pixmap_only > 0 else float('inf')
-print(f"QPixmap vs Базовая: {'+' if pixmap_improvement > 0 else ''}{pixmap_improvement:.2f}% ({pixmap_speedup:.2f}x)")
+    print("\nПримечание:")
+    print("VerticalScrollBar содержит дополнительные компоненты (анимации, кэш и др.),")
+    print("которые могут добавлять накладные расходы при быстрых последовательных обновлениях.")
+    print("В реальных сценариях использования соотношение может отличаться.")
 
-# Сравнение полной реализации с базовой
-full_improvement = (time_raw - time_full_opt) / time_raw * 100
-full_speedup = time_raw / time_full_opt if time_full_opt > 0 else float('inf')
-print(f"VerticalScrollBar vs Базовая: {'+' if full_improvement > 0 else ''}{full_improvement:.2f}% ({full_speedup:.2f}x)")
+    # Результаты только информативные: регрессии отслеживает benchmark.py
+    return 0
 
-print("\nПримечание:")
-print("VerticalScrollBar содержит дополнительные компоненты (анимации, кэш и др.),")
-print("которые могут добавлять накладные расходы при быстрых последовательных обновлениях.")
-print("В реальных сценариях использования соотношение может отличаться.")
 
-# Для автоматического тестирования считаем успешным любой тест, где хотя бы одна
-# из оптимизаций показывает положительный результат
-test_success = pixmap_improvement > 0 or full_improvement > 0
-sys.exit(0)  # Всегда возвращаем успех, результаты производительности только информативные 
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main())
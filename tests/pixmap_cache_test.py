@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Тест общего кэша пиксмапов скроллбаров.
+"""
+
+import sys
+import os
+import unittest
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPainter, QImage
+
+# Добавляем родительский каталог в путь для импорта
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from transparent_scroller import VerticalScrollBar, HorizontalScrollBar, ScrollBarPixmapCache
+from graphics_view_scroller import GraphicsViewVerticalScrollBar
+
+# Количество скроллбаров, разделяющих кэш
+NUM_SCROLLBARS = 400
+
+
+def render_reference(scrollbar):
+    """Отрисовывает скроллбар напрямую, без кэша, как до оптимизации"""
+    image = QImage(scrollbar.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.fillRect(scrollbar.rect(), scrollbar._bg_color)
+    handle_rect = scrollbar._calculateSliderRect()
+    radius = min(4, min(handle_rect.width(), handle_rect.height()) / 2)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(scrollbar._handle_color)
+    painter.drawRoundedRect(handle_rect, radius, radius)
+    painter.end()
+    return image
+
+
+def max_channel_difference(first, second):
+    """Возвращает максимальное расхождение каналов двух изображений"""
+    first = first.convertToFormat(QImage.Format.Format_ARGB32)
+    second = second.convertToFormat(QImage.Format.Format_ARGB32)
+    difference = 0
+    for y in range(first.height()):
+        for x in range(first.width()):
+            a = first.pixelColor(x, y)
+            b = second.pixelColor(x, y)
+            difference = max(difference,
+                             abs(a.red() - b.red()), abs(a.green() - b.green()),
+                             abs(a.blue() - b.blue()), abs(a.alpha() - b.alpha()))
+    return difference
+
+
+class PixmapCacheTest(unittest.TestCase):
+    """Тесты общего кэша пиксмапов"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.cache = ScrollBarPixmapCache.instance()
+        self.cache.clear()
+        self.cache.resetStats()
+        self.cache.setMemoryBudget(ScrollBarPixmapCache.DEFAULT_MEMORY_BUDGET)
+
+    def _create_scrollbar(self, value=250):
+        scrollbar = VerticalScrollBar(auto_hide=False)
+        scrollbar.resize(8, 400)
+        scrollbar.setRange(0, 1000)
+        scrollbar.setPageStep(100)
+        scrollbar.setValue(value)
+        return scrollbar
+
+    def test_identical_scrollbars_share_tiles(self):
+        """Одинаковые скроллбары используют одни и те же фрагменты"""
+        scrollbars = [self._create_scrollbar() for _ in range(NUM_SCROLLBARS)]
+        for scrollbar in scrollbars:
+            scrollbar.grab()
+
+        stats = self.cache.getStats()
+        print(f"\nСкроллбаров: {NUM_SCROLLBARS}, фрагментов в кэше: {stats['entries']}, "
+              f"байт: {stats['bytes']}, попаданий: {stats['hit_rate']:.2f}%")
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["hits"], 2 * (NUM_SCROLLBARS - 1))
+
+    def test_memory_budget_evicts_tiles(self):
+        """Кэш не превышает бюджет памяти и вытесняет старые фрагменты"""
+        self.cache.setMemoryBudget(16 * 1024)
+        scrollbar = self._create_scrollbar()
+        for height in range(100, 1000, 10):
+            scrollbar.resize(8, height)
+            scrollbar.grab()
+
+        stats = self.cache.getStats()
+        self.assertLessEqual(stats["bytes"], 16 * 1024)
+        self.assertGreater(stats["evictions"], 0)
+
+    def test_handle_length_change_does_not_rasterize(self):
+        """Изменение длины ползунка не требует новой растеризации (nine-slice)"""
+        scrollbar = self._create_scrollbar()
+        scrollbar.grab()
+        self.cache.resetStats()
+
+        for page_step in range(10, 1000, 10):
+            scrollbar.setPageStep(page_step)
+            scrollbar.grab()
+
+        self.assertEqual(self.cache.getStats()["misses"], 0)
+
+    def test_rendering_matches_reference(self):
+        """Отрисовка из кэша совпадает с прямой отрисовкой"""
+        for page_step in (10, 100, 700):
+            scrollbar = self._create_scrollbar(value=333)
+            scrollbar.setPageStep(page_step)
+            image = scrollbar.grab().toImage()
+            self.assertLessEqual(max_channel_difference(image, render_reference(scrollbar)), 2)
+
+        # Толстый скроллбар с максимальным радиусом закругления
+        scrollbar = VerticalScrollBar(scroll_bar_width=16, auto_hide=False)
+        scrollbar.resize(16, 400)
+        scrollbar.setRange(0, 1000)
+        scrollbar.setPageStep(100)
+        image = scrollbar.grab().toImage()
+        self.assertLessEqual(max_channel_difference(image, render_reference(scrollbar)), 2)
+
+        scrollbar = HorizontalScrollBar(auto_hide=False)
+        scrollbar.resize(400, 8)
+        scrollbar.setRange(0, 1000)
+        scrollbar.setPageStep(100)
+        scrollbar.setValue(333)
+        image = scrollbar.grab().toImage()
+        self.assertLessEqual(max_channel_difference(image, render_reference(scrollbar)), 2)
+
+    def test_opacity_levels_share_track_tile(self):
+        """Уровни прозрачности используют один фрагмент дорожки"""
+        levels = 16
+        scrollbar = VerticalScrollBar(auto_hide=False, opacity_levels=levels)
+        scrollbar.resize(8, 1000)
+        scrollbar.setRange(0, 1000)
+        scrollbar.setPageStep(100)
+        for level in range(1, levels + 1):
+            scrollbar.setOpacity(level / levels)
+            scrollbar.grab()
+
+        track_tiles = [key for key in self.cache._tiles if key[0] == "track"]
+        handle_tiles = [key for key in self.cache._tiles if key[0] == "handle"]
+        self.assertEqual(len(track_tiles), 1)
+        self.assertEqual(len(handle_tiles), levels)
+
+        # Дорожка выводится с прозрачностью уровня
+        scrollbar.setOpacity(0.5)
+        image = scrollbar.grab().toImage()
+        expected = round(scrollbar._bg_color.alpha() * 0.5)
+        self.assertLessEqual(abs(image.pixelColor(4, 999).alpha() - expected), 1)
+
+    def test_graphics_view_scrollbar_uses_cache(self):
+        """Скроллбар QGraphicsView берет фрагменты из общего кэша"""
+        scrollbar = GraphicsViewVerticalScrollBar(auto_hide=False)
+        scrollbar.resize(8, 400)
+        scrollbar.setRange(0, 1000)
+        scrollbar.setPageStep(100)
+        scrollbar.grab()
+        scrollbar.grab()
+
+        stats = self.cache.getStats()
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["hits"], 2)
+
+
+    def test_graphics_view_opacity_levels(self):
+        """Скроллбар QGraphicsView квантует прозрачность и берет ползунок с примененным уровнем"""
+        levels = 8
+        scrollbar = GraphicsViewVerticalScrollBar(auto_hide=False, opacity_levels=levels)
+        scrollbar.resize(8, 1000)
+        scrollbar.setRange(0, 1000)
+        scrollbar.setPageStep(100)
+        for level in range(1, levels + 1):
+            scrollbar.setOpacity(level / levels)
+            scrollbar.grab()
+
+        track_tiles = [key for key in self.cache._tiles if key[0] == "track"]
+        handle_tiles = [key for key in self.cache._tiles if key[0] == "handle"]
+        self.assertEqual(len(track_tiles), 1)
+        self.assertEqual(len(handle_tiles), levels)
+
+        # Кадры анимации внутри одного уровня не перерисовываются
+        for step in range(100):
+            scrollbar.setOpacity(1.0 - step / 10000)
+        self.assertGreater(scrollbar.get_opacity_stats()["skipped_opacity_repaints"], 90)
+
+
+if __name__ == "__main__":
+    result = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if result.wasSuccessful() else 1)
@@ -10,6 +10,8 @@ import sys
 import os
 import time
 import random
+import gc
+import psutil
 from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QLabel, 
                             QMainWindow, QScrollArea, QPushButton)
 from PyQt6.QtCore import Qt, QTimer, QSize
@@ -21,12 +23,20 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
 # Импортируем нашу реализацию
-from transparent_scroller import apply_overlay_scrollbars
+from transparent_scroller import apply_overlay_scrollbars, VirtualOverlayScrollArea
 
 # Количество виджетов для теста
 NUM_WIDGETS = 200
 # Количество операций прокрутки для теста
 NUM_SCROLL_OPS = 100
+# Количество строк для сравнения виджетной и виртуальной прокрутки
+NUM_LIST_ROWS = 20000
+# Количество строк виртуального списка большого размера
+NUM_VIRTUAL_ROWS = 1000000
+# Высота строки списка
+LIST_ROW_HEIGHT = 24
+# Начальное значение генератора случайных чисел
+RANDOM_SEED = 42
 
 class FancyWidget(QWidget):
     """Красивый виджет с градиентом и содержимым для теста прокрутки"""
@@ -136,6 +146,9 @@ class TestWindow(QMainWindow):
             lambda: scrollbar.setValue(random.randint(min_val, max_val))
         ]
         
+        # Одинаковая последовательность операций для обоих вариантов
+        random.seed(RANDOM_SEED)
+        
         # Прогрев (для более стабильных результатов)
         print("Прогрев...", end="", flush=True)
         for _ in range(20):
@@ -144,28 +157,101 @@ class TestWindow(QMainWindow):
         print(" готово")
         
         # Засекаем время
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Выполняем операции прокрутки
-        for i in range(NUM_SCROLL_OPS):
+        for _ in range(NUM_SCROLL_OPS):
             # Выбираем случайную операцию
             op = random.choice(operations)
             op()
             
             # Обрабатываем события для обновления интерфейса
             QApplication.processEvents()
-            
-            # Небольшая задержка для имитации реального использования
-            if i % 5 == 0:
-                time.sleep(0.01)
         
         # Вычисляем затраченное время
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         
         print(f"Тест завершен за {elapsed_time:.4f} секунд")
         return elapsed_time
 
 
+def _create_row(parent):
+    """Создает виджет строки списка"""
+    return QLabel(parent)
+
+
+def _bind_row(label, index):
+    """Заполняет виджет строки данными элемента"""
+    label.setText(f"Строка {index + 1}")
+
+
+def _measure_list_scrolling(create_area):
+    """Создает область прокрутки списка и возвращает прирост памяти и время кадра прокрутки"""
+    process = psutil.Process(os.getpid())
+    gc.collect()
+    rss_before = process.memory_info().rss
+    
+    start = time.perf_counter()
+    area, set_offset, max_offset = create_area()
+    area.resize(400, 600)
+    area.show()
+    QApplication.processEvents()
+    setup_time = time.perf_counter() - start
+    rss_delta = process.memory_info().rss - rss_before
+    
+    random.seed(RANDOM_SEED)
+    start = time.perf_counter()
+    for _ in range(NUM_SCROLL_OPS):
+        set_offset(random.randint(0, max_offset()))
+        QApplication.processEvents()
+    frame_time = (time.perf_counter() - start) / NUM_SCROLL_OPS
+    
+    area.close()
+    area.deleteLater()
+    QApplication.processEvents()
+    return setup_time, rss_delta, frame_time
+
+
+def _create_widget_list(num_rows):
+    """Прежний путь: OverlayScrollArea с реальным виджетом на каждую строку"""
+    def create():
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        for index in range(num_rows):
+            label = _create_row(container)
+            label.setFixedHeight(LIST_ROW_HEIGHT)
+            _bind_row(label, index)
+            layout.addWidget(label)
+        area = apply_overlay_scrollbars(container)
+        scrollbar = area.verticalScrollBar()
+        return area, scrollbar.setValue, scrollbar.maximum
+    return create
+
+
+def _create_virtual_list(num_rows):
+    """Виртуальный путь: виджеты только для видимых строк"""
+    def create():
+        area = VirtualOverlayScrollArea(num_rows, _create_row, _bind_row, row_height=LIST_ROW_HEIGHT)
+        return area, area.setScrollOffset, lambda: area._v_scroll.logicalMaximum()
+    return create
+
+
+def run_virtual_list_benchmark():
+    """Сравнивает виджетную и виртуальную прокрутку списка по памяти и времени кадра"""
+    print("\nСравнение виджетной и виртуальной прокрутки списка:")
+    results = [
+        (f"Виджетный список, {NUM_LIST_ROWS} строк", _measure_list_scrolling(_create_widget_list(NUM_LIST_ROWS))),
+        (f"Виртуальный список, {NUM_LIST_ROWS} строк", _measure_list_scrolling(_create_virtual_list(NUM_LIST_ROWS))),
+        (f"Виртуальный список, {NUM_VIRTUAL_ROWS} строк", _measure_list_scrolling(_create_virtual_list(NUM_VIRTUAL_ROWS))),
+    ]
+    
+    print(f"{'Сценарий':<40} {'Создание, с':>12} {'Память, МБ':>12} {'Кадр, мс':>10}")
+    for name, (setup_time, rss_delta, frame_time) in results:
+        print(f"{name:<40} {setup_time:>12.3f} {rss_delta / (1024 * 1024):>12.1f} {frame_time * 1000:>10.2f}")
+
+
 def run_test():
     """Запускает тест производительности скроллбаров"""
     app = QApplication(sys.argv)
@@ -197,6 +283,9 @@ def run_test():
         print(f"\nУлучшение производительности: {'+' if improvement > 0 else ''}{improvement:.2f}%")
         print(f"Оптимизированные скроллбары быстрее в {times_faster:.2f} раза")
     
+    # Сравнение с виртуальным режимом OverlayScrollArea
+    run_virtual_list_benchmark()
+    
     # Выходим с кодом успеха независимо от результатов производительности
     # Результаты теста только информативные
     return 0
@@ -110,7 +110,7 @@ class RectCacheTest:
         self.cached_scroll._cache_misses = 0
         
         # Тест без кэширования
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         for i in range(TEST_CYCLES):
             # Реалистичная имитация прокрутки: 
@@ -122,10 +122,10 @@ class RectCacheTest:
             # Вычисляем прямоугольник ползунка
             rect = self.raw_scroll._calculateSliderRect()
             
-        raw_time = time.time() - start_time
+        raw_time = time.perf_counter() - start_time
         
         # Тест с кэшированием
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         for i in range(TEST_CYCLES):
             # Используем ту же последовательность значений
@@ -134,7 +134,7 @@ class RectCacheTest:
             # Вычисляем прямоугольник ползунка
             rect = self.cached_scroll._calculateSliderRect()
             
-        cached_time = time.time() - start_time
+        cached_time = time.perf_counter() - start_time
         
         # Выводим результаты
         print("\nРезультаты теста производительности вычисления ползунка:")
@@ -220,6 +220,32 @@ class RectCacheTest:
         
         return overall_success
     
+    def test_quantized_repaint(self):
+        """Тест подавления перерисовки, когда ползунок не сдвигается ни на пиксель"""
+        print("\nТестирование квантования перерисовки...")
+        
+        # Скроллбар для содержимого из миллиона строк
+        scroll = VerticalScrollBar(auto_hide=False, quantize_repaints=True)
+        scroll.resize(20, 400)
+        scroll.setRange(0, 1000000)
+        scroll.setPageStep(100)
+        scroll._calculateSliderRect()
+        
+        # Мелкие шаги прокрутки: один пиксель ползунка - тысячи единиц значения
+        steps = 1000
+        for value in range(1, steps + 1):
+            scroll.setValue(value * 10)
+        
+        stats = scroll.getCacheStats()
+        suppressed = stats['suppressed_repaints']
+        print(f"Изменений значения: {steps}")
+        print(f"Подавлено перерисовок: {suppressed}")
+        
+        # Ползунок должен был сдвинуться лишь на несколько пикселей
+        success = suppressed > steps * 0.9
+        print(f"Квантование перерисовки: {'[УСПЕХ]' if success else '[НЕУДАЧА]'}")
+        return success
+    
     def run_all_tests(self):
         """Запускает все тесты и выводит общий результат"""
         print("=" * 50)
@@ -234,13 +260,18 @@ class RectCacheTest:
         scenarios_result = self.test_cache_hit_scenarios()
         print("Тест сценариев использования кэша завершен.")
         
+        print("Запуск теста квантования перерисовки...")
+        quantized_result = self.test_quantized_repaint()
+        print("Тест квантования перерисовки завершен.")
+        
         print("\n" + "=" * 50)
         print("ОБЩИЙ РЕЗУЛЬТАТ ТЕСТОВ:")
         print("=" * 50)
         
         print(f"Тест производительности: {'[УСПЕХ]' if performance_result else '[НЕУДАЧА]'}")
         print(f"Тест сценариев использования кэша: {'[УСПЕХ]' if scenarios_result else '[НЕУДАЧА]'}")
-        print(f"Общий результат: {'[УСПЕХ]' if performance_result and scenarios_result else '[НЕУДАЧА]'}")
+        print(f"Тест квантования перерисовки: {'[УСПЕХ]' if quantized_result else '[НЕУДАЧА]'}")
+        print(f"Общий результат: {'[УСПЕХ]' if performance_result and scenarios_result and quantized_result else '[НЕУДАЧА]'}")
         
         # Завершаем работу приложения и возвращаемся из функции main
         return
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Тест общего реестра скроллбаров и массовых операций.
+"""
+
+import sys
+import os
+import gc
+import time
+import unittest
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QGraphicsView, QGraphicsScene
+from PyQt6.QtCore import QEvent
+
+# Добавляем родительский каталог в путь для импорта
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from transparent_scroller import (VerticalScrollBar, OverlayScrollArea, ScrollBarRegistry,
+                                  ScrollBarAnimationEngine, ScrollBarDelayTimer)
+from graphics_view_scroller import GraphicsViewVerticalScrollBar, apply_scrollbars_to_graphics_view
+
+# Количество панелей со скроллбарами
+NUM_PANES = 200
+
+
+class CountingScrollBar(VerticalScrollBar):
+    """Скроллбар, который считает пересчеты цветов и отрисовки"""
+
+    def __init__(self, **kwargs):
+        self.color_inits = 0
+        self.paints = 0
+        super().__init__(**kwargs)
+
+    def _initColors(self):
+        self.color_inits += 1
+        super()._initColors()
+
+    def paintEvent(self, event):
+        self.paints += 1
+        super().paintEvent(event)
+
+
+def create_panes(count):
+    """Создает окно с count скроллбарами"""
+    window = QWidget()
+    layout = QVBoxLayout(window)
+    scroll_bars = []
+    for _ in range(count):
+        scroll_bar = CountingScrollBar(auto_hide=False)
+        scroll_bar.setRange(0, 1000)
+        layout.addWidget(scroll_bar)
+        scroll_bars.append(scroll_bar)
+    window.resize(400, 800)
+    window.show()
+    QApplication.processEvents()
+    return window, scroll_bars
+
+
+def process_events(duration):
+    """Обрабатывает события в течение duration секунд"""
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        QApplication.processEvents()
+
+
+class ScrollBarRegistryTest(unittest.TestCase):
+    """Тесты реестра скроллбаров"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        gc.collect()
+        ScrollBarRegistry.resetStats()
+
+    def tearDown(self):
+        ScrollBarRegistry.resumeAnimations()
+
+    def test_live_counts(self):
+        """Реестр считает живые скроллбары и не держит удаленные"""
+        before = ScrollBarRegistry.liveCounts()
+        scroll_bars = [VerticalScrollBar() for _ in range(10)]
+        scroll_bars += [GraphicsViewVerticalScrollBar() for _ in range(5)]
+
+        counts = ScrollBarRegistry.liveCounts()
+        self.assertEqual(counts["total"], before["total"] + 15)
+        self.assertEqual(counts["by_class"]["VerticalScrollBar"],
+                         before["by_class"].get("VerticalScrollBar", 0) + 10)
+        self.assertEqual(counts["by_class"]["GraphicsViewVerticalScrollBar"],
+                         before["by_class"].get("GraphicsViewVerticalScrollBar", 0) + 5)
+
+        # Обертка, пережившая объект Qt, видна как утечка
+        leaked = scroll_bars[0]
+        for scroll_bar in scroll_bars:
+            scroll_bar.deleteLater()
+        scroll_bars.clear()
+        del scroll_bar
+        QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        gc.collect()
+        counts = ScrollBarRegistry.liveCounts()
+        self.assertEqual(counts["total"], before["total"])
+        self.assertEqual(counts["deleted_wrappers"], before["deleted_wrappers"] + 1)
+        del leaked
+
+    def test_bulk_changes_batched_into_one_pass(self):
+        """Смена темы и прозрачности применяется одним проходом с одной перерисовкой"""
+        window, scroll_bars = create_panes(NUM_PANES)
+        for scroll_bar in scroll_bars:
+            scroll_bar.color_inits = 0
+            scroll_bar.paints = 0
+
+        start = time.perf_counter()
+        ScrollBarRegistry.setTheme(True)
+        ScrollBarRegistry.setAlpha(handle_alpha=200)
+        schedule_time = time.perf_counter() - start
+        # До прохода цвета не пересчитываются
+        self.assertTrue(all(scroll_bar.color_inits == 0 for scroll_bar in scroll_bars))
+
+        process_events(0.05)
+        stats = ScrollBarRegistry.getStats()
+        print(f"\nПанелей: {NUM_PANES}, запросов: {stats['requested']}, применено: {stats['applied']}, "
+              f"проходов: {stats['flushes']}, планирование: {schedule_time * 1000:.2f} мс")
+        self.assertEqual(stats["flushes"], 1)
+        for scroll_bar in scroll_bars:
+            self.assertTrue(scroll_bar.use_dark_theme)
+            self.assertEqual(scroll_bar._handle_color.alpha(), 200)
+            self.assertEqual(scroll_bar.color_inits, 1)
+            self.assertEqual(scroll_bar.paints, 1)
+        window.close()
+
+    def test_subset_and_graphics_view_scrollbars(self):
+        """Операции применяются к выбранным скроллбарам обоих модулей"""
+        plain = VerticalScrollBar()
+        graphics = GraphicsViewVerticalScrollBar()
+        ScrollBarRegistry.setTheme(True, scroll_bars=[graphics])
+        ScrollBarRegistry.flush()
+        self.assertEqual(graphics._theme, "dark")
+        self.assertFalse(plain.use_dark_theme)
+
+        ScrollBarRegistry.setTheme(False)
+        ScrollBarRegistry.flush()
+        self.assertEqual(graphics._theme, "light")
+
+    def test_owner_state_follows_bulk_changes(self):
+        """Массовая смена стиля обновляет настройки OverlayScrollArea и менеджера QGraphicsView"""
+        area = OverlayScrollArea(QWidget())
+        view = QGraphicsView(QGraphicsScene(0, 0, 2000, 2000))
+        vsb, hsb = apply_scrollbars_to_graphics_view(view)
+
+        ScrollBarRegistry.setTheme(True)
+        ScrollBarRegistry.setAlpha(handle_alpha=150)
+        ScrollBarRegistry.flush()
+        self.assertTrue(area.isDarkTheme())
+        self.assertEqual(area._handle_alpha, 150)
+
+        # Смена темы владельцем исходит из примененной реестром темы
+        area.setTheme(not area.isDarkTheme())
+        self.assertFalse(area._v_scroll.use_dark_theme)
+        self.assertFalse(area._h_scroll.use_dark_theme)
+        view._scroll_manager.toggle_theme()
+        self.assertEqual((vsb._theme, hsb._theme), ("light", "light"))
+
+        # Изменение части скроллбаров области тоже запоминается
+        ScrollBarRegistry.setTheme(True, scroll_bars=[area._v_scroll])
+        ScrollBarRegistry.flush()
+        self.assertTrue(area.isDarkTheme())
+        area.close()
+        view.close()
+
+    def test_pending_changes_not_inherited_by_reused_id(self):
+        """Изменения удаленного скроллбара не достаются новому с тем же id"""
+        stale = VerticalScrollBar(handle_alpha=80)
+        stale_id = id(stale)
+        ScrollBarRegistry.setAlpha(handle_alpha=200, scroll_bars=[stale])
+        stale.deleteLater()
+        QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        del stale
+        gc.collect()
+
+        # Новый скроллбар обычно занимает память удаленного
+        candidates = []
+        for _ in range(100):
+            scroll_bar = VerticalScrollBar(handle_alpha=80)
+            candidates.append(scroll_bar)
+            if id(scroll_bar) == stale_id:
+                break
+        ScrollBarRegistry.setAlpha(bg_alpha=5, scroll_bars=[scroll_bar])
+        ScrollBarRegistry.flush()
+
+        self.assertEqual(scroll_bar._handle_color.alpha(), 80)
+        self.assertEqual(scroll_bar._bg_color.alpha(), 5)
+        self.assertEqual(ScrollBarRegistry.getStats()["applied"], 1)
+
+    def test_pause_animations(self):
+        """Пауза замораживает анимации прозрачности и скрытие, но не остальные задержки"""
+        engine = ScrollBarAnimationEngine.instance()
+        scroll_bar = VerticalScrollBar(auto_hide=True, show_duration=200, hide_delay=50)
+        scroll_bar.setRange(0, 1000)
+        scroll_bar.show()
+        scroll_bar.handle_widget_event("enter")
+        process_events(0.05)
+
+        fired = []
+        delay = ScrollBarDelayTimer(lambda: fired.append(True))
+        ScrollBarRegistry.pauseAnimations()
+        self.assertTrue(ScrollBarRegistry.isAnimationsPaused())
+        paused_opacity = scroll_bar.opacity
+        self.assertGreater(paused_opacity, 0.0)
+        self.assertLess(paused_opacity, 1.0)
+
+        delay.start(20)
+        process_events(0.3)
+        self.assertEqual(scroll_bar.opacity, paused_opacity)
+        self.assertEqual(fired, [True])
+        self.assertFalse(engine.isTicking())
+
+        # После паузы анимация продолжается с того же места
+        ScrollBarRegistry.resumeAnimations()
+        process_events(0.02)
+        self.assertGreaterEqual(scroll_bar.opacity, paused_opacity)
+        process_events(0.3)
+        self.assertEqual(scroll_bar.opacity, 1.0)
+        scroll_bar.close()
+
+
+if __name__ == "__main__":
+    result = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if result.wasSuccessful() else 1)
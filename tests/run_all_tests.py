@@ -9,6 +9,7 @@
 import os
 import sys
 import time
+import argparse
 import subprocess
 from colorama import init, Fore, Style
 
@@ -20,8 +21,22 @@ TESTS = [
     "structure_test.py",     # Тест структуры модуля
     "rect_cache_test.py",    # Тест кэширования прямоугольников
     "animation_test.py",     # Тест анимаций
+    "update_sync_test.py",   # Тест событийной синхронизации OverlayScrollArea
+    "pixmap_cache_test.py",  # Тест общего кэша пиксмапов
+    "hidpi_test.py",         # Тест отрисовки с учетом devicePixelRatio
+    "graphics_view_test.py", # Тест скроллбаров QGraphicsView
+    "logical_range_test.py", # Тест логического диапазона скроллбара
+    "smooth_scroll_test.py", # Тест плавной прокрутки колесиком
+    "wheel_test.py",         # Тест прокрутки тачпадом (pixelDelta)
+    "drag_test.py",          # Тест отложенного перетаскивания ползунка
+    "instrumentation_test.py", # Тест замеров отрисовки
+    "trace_test.py",         # Тест трассировки в формате Chrome trace
+    "registry_test.py",      # Тест реестра скроллбаров и массовых операций
+    "palette_test.py",       # Тест общих неизменяемых палитр
+    "virtual_scroll_test.py", # Тест виртуальной области прокрутки
     "simple_test.py",        # Простые функциональные тесты
     "performance_test.py",   # Тесты производительности
+    "benchmark.py",          # Набор бенчмарков (при --baseline - сравнение с базой)
     "real_world_test.py"     # Тест в реальном сценарии использования
 ]
 
@@ -43,14 +58,14 @@ def print_info(text):
     """Выводит информационное сообщение"""
     print(f"{Fore.YELLOW}{text}{Style.RESET_ALL}")
 
-def run_test(test_path):
+def run_test(test_path, args=()):
     """Запускает отдельный тест и возвращает результат его выполнения"""
     start_time = time.time()
     
     try:
         # Запускаем тест как подпроцесс
         result = subprocess.run(
-            [sys.executable, test_path],
+            [sys.executable, test_path, *args],
             capture_output=True,
             text=True,
             check=False  # Не вызывать исключение при ненулевом коде возврата
@@ -77,6 +92,18 @@ def run_test(test_path):
 
 def main():
     """Основная функция запуска всех тестов"""
+    parser = argparse.ArgumentParser(description="Запуск всех тестов скроллбара")
+    parser.add_argument("--baseline", help="Базовые результаты benchmark.py для поиска регрессий")
+    parser.add_argument("--threshold", type=float, help="Допустимое ухудшение относительно базы, %%")
+    args = parser.parse_args()
+    
+    # Аргументы бенчмарков: без базы результаты только выводятся
+    benchmark_args = []
+    if args.baseline:
+        benchmark_args += ["--baseline", os.path.abspath(args.baseline)]
+    if args.threshold is not None:
+        benchmark_args += ["--threshold", str(args.threshold)]
+    
     # Получаем текущую директорию скрипта
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
@@ -109,7 +136,7 @@ def main():
         print_info(f"\nТест {i}/{len(TESTS)}: {test_file} - запуск...")
         
         # Запускаем тест
-        result = run_test(test_path)
+        result = run_test(test_path, benchmark_args if test_file == "benchmark.py" else ())
         total_time += result["time"]
         results.append({"name": test_file, **result})
         
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Тест плавной прокрутки колесиком OverlayScrollArea.
+"""
+
+import sys
+import os
+import time
+import unittest
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel
+from PyQt6.QtCore import Qt, QEvent, QPoint, QPointF
+from PyQt6.QtGui import QWheelEvent
+
+# Добавляем родительский каталог в путь для импорта
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from transparent_scroller import OverlayScrollArea, VirtualOverlayScrollArea, ScrollBarAnimationEngine
+
+# Количество строк содержимого
+NUM_ROWS = 500
+# Количество событий колесика в серии
+NUM_WHEEL_NOTCHES = 10
+
+
+class LayoutCountingWidget(QWidget):
+    """Содержимое, которое считает перемещения (раскладки) при прокрутке"""
+
+    def __init__(self):
+        super().__init__()
+        self.moves = 0
+        layout = QVBoxLayout(self)
+        for i in range(NUM_ROWS):
+            layout.addWidget(QLabel(f"Строка {i + 1}"))
+
+    def moveEvent(self, event):
+        self.moves += 1
+        super().moveEvent(event)
+
+
+def send_wheel(widget, notches=1):
+    """Отправляет виджету событие колесика на notches щелчков вниз"""
+    event = QWheelEvent(QPointF(50, 50), QPointF(50, 50), QPoint(0, 0), QPoint(0, -120 * notches),
+                        Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier,
+                        Qt.ScrollPhase.NoScrollPhase, False)
+    QApplication.sendEvent(widget, event)
+
+
+def wait_animation(area, timeout=2.0):
+    """Обрабатывает события, пока идет плавная прокрутка"""
+    deadline = time.perf_counter() + timeout
+    while area.getSmoothScrollStats()["running"] and time.perf_counter() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.001)
+
+
+class SmoothScrollTest(unittest.TestCase):
+    """Тесты плавной прокрутки"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.content = LayoutCountingWidget()
+        self.area = OverlayScrollArea(self.content, smooth_scroll=True, smooth_scroll_duration=120)
+        self.area.resize(300, 400)
+        self.area.show()
+        self.app.processEvents()
+        self.content.moves = 0
+
+    def tearDown(self):
+        self.area.close()
+        self.app.processEvents()
+
+    def test_burst_merges_into_one_animation(self):
+        """Серия событий колесика объединяется в одну анимацию с общей целью"""
+        native = self.area.verticalScrollBar()
+        expected = NUM_WHEEL_NOTCHES * QApplication.wheelScrollLines() * native.singleStep()
+
+        for _ in range(NUM_WHEEL_NOTCHES):
+            send_wheel(self.area.viewport())
+        # До первого кадра содержимое не сдвигается
+        self.assertEqual(native.value(), 0)
+
+        wait_animation(self.area)
+        stats = self.area.getSmoothScrollStats()
+        print(f"\nСобытий колесика: {stats['scroll_requests']}, анимаций: {stats['animations']}, "
+              f"кадров: {stats['frames']}, сдвигов содержимого: {self.content.moves}, "
+              f"пропущено кадров: {stats['dropped_frames']}")
+        self.assertEqual(native.value(), expected)
+        self.assertEqual(stats["scroll_requests"], NUM_WHEEL_NOTCHES)
+        self.assertEqual(stats["animations"], 1)
+        # Содержимое сдвигается не чаще раза в кадр
+        self.assertLessEqual(self.content.moves, stats["frames"])
+
+    def test_wheel_during_animation_extends_target(self):
+        """Событие во время анимации продолжает ее к новой цели"""
+        native = self.area.verticalScrollBar()
+        step = QApplication.wheelScrollLines() * native.singleStep()
+
+        send_wheel(self.area.viewport())
+        time.sleep(0.05)
+        self.app.processEvents()
+        self.assertGreater(native.value(), 0)
+        send_wheel(self.area.viewport())
+
+        wait_animation(self.area)
+        self.assertEqual(native.value(), 2 * step)
+        self.assertEqual(self.area.getSmoothScrollStats()["animations"], 1)
+
+    def test_external_change_stops_animation(self):
+        """Изменение значения извне останавливает анимацию"""
+        native = self.area.verticalScrollBar()
+        send_wheel(self.area.viewport(), 5)
+        native.setValue(7)
+        wait_animation(self.area)
+        self.assertEqual(native.value(), 7)
+
+    def test_dropped_frames_are_reported(self):
+        """Кадры, пропущенные из-за занятого цикла событий, попадают в статистику"""
+        self.area.setSmoothScrolling(True, duration=300)
+        send_wheel(self.area.viewport(), 3)
+        self.app.processEvents()
+        time.sleep(0.1)
+        wait_animation(self.area)
+        self.assertGreater(self.area.getSmoothScrollStats()["dropped_frames"], 0)
+
+    def test_disabled_scrolls_immediately(self):
+        """Без плавной прокрутки колесико сдвигает содержимое сразу"""
+        self.area.setSmoothScrolling(False)
+        send_wheel(self.area.viewport())
+        self.assertGreater(self.area.verticalScrollBar().value(), 0)
+        self.assertEqual(ScrollBarAnimationEngine.instance().activeAnimationCount(), 0)
+
+    def test_virtual_area_scrolls_logical_value(self):
+        """Виртуальная область анимирует логическое значение скроллбара"""
+        area = VirtualOverlayScrollArea(1000000, QLabel, lambda label, index: label.setText(str(index)),
+                                        row_height=20, smooth_scroll=True, smooth_scroll_duration=50)
+        area.resize(300, 400)
+        area.show()
+        self.app.processEvents()
+
+        send_wheel(area.viewport(), 2)
+        wait_animation(area)
+        expected = 2 * QApplication.wheelScrollLines() * area._v_scroll.logicalSingleStep()
+        self.assertEqual(area.scrollOffset(), expected)
+        area.close()
+
+
+if __name__ == "__main__":
+    result = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if result.wasSuccessful() else 1)
@@ -76,16 +76,19 @@ class StructureTest(unittest.TestCase):
         scrollbar = VerticalScrollBar(auto_hide=True)
         manager = scrollbar.animation_manager
         
-        # Проверяем, что анимации инициализированы
-        self.assertIsNotNone(manager.show_animation)
-        self.assertIsNotNone(manager.hide_animation)
-        self.assertIsNotNone(manager.hide_timer)
+        # Проверяем, что анимации создаются только при первом показе
+        self.assertIsNone(manager.show_animation)
+        self.assertIsNone(manager.hide_animation)
+        self.assertIsNone(manager.hide_timer)
         
         # Проверяем, что начальная прозрачность установлена правильно
         self.assertEqual(scrollbar._opacity, 0.0)
         
         # Проверяем обработку событий
         manager.handle_widget_event("enter")
+        self.assertIsNotNone(manager.show_animation)
+        self.assertIsNotNone(manager.hide_animation)
+        self.assertIsNotNone(manager.hide_timer)
         # Проверка, что анимация показа запустилась (сложно проверить напрямую)
         
         manager.handle_widget_event("leave")
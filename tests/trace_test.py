@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Тест записи интервалов работы скроллбаров и экспорта в Chrome trace JSON.
+"""
+
+import sys
+import os
+import io
+import json
+import time
+import unittest
+from PyQt6.QtWidgets import QApplication, QWidget, QGraphicsView, QGraphicsScene
+from PyQt6.QtCore import Qt, QEvent, QPoint, QPointF
+from PyQt6.QtGui import QWheelEvent, QEnterEvent
+
+# Добавляем родительский каталог в путь для импорта
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from transparent_scroller import OverlayScrollArea, ScrollBarTracer
+from graphics_view_scroller import apply_scrollbars_to_graphics_view
+
+# Количество событий колесика в сценарии
+NUM_WHEEL_EVENTS = 20
+
+
+def send_wheel(widget):
+    """Отправляет виджету событие колесика на один щелчок вниз"""
+    event = QWheelEvent(QPointF(50, 50), QPointF(50, 50), QPoint(0, 0), QPoint(0, -120),
+                        Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier,
+                        Qt.ScrollPhase.NoScrollPhase, False)
+    QApplication.sendEvent(widget, event)
+
+
+def process_events(duration):
+    """Обрабатывает события в течение duration секунд"""
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        QApplication.processEvents()
+
+
+def export_trace():
+    """Экспортирует буфер в JSON и разбирает его обратно"""
+    output = io.StringIO()
+    ScrollBarTracer.exportChromeTrace(output)
+    return json.loads(output.getvalue())
+
+
+class ScrollBarTracerTest(unittest.TestCase):
+    """Тесты трассировки"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        ScrollBarTracer.clear()
+
+    def tearDown(self):
+        ScrollBarTracer.setEnabled(False, capacity=ScrollBarTracer.DEFAULT_CAPACITY)
+        ScrollBarTracer.clear()
+
+    def _create_area(self):
+        content = QWidget()
+        content.setMinimumSize(300, 20000)
+        area = OverlayScrollArea(content, auto_hide=True)
+        area.resize(300, 400)
+        area.show()
+        self.app.processEvents()
+        return area
+
+    def test_disabled_by_default(self):
+        """По умолчанию интервалы не записываются"""
+        self.assertFalse(ScrollBarTracer.isEnabled())
+        area = self._create_area()
+        send_wheel(area.viewport())
+        process_events(0.05)
+        area.close()
+        self.assertEqual(ScrollBarTracer.getStats()["events"], 0)
+
+    def test_overlay_scroll_area_spans(self):
+        """Прокрутка OverlayScrollArea записывает интервалы всех отслеживаемых методов"""
+        area = self._create_area()
+        ScrollBarTracer.setEnabled(True)
+        for _ in range(NUM_WHEEL_EVENTS):
+            send_wheel(area.viewport())
+            process_events(0.005)
+        area.widget().resize(300, 30000)
+        process_events(0.2)
+        area.close()
+
+        trace = export_trace()
+        events = trace["traceEvents"]
+        names = {event["name"] for event in events}
+        print(f"\nИнтервалов: {len(events)}, виды: {sorted(names)}")
+        for name in ("_updateScrollBars", "paintEvent", "_renderToPixmap", "eventFilter", "animationTick"):
+            self.assertIn(name, names)
+        for event in events:
+            self.assertEqual(event["ph"], "X")
+            self.assertGreaterEqual(event["dur"], 0)
+            self.assertEqual(event["pid"], os.getpid())
+        paint = next(event for event in events if event["name"] == "paintEvent")
+        self.assertTrue(paint["args"]["object"].startswith("VerticalScrollBar@"))
+
+    def test_graphics_view_spans(self):
+        """Скроллбары QGraphicsView записывают отрисовку и вызовы фильтров событий"""
+        scene = QGraphicsScene(0, 0, 5000, 5000)
+        view = QGraphicsView(scene)
+        view.resize(400, 300)
+        vsb, hsb = apply_scrollbars_to_graphics_view(view, auto_hide=False)
+        view.show()
+        self.app.processEvents()
+
+        ScrollBarTracer.setEnabled(True)
+        position = QPointF(10, 10)
+        QApplication.sendEvent(view.viewport(), QEnterEvent(position, position, view.mapToGlobal(position)))
+        view.resize(420, 320)
+        vsb.repaint()
+        process_events(0.05)
+        view.close()
+
+        events = export_trace()["traceEvents"]
+        objects = {event["args"]["object"].split("@")[0] for event in events
+                   if event["name"] in ("paintEvent", "eventFilter")}
+        self.assertIn("GraphicsViewVerticalScrollBar", objects)
+        self.assertIn("GraphicsViewScrollManager", objects)
+
+    def test_ring_buffer_keeps_latest_events(self):
+        """Кольцевой буфер хранит только последние записи"""
+        ScrollBarTracer.setEnabled(True, capacity=100)
+        for i in range(250):
+            start = ScrollBarTracer.now()
+            ScrollBarTracer.record(f"span{i}", "test", start)
+
+        stats = ScrollBarTracer.getStats()
+        self.assertEqual(stats["events"], 100)
+        self.assertEqual(stats["recorded"], 250)
+        self.assertEqual(stats["dropped"], 150)
+        trace = export_trace()
+        self.assertEqual(trace["traceEvents"][0]["name"], "span150")
+        self.assertEqual(trace["traceEvents"][-1]["name"], "span249")
+        self.assertEqual(trace["otherData"]["dropped_events"], 150)
+
+    def test_application_spans_share_timeline(self):
+        """Интервалы приложения записываются на той же шкале времени"""
+        area = self._create_area()
+        ScrollBarTracer.setEnabled(True)
+        with ScrollBarTracer.span("applicationFrame", args={"frame": 1}):
+            send_wheel(area.viewport())
+            area.repaint()
+        area.close()
+
+        events = export_trace()["traceEvents"]
+        frame = next(event for event in events if event["name"] == "applicationFrame")
+        self.assertEqual(frame["cat"], "app")
+        self.assertEqual(frame["args"], {"frame": 1})
+        # Работа скроллбаров внутри интервала приложения попадает в его границы
+        inner = [event for event in events if event is not frame
+                 and frame["ts"] <= event["ts"] <= frame["ts"] + frame["dur"]]
+        self.assertGreater(len(inner), 0)
+
+    def test_export_to_file(self):
+        """Буфер сохраняется в файл, который открывается как JSON"""
+        ScrollBarTracer.setEnabled(True)
+        ScrollBarTracer.record("span", "test", ScrollBarTracer.now())
+        path = os.path.join(current_dir, "trace_test_output.json")
+        try:
+            self.assertEqual(ScrollBarTracer.exportChromeTrace(path), 1)
+            with open(path, encoding="utf-8") as trace_file:
+                self.assertEqual(len(json.load(trace_file)["traceEvents"]), 1)
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    result = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if result.wasSuccessful() else 1)
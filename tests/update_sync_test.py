@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Тест событийной синхронизации OverlayScrollArea со стандартными скроллбарами.
+"""
+
+import sys
+import os
+import unittest
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import QElapsedTimer
+
+# Добавляем родительский каталог в путь для импорта
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from transparent_scroller import OverlayScrollArea, ScrollBarUpdateScheduler
+
+
+def process_events_for(app, msec):
+    """Прокручивает цикл событий заданное время"""
+    timer = QElapsedTimer()
+    timer.start()
+    while timer.elapsed() < msec:
+        app.processEvents()
+
+
+class UpdateSyncTest(unittest.TestCase):
+    """Тесты синхронизации без периодического опроса"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def _create_area(self, **kwargs):
+        content = QWidget()
+        content.setMinimumSize(300, 3000)
+        area = OverlayScrollArea(content, **kwargs)
+        area.resize(200, 200)
+        return area
+
+    def test_idle_has_no_wakeups(self):
+        """В простое без резервного опроса нет ни одного пробуждения"""
+        area = self._create_area()
+        area.show()
+        process_events_for(self.app, 50)
+        area.resetUpdateStats()
+
+        process_events_for(self.app, 400)
+
+        stats = area.getUpdateStats()
+        self.assertFalse(stats["poll_active"])
+        self.assertEqual(stats["poll_wakeups"], 0)
+        self.assertEqual(stats["wakeups_per_second"], 0)
+        area.close()
+
+    def test_content_resize_updates_range(self):
+        """Изменение размера содержимого сразу отражается на скроллбаре"""
+        area = self._create_area()
+        area.show()
+        process_events_for(self.app, 50)
+
+        area.widget().setMinimumSize(300, 6000)
+        process_events_for(self.app, 50)
+
+        native = area.verticalScrollBar()
+        self.assertEqual(area._v_scroll.maximum(), native.maximum())
+        self.assertGreater(area._v_scroll.maximum(), 5000)
+        area.close()
+
+    def test_native_value_is_forwarded(self):
+        """Изменение значения стандартного скроллбара доходит до оверлейного"""
+        area = self._create_area()
+        area.show()
+        process_events_for(self.app, 50)
+
+        area.verticalScrollBar().setValue(area.verticalScrollBar().maximum())
+        process_events_for(self.app, 20)
+
+        self.assertEqual(area._v_scroll.value(), area.verticalScrollBar().maximum())
+        area.close()
+
+    def test_fallback_poll_only_while_visible(self):
+        """Резервный опрос работает только пока область видима"""
+        area = self._create_area(poll_interval=20)
+        self.assertFalse(area.getUpdateStats()["poll_active"])
+
+        area.show()
+        process_events_for(self.app, 200)
+        self.assertTrue(area.getUpdateStats()["poll_active"])
+        self.assertGreater(area.getUpdateStats()["poll_wakeups"], 0)
+
+        area.hide()
+        self.assertFalse(area.getUpdateStats()["poll_active"])
+
+    def test_scheduler_coalesces_requests(self):
+        """Повторные запросы синхронизации объединяются в один проход на область"""
+        areas = [self._create_area() for _ in range(10)]
+        for area in areas:
+            area.show()
+        process_events_for(self.app, 50)
+
+        scheduler = ScrollBarUpdateScheduler.instance()
+        scheduler.resetStats()
+
+        # Несколько изменений подряд до возврата в цикл событий
+        for area in areas:
+            native = area.verticalScrollBar()
+            for step in range(1, 6):
+                native.setValue(step * 10)
+
+        process_events_for(self.app, 20)
+
+        stats = scheduler.getStats()
+        self.assertEqual(stats["executed"], len(areas))
+        self.assertEqual(stats["flushes"], 1)
+        self.assertGreaterEqual(stats["coalescing_ratio"], 5)
+        for area in areas:
+            self.assertEqual(area._v_scroll.value(), 50)
+            area.close()
+
+
+    def test_precise_sync_forwards_small_changes(self):
+        """В точном режиме ползунок получает даже малые изменения на длинном документе"""
+        content = QWidget()
+        content.setMinimumSize(300, 500000)
+        area = OverlayScrollArea(content, precise_sync=True)
+        area.resize(200, 200)
+        area.show()
+        process_events_for(self.app, 50)
+
+        area.verticalScrollBar().setValue(120)
+        process_events_for(self.app, 20)
+        self.assertEqual(area._v_scroll.value(), 120)
+
+        # В обычном режиме изменение меньше 1% диапазона отбрасывается
+        area.setPreciseSync(False)
+        area.verticalScrollBar().setValue(240)
+        process_events_for(self.app, 20)
+        self.assertEqual(area._v_scroll.value(), 120)
+        area.close()
+
+
+if __name__ == "__main__":
+    result = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if result.wasSuccessful() else 1)
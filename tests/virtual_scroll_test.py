@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Тест виртуальной области прокрутки VirtualOverlayScrollArea.
+"""
+
+import sys
+import os
+import unittest
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import Qt, QEvent, QPoint, QPointF
+from PyQt6.QtGui import QWheelEvent, QKeyEvent
+
+# Добавляем родительский каталог в путь для импорта
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from transparent_scroller import VirtualOverlayScrollArea
+
+# Количество элементов списка
+NUM_ITEMS = 1000000
+# Высота строки (пикселей)
+ROW_HEIGHT = 20
+# Высота видимой области (пикселей)
+VIEWPORT_HEIGHT = 400
+
+
+def create_area(item_count=NUM_ITEMS):
+    """Создает виртуальную область с пустыми строками"""
+    area = VirtualOverlayScrollArea(item_count, QWidget, lambda widget, index: None, row_height=ROW_HEIGHT)
+    area.resize(300, VIEWPORT_HEIGHT)
+    area.show()
+    QApplication.processEvents()
+    return area
+
+
+def row_widgets(area):
+    """Возвращает живые виджеты строк в контейнере области"""
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    return area._container.findChildren(QWidget, options=Qt.FindChildOption.FindDirectChildrenOnly)
+
+
+def press_key(area, key):
+    """Отправляет области нажатие клавиши"""
+    QApplication.sendEvent(area, QKeyEvent(QEvent.Type.KeyPress, key, Qt.KeyboardModifier.NoModifier))
+
+
+class VirtualScrollAreaTest(unittest.TestCase):
+    """Тесты виртуальной области прокрутки"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_free_rows_trimmed_on_shrink(self):
+        """После уменьшения количества элементов лишние виджеты строк удаляются"""
+        area = create_area()
+        created = len(row_widgets(area))
+        self.assertGreater(created, 10 + VirtualOverlayScrollArea.FREE_ROWS_RESERVE)
+
+        area.setItemCount(10)
+        QApplication.processEvents()
+        widgets = row_widgets(area)
+        stats = area.getVirtualStats()
+        print(f"\nВиджетов строк: {created} -> {len(widgets)}")
+        self.assertEqual(stats["bound_rows"], 10)
+        self.assertLessEqual(len(widgets), 10 + VirtualOverlayScrollArea.FREE_ROWS_RESERVE)
+        self.assertEqual(len(widgets), stats["instantiated_widgets"])
+
+        # Уменьшение области тоже освобождает виджеты
+        area.setItemCount(NUM_ITEMS)
+        QApplication.processEvents()
+        area.resize(300, VIEWPORT_HEIGHT // 4)
+        QApplication.processEvents()
+        self.assertLessEqual(len(row_widgets(area)),
+                             area.getVirtualStats()["bound_rows"] + VirtualOverlayScrollArea.FREE_ROWS_RESERVE)
+
+        area.setItemCount(0)
+        QApplication.processEvents()
+        self.assertLessEqual(len(row_widgets(area)), VirtualOverlayScrollArea.FREE_ROWS_RESERVE)
+        area.close()
+
+    def test_wheel_scrolls_logical_offset(self):
+        """Колесико прокручивает логическую позицию на шаги строк"""
+        area = create_area()
+        event = QWheelEvent(QPointF(50, 50), QPointF(50, 50), QPoint(0, 0), QPoint(0, -120),
+                            Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier,
+                            Qt.ScrollPhase.NoScrollPhase, False)
+        QApplication.sendEvent(area.viewport(), event)
+        self.assertEqual(area.scrollOffset(), QApplication.wheelScrollLines() * ROW_HEIGHT)
+        self.assertEqual(area.getWheelStats()["wheel_events"], 1)
+        area.close()
+
+    def test_keyboard_paging(self):
+        """PageUp, PageDown, Home и End прокручивают виртуальное содержимое"""
+        area = create_area()
+        page = area.viewport().height()
+        press_key(area, Qt.Key.Key_PageDown)
+        self.assertEqual(area.scrollOffset(), page)
+        press_key(area, Qt.Key.Key_PageDown)
+        press_key(area, Qt.Key.Key_PageUp)
+        self.assertEqual(area.scrollOffset(), page)
+        press_key(area, Qt.Key.Key_Down)
+        self.assertEqual(area.scrollOffset(), page + ROW_HEIGHT)
+
+        press_key(area, Qt.Key.Key_End)
+        self.assertEqual(area.scrollOffset(), NUM_ITEMS * ROW_HEIGHT - page)
+        self.assertEqual(area.visibleRange()[1], NUM_ITEMS - 1)
+        press_key(area, Qt.Key.Key_Home)
+        self.assertEqual(area.scrollOffset(), 0)
+        self.assertEqual(area.visibleRange()[0], 0)
+        area.close()
+
+
+if __name__ == "__main__":
+    result = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if result.wasSuccessful() else 1)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Тест прокрутки тачпадом с высоким разрешением (pixelDelta) в OverlayScrollArea.
+
+Синтетические события тачпада с частотой 1000 Гц сравниваются для прежнего
+обработчика (прокрутка и синхронизация скроллбаров на каждое событие) и
+накопителя pixelDelta (одна прокрутка за кадр).
+"""
+
+import sys
+import os
+import time
+import unittest
+from PyQt6.QtWidgets import QApplication, QWidget, QScrollArea
+from PyQt6.QtCore import Qt, QPoint, QPointF
+from PyQt6.QtGui import QWheelEvent, QInputDevice, QPointingDevice
+
+# Добавляем родительский каталог в путь для импорта
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from transparent_scroller import OverlayScrollArea, VirtualOverlayScrollArea
+
+# Количество событий тачпада в серии
+NUM_PIXEL_EVENTS = 1000
+# Сдвиг одного события тачпада (пикселей)
+PIXEL_STEP = 3
+# Частота событий тачпада (Гц)
+EVENT_RATE = 1000
+
+
+class LegacyWheelScrollArea(OverlayScrollArea):
+    """Прежний обработчик: прокрутка и синхронизация скроллбаров на каждое событие"""
+
+    def wheelEvent(self, event):
+        QScrollArea.wheelEvent(self, event)
+        self._update_needed = True
+        self._updateScrollBars()
+
+
+def create_touchpad():
+    """Создает устройство тачпада с точной прокруткой"""
+    return QPointingDevice("touchpad", 1, QInputDevice.DeviceType.TouchPad, QPointingDevice.PointerType.Finger,
+                           QInputDevice.Capability.Position | QInputDevice.Capability.Scroll
+                           | QInputDevice.Capability.PixelScroll, 5, 0)
+
+
+# Устройство синтетических событий тачпада
+TOUCHPAD = create_touchpad()
+
+
+def pixel_wheel_event(dy, phase=Qt.ScrollPhase.ScrollUpdate):
+    """Создает событие тачпада со сдвигом dy пикселей"""
+    return QWheelEvent(QPointF(50, 50), QPointF(50, 50), QPoint(0, dy), QPoint(0, dy * 4),
+                       Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier, phase, False,
+                       Qt.MouseEventSource.MouseEventNotSynthesized, TOUCHPAD)
+
+
+def create_area(area_class):
+    """Создает область прокрутки с высоким содержимым"""
+    content = QWidget()
+    content.setMinimumSize(300, 100000)
+    area = area_class(content, auto_hide=True)
+    area.resize(300, 400)
+    area.show()
+    QApplication.processEvents()
+    return area
+
+
+def run_pixel_session(area):
+    """Отправляет серию событий тачпада с частотой EVENT_RATE
+
+    Возвращает количество изменений значения (операций прокрутки) и длительность.
+    """
+    scroll_ops = []
+    area.verticalScrollBar().valueChanged.connect(scroll_ops.append)
+    viewport = area.viewport()
+
+    start = time.perf_counter()
+    for i in range(NUM_PIXEL_EVENTS):
+        QApplication.sendEvent(viewport, pixel_wheel_event(-PIXEL_STEP))
+        while time.perf_counter() - start < (i + 1) / EVENT_RATE:
+            QApplication.processEvents()
+    QApplication.sendEvent(viewport, pixel_wheel_event(0, Qt.ScrollPhase.ScrollEnd))
+    QApplication.processEvents()
+    elapsed = time.perf_counter() - start
+
+    area.verticalScrollBar().valueChanged.disconnect(scroll_ops.append)
+    return len(scroll_ops), elapsed
+
+
+class PixelWheelTest(unittest.TestCase):
+    """Тесты накопления pixelDelta"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_pixel_events_merge_per_frame(self):
+        """События тачпада объединяются в одну прокрутку за кадр без потери расстояния"""
+        legacy = create_area(LegacyWheelScrollArea)
+        legacy.resetUpdateStats()
+        legacy_ops, legacy_time = run_pixel_session(legacy)
+        legacy_passes = legacy.getUpdateStats()["sync_passes"]
+        legacy_value = legacy.verticalScrollBar().value()
+        legacy.close()
+
+        area = create_area(OverlayScrollArea)
+        area.resetUpdateStats()
+        scroll_ops, session_time = run_pixel_session(area)
+        sync_passes = area.getUpdateStats()["sync_passes"]
+        stats = area.getWheelStats()
+        value = area.verticalScrollBar().value()
+        area.close()
+
+        frames = session_time * 1000 / 16
+        print(f"\nСобытий тачпада: {NUM_PIXEL_EVENTS} за {session_time * 1000:.0f} мс (~{frames:.0f} кадров)")
+        print(f"Прежний обработчик: {legacy_ops} прокруток, {legacy_passes} синхронизаций скроллбаров, "
+              f"сдвиг {legacy_value} пикс. (по angleDelta)")
+        print(f"Накопитель pixelDelta: {scroll_ops} прокруток, {sync_passes} синхронизаций скроллбаров, "
+              f"сдвиг {value} пикс.")
+        self.assertGreater(legacy_value, 0)
+        self.assertEqual(value, NUM_PIXEL_EVENTS * PIXEL_STEP)
+        self.assertEqual(stats["pixel_events"], NUM_PIXEL_EVENTS + 1)
+        self.assertEqual(stats["pixel_scrolls"], scroll_ops)
+        self.assertLessEqual(scroll_ops, frames + 2)
+        self.assertLessEqual(scroll_ops * 5, legacy_ops)
+
+    def test_angle_delta_uses_wheel_steps(self):
+        """Событие колесика без pixelDelta прокручивает на шаги колесика"""
+        area = create_area(OverlayScrollArea)
+        event = QWheelEvent(QPointF(50, 50), QPointF(50, 50), QPoint(0, 0), QPoint(0, -120),
+                            Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier,
+                            Qt.ScrollPhase.NoScrollPhase, False)
+        QApplication.sendEvent(area.viewport(), event)
+        native = area.verticalScrollBar()
+        self.assertEqual(native.value(), QApplication.wheelScrollLines() * native.singleStep())
+        self.assertEqual(area.getWheelStats()["pixel_events"], 0)
+        area.close()
+
+    def test_mouse_wheel_ignores_pixel_delta(self):
+        """Колесико мыши с обоими сдвигами прокручивает по angleDelta
+
+        На X11 драйвер может заполнять pixelDelta и для мыши, но доверять
+        ему можно только для тачпада.
+        """
+        area = create_area(OverlayScrollArea)
+        event = QWheelEvent(QPointF(50, 50), QPointF(50, 50), QPoint(0, -1), QPoint(0, -120),
+                            Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier,
+                            Qt.ScrollPhase.NoScrollPhase, False)
+        self.assertEqual(event.device().type(), QInputDevice.DeviceType.Mouse)
+        QApplication.sendEvent(area.viewport(), event)
+        native = area.verticalScrollBar()
+        if QApplication.platformName() != "cocoa":
+            self.assertEqual(native.value(), QApplication.wheelScrollLines() * native.singleStep())
+            self.assertEqual(area.getWheelStats()["pixel_events"], 0)
+        area.close()
+
+    def test_pixel_scroll_shows_overlay(self):
+        """Прокрутка тачпадом показывает скроллбар и планирует его скрытие"""
+        area = create_area(OverlayScrollArea)
+        QApplication.sendEvent(area.viewport(), pixel_wheel_event(-10))
+        manager = area._v_scroll.animation_manager
+        self.assertIsNotNone(manager.hide_timer)
+        self.assertTrue(manager.hide_timer.isActive())
+        area.close()
+
+    def test_virtual_area_pixel_scroll(self):
+        """Виртуальная область прокручивает логическое значение на накопленные пиксели"""
+        area = VirtualOverlayScrollArea(1000000, QWidget, lambda widget, index: None, row_height=20)
+        area.resize(300, 400)
+        area.show()
+        QApplication.processEvents()
+        for _ in range(10):
+            QApplication.sendEvent(area.viewport(), pixel_wheel_event(-7))
+        QApplication.sendEvent(area.viewport(), pixel_wheel_event(0, Qt.ScrollPhase.ScrollEnd))
+        self.assertEqual(area.scrollOffset(), 70)
+        area.close()
+
+
+if __name__ == "__main__":
+    result = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if result.wasSuccessful() else 1)
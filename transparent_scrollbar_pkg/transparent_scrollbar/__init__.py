@@ -13,8 +13,20 @@ from .transparent_scroller import (
     VerticalScrollBar,
     HorizontalScrollBar,
     OverlayScrollArea,
+    VirtualOverlayScrollArea,
     ScrollBarThemeManager,
+    ScrollBarPalette,
     ScrollBarAnimationManager,
+    ScrollBarAnimationEngine,
+    ScrollBarOpacityAnimation,
+    ScrollBarDelayTimer,
+    ScrollBarSmoothScroller,
+    ScrollBarPaintStats,
+    ScrollBarInstrumentation,
+    ScrollBarTracer,
+    ScrollBarRegistry,
+    ScrollBarUpdateScheduler,
+    ScrollBarPixmapCache,
     apply_overlay_scrollbars,
     toggle_scrollbar_theme
 )
@@ -35,8 +47,20 @@ __all__ = [
     'VerticalScrollBar',
     'HorizontalScrollBar',
     'OverlayScrollArea',
+    'VirtualOverlayScrollArea',
     'ScrollBarThemeManager',
+    'ScrollBarPalette',
     'ScrollBarAnimationManager',
+    'ScrollBarAnimationEngine',
+    'ScrollBarOpacityAnimation',
+    'ScrollBarDelayTimer',
+    'ScrollBarSmoothScroller',
+    'ScrollBarPaintStats',
+    'ScrollBarInstrumentation',
+    'ScrollBarTracer',
+    'ScrollBarRegistry',
+    'ScrollBarUpdateScheduler',
+    'ScrollBarPixmapCache',
     'apply_overlay_scrollbars',
     'toggle_scrollbar_theme',
     
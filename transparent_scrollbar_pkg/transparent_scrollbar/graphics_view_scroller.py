@@ -1,7 +1,21 @@
+import time
+
 from PyQt6.QtWidgets import QScrollBar, QGraphicsView
-from PyQt6.QtCore import Qt, QRect, pyqtProperty, QTimer, QObject, QPropertyAnimation
+from PyQt6.QtCore import Qt, QRect, QEvent, pyqtProperty, QTimer, QObject
 from PyQt6.QtGui import QPainter, QColor
 
+try:
+    from .transparent_scroller import (ScrollBarPixmapCache, ScrollBarAnimationEngine,
+                                       ScrollBarOpacityAnimation, ScrollBarDelayTimer,
+                                       ScrollBarPaintStats, ScrollBarInstrumentation,
+                                       ScrollBarTracer, ScrollBarRegistry, ScrollBarPalette)
+except ImportError:
+    # Модуль используется вне пакета (например, из корня репозитория)
+    from transparent_scroller import (ScrollBarPixmapCache, ScrollBarAnimationEngine,
+                                      ScrollBarOpacityAnimation, ScrollBarDelayTimer,
+                                      ScrollBarPaintStats, ScrollBarInstrumentation,
+                                      ScrollBarTracer, ScrollBarRegistry, ScrollBarPalette)
+
 # Предопределенные цвета для тем
 LIGHT_THEME = {
     "bg_color": QColor(200, 200, 200, 30),
@@ -37,7 +51,7 @@ class GraphicsViewScrollBar(QScrollBar):
     def __init__(self, orientation, bg_alpha=30, handle_alpha=80, 
                  hover_alpha=120, pressed_alpha=160,
                  scroll_bar_width=8, use_dark_theme=False,
-                 auto_hide=True):
+                 auto_hide=True, opacity_levels=0):
         super().__init__(orientation)
         
         # Сохраняем ориентацию
@@ -52,6 +66,12 @@ class GraphicsViewScrollBar(QScrollBar):
         # Значение прозрачности для анимации (0-1)
         self._opacity = 1.0
         
+        # Квантование прозрачности (как у BaseScrollBar): кадры анимации
+        # с тем же уровнем не перерисовываются
+        self._opacity_levels = opacity_levels
+        self._opacity_level = None
+        self._skipped_opacity_repaints = 0
+        
         # Настройка темы
         self._theme = "dark" if use_dark_theme else "light"
         
@@ -82,14 +102,49 @@ class GraphicsViewScrollBar(QScrollBar):
         # Флаг для отслеживания удаления view
         self._view_deleted = False
         
-        # Автоскрытие
+        # Кэш необходимости скроллбара: пересчитывается только при изменении
+        # sceneRect, трансформации или размера viewport
+        self._visibility_dirty = True
+        self._is_needed = False
+        self._scene = None
+        self._cached_transform = None
+        self._visibility_checks = 0
+        self._scene_queries = 0
+        
+        # Обработка движений мыши: только при смене состояния и не чаще раза в кадр
+        self._last_hover_action = -ScrollBarAnimationEngine.FRAME_INTERVAL
+        self._hover_moves = 0
+        self._hover_actions = 0
+        
+        # Количество вызовов собственного фильтра событий
+        self._filter_calls = 0
+        
+        # Замеры времени отрисовки (только при ScrollBarInstrumentation.enabled)
+        self._paint_stats = ScrollBarPaintStats()
+        ScrollBarRegistry.register(self)
+        # Тема хранится только в самих скроллбарах, владельца для реестра нет
+        self._style_owner = None
+        
+        # Отложенный проход геометрии после изменения размера view
+        self._geometry_pass_pending = False
+        
+        # Автоскрытие: анимации и таймер создаются при первом показе
         self._auto_hide = auto_hide
+        self._hide_timer = None
+        self._show_animation = None
+        self._hide_animation = None
         if auto_hide:
             self.setOpacity(0.0)
-            self._setup_auto_hide()
     
-    def setGraphicsView(self, view):
-        """Связывает скроллбар с QGraphicsView"""
+    def setGraphicsView(self, view, install_event_filter=True):
+        """Связывает скроллбар с QGraphicsView
+        
+        Args:
+            view: QGraphicsView, к которому привязывается скроллбар
+            install_event_filter: Устанавливать собственный фильтр событий на view
+                и viewport. При использовании GraphicsViewScrollManager события
+                передает менеджер, и фильтр скроллбара не нужен
+        """
         self._view = view
         
         # Отслеживаем уничтожение view
@@ -123,13 +178,15 @@ class GraphicsViewScrollBar(QScrollBar):
         self._update_geometry()
         
         # Отслеживаем изменение размера и события мыши в GraphicsView
-        view.installEventFilter(self)
+        if install_event_filter:
+            view.installEventFilter(self)
                 
-         # Проверяем необходимость скроллбара и показываем/скрываем его
+        # Проверяем необходимость скроллбара и показываем/скрываем его
         self._update_visibility()
         
         # Также отслеживаем события для viewport
-        view.viewport().installEventFilter(self)
+        if install_event_filter:
+            view.viewport().installEventFilter(self)
     
     def _on_view_destroyed(self):
         """Обработчик события уничтожения view"""
@@ -147,16 +204,28 @@ class GraphicsViewScrollBar(QScrollBar):
     def _init_colors(self):
         """Инициализирует цвета в зависимости от темы"""
         colors = GraphicsViewScrollBarThemeManager.get_theme_colors(self._theme)
-        self._bg_color = colors["bg_color"]
-        self._handle_color = colors["handle_color"]
-        self._hover_color = colors["hover_color"]
-        self._pressed_color = colors["pressed_color"]
         
-        # Устанавливаем прозрачность
-        self._bg_color.setAlpha(self._bg_alpha)
-        self._handle_color.setAlpha(self._handle_alpha)
-        self._hover_color.setAlpha(self._hover_alpha)
-        self._pressed_color.setAlpha(self._pressed_alpha)
+        # Общая палитра с примененной прозрачностью: цвета темы не изменяются
+        self._palette = ScrollBarPalette.get(colors, self._bg_alpha, self._handle_alpha,
+                                             self._hover_alpha, self._pressed_alpha)
+    
+    # Копии цветов палитры. Отрисовка их не использует: в кэш пиксмапов
+    # передаются значения ARGB палитры, поэтому кадры не создают QColor
+    @property
+    def _bg_color(self):
+        return self._palette.bg_color
+    
+    @property
+    def _handle_color(self):
+        return self._palette.handle_color
+    
+    @property
+    def _hover_color(self):
+        return self._palette.hover_color
+    
+    @property
+    def _pressed_color(self):
+        return self._palette.pressed_color
     
     def _sync_from_native(self):
         """Синхронизирует параметры с нативным скроллбаром"""
@@ -191,6 +260,9 @@ class GraphicsViewScrollBar(QScrollBar):
     def _on_native_range_changed(self, min_val, max_val):
         """Обрабатывает изменение диапазона нативного скроллбара"""
         self.setRange(min_val, max_val)
+        # Диапазон меняется при смене сцены и трансформации, у которых нет
+        # собственных сигналов, поэтому здесь же проверяем видимость
+        self._update_visibility()
     
     def _on_own_value_changed(self, value):
         """Обрабатывает изменение нашего значения"""
@@ -231,6 +303,24 @@ class GraphicsViewScrollBar(QScrollBar):
     
     def eventFilter(self, obj, event):
         """Фильтр событий для отслеживания действий в GraphicsView"""
+        # Сборщик мусора может очистить обертку раньше, чем удален объект Qt
+        # (например, при удалении брошенного view с установленным фильтром)
+        if "_filter_calls" not in self.__dict__:
+            return False
+        
+        if not ScrollBarTracer.enabled:
+            return self._filter_event(obj, event)
+        
+        start = time.perf_counter_ns()
+        result = self._filter_event(obj, event)
+        ScrollBarTracer.record("eventFilter", "event", start, owner=self,
+                               args={"event": event.type().name})
+        return result
+    
+    def _filter_event(self, obj, event):
+        """Обрабатывает событие view или viewport"""
+        self._filter_calls += 1
+        
         # Если GraphicsView был удален, прекращаем обработку
         if self._view_deleted:
             return False
@@ -240,8 +330,7 @@ class GraphicsViewScrollBar(QScrollBar):
             if self._view and obj is self._view:
                 # При изменении размера GraphicsView обновляем геометрию скроллбара
                 if event.type() == event.Type.Resize:
-                    QTimer.singleShot(0, self._update_geometry)
-                    QTimer.singleShot(0, self._update_visibility)  # Добавляем обновление видимости
+                    self.on_view_resized()
                 # Реагируем на вход курсора в область GraphicsView
                 elif event.type() == event.Type.Enter and self._auto_hide:
                     self.show_scrollbar()
@@ -263,10 +352,10 @@ class GraphicsViewScrollBar(QScrollBar):
                         self.start_hide_timer()
                 # Также показываем скроллбары при движении мыши над viewport
                 elif event.type() == event.Type.MouseMove and self._auto_hide:
-                    self.show_scrollbar()
+                    self.handle_hover_move()
                 # Обновляем видимость при изменении размера viewport
                 elif event.type() == event.Type.Resize:
-                     QTimer.singleShot(0, self._update_visibility)    
+                    self.on_viewport_resized()
         except RuntimeError:
             # Если объект был удален, отключаем фильтр событий
             self._view_deleted = True
@@ -276,37 +365,116 @@ class GraphicsViewScrollBar(QScrollBar):
         
         return super().eventFilter(obj, event)
     
+    def on_view_resized(self):
+        """Обновляет геометрию и видимость после изменения размера view"""
+        self._visibility_dirty = True
+        self._schedule_geometry_pass()
+    
+    def on_viewport_resized(self):
+        """Обновляет геометрию и видимость после изменения размера viewport"""
+        self._visibility_dirty = True
+        self._schedule_geometry_pass()
+    
+    def _schedule_geometry_pass(self):
+        """Планирует один отложенный проход геометрии и видимости
+        
+        Сколько бы событий изменения размера ни пришло до возврата в цикл
+        событий, выполняется только один проход.
+        """
+        if not self._geometry_pass_pending:
+            self._geometry_pass_pending = True
+            QTimer.singleShot(0, self._run_geometry_pass)
+    
+    def _run_geometry_pass(self):
+        """Обновляет геометрию и видимость скроллбара"""
+        self._geometry_pass_pending = False
+        self._update_geometry()
+        self._update_visibility()
+    
+    def get_filter_stats(self):
+        """Возвращает количество вызовов собственного фильтра событий"""
+        return {"filter_calls": self._filter_calls}
+    
+    def get_paint_stats(self):
+        """Возвращает замеры отрисовки (при включенном ScrollBarInstrumentation)"""
+        return self._paint_stats.toDict()
+    
+    def reset_paint_stats(self):
+        """Сбрасывает замеры отрисовки"""
+        self._paint_stats.reset()
+    
     def paintEvent(self, event):
         """Отрисовка скроллбара"""
+        if not (ScrollBarInstrumentation.enabled or ScrollBarTracer.enabled):
+            self._paint_scrollbar(event)
+            return
+        
+        start = time.perf_counter_ns()
+        self._paint_scrollbar(event)
+        end = time.perf_counter_ns()
+        if ScrollBarInstrumentation.enabled:
+            self._paint_stats.recordPaint(end - start)
+        if ScrollBarTracer.enabled:
+            ScrollBarTracer.record("paintEvent", "paint", start, end, self)
+    
+    def _paint_scrollbar(self, event):
+        """Рисует скроллбар из фрагментов общего кэша"""
         # Если полностью прозрачный - ничего не рисуем
-        if self._opacity <= 0.01:
+        opacity = self._display_opacity()
+        if opacity <= 0.01:
+            return
+        
+        width = self.width()
+        height = self.height()
+        if width <= 1 or height <= 1:
             return
         
+        # Фрагменты дорожки и ползунка берутся из общего кэша пиксмапов
+        cache = ScrollBarPixmapCache.instance()
+        dpr = self.devicePixelRatioF()
+        
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setOpacity(self._opacity)
+        painter.setOpacity(opacity)
         
-        # Рисуем фон
-        painter.fillRect(self.rect(), self._bg_color)
+        # Рисуем фон (фрагмент один на размер и выводится с прозрачностью уровня)
+        track_pixmap = cache.trackTile(width, height, self._palette.rgba[ScrollBarPalette.BG], dpr)
+        painter.drawPixmap(0, 0, track_pixmap)
         
-        # Определяем цвет ползунка в зависимости от состояния
-        if self._mouse_pressed:
-            handle_color = self._pressed_color
-        elif self._mouse_over:
-            handle_color = self._hover_color
-        else:
-            handle_color = self._handle_color
+        # Определяем цвет ползунка (значение ARGB) в зависимости от состояния
+        handle_rgba = self._palette.handleRgba(self._mouse_pressed, self._mouse_over)
         
         # Вычисляем размер и положение ползунка
         handle_rect = self._calculate_handle_rect()
+        if handle_rect.width() <= 1 or handle_rect.height() <= 1:
+            if ScrollBarInstrumentation.enabled:
+                self._record_tiles((track_pixmap,))
+            return
         
-        # Рисуем ползунок с закругленными углами
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(handle_color)
-        
-        # Радиус закругления
+        # Рисуем ползунок с закругленными углами: концы растеризуются один раз,
+        # середина растягивается на нужную длину
         radius = min(4, min(handle_rect.width(), handle_rect.height()) / 2)
-        painter.drawRoundedRect(handle_rect, radius, radius)
+        vertical = self._orientation == Qt.Orientation.Vertical
+        thickness = handle_rect.width() if vertical else handle_rect.height()
+        
+        # При квантовании фрагмент ползунка берется с уже примененным уровнем
+        if self._opacity_levels > 0:
+            handle_rgba = ScrollBarPalette.faded(handle_rgba, opacity)
+            painter.setOpacity(1.0)
+        handle_slices = cache.handleSlices(thickness, radius, handle_rgba, dpr, vertical)
+        ScrollBarPixmapCache.drawHandle(painter, handle_rect, handle_slices, radius, vertical)
+        if ScrollBarInstrumentation.enabled:
+            self._record_tiles((track_pixmap, handle_slices))
+    
+    def _record_tiles(self, tiles):
+        """Учитывает рендер, только если фрагменты сменились с прошлой отрисовки
+        
+        Кэш возвращает один и тот же пиксмап, пока фрагмент не растеризован
+        заново, поэтому повторные отрисовки теми же фрагментами рендером не считаются.
+        """
+        previous = self._paint_stats.pixmaps
+        if len(previous) == len(tiles) and all(old is new for old, new in zip(previous, tiles)):
+            return
+        self._paint_stats.recordRender(tiles)
     
     def _calculate_handle_rect(self):
         """Вычисляет прямоугольник ползунка"""
@@ -392,37 +560,63 @@ class GraphicsViewScrollBar(QScrollBar):
     def setOpacity(self, opacity):
         """Сеттер для свойства прозрачности"""
         self._opacity = max(0.0, min(1.0, opacity))
+        
+        # Перерисовываем только при смене квантованного уровня прозрачности
+        if self._opacity_levels > 0:
+            level = round(self._opacity * self._opacity_levels)
+            if level == self._opacity_level:
+                self._skipped_opacity_repaints += 1
+                return
+            self._opacity_level = level
+        
         self.update()
     
+    def setOpacityLevels(self, levels):
+        """Устанавливает число уровней прозрачности (0 - без квантования)"""
+        self._opacity_levels = max(0, int(levels))
+        self._opacity_level = None
+        self.setOpacity(self._opacity)
+    
+    def opacityLevels(self):
+        """Возвращает число уровней прозрачности"""
+        return self._opacity_levels
+    
+    def get_opacity_stats(self):
+        """Возвращает число кадров анимации, пропущенных при квантовании"""
+        return {"skipped_opacity_repaints": self._skipped_opacity_repaints}
+    
+    def _display_opacity(self):
+        """Возвращает прозрачность, с которой скроллбар выводится на экран"""
+        if self._opacity_levels > 0:
+            return round(self._opacity * self._opacity_levels) / self._opacity_levels
+        return self._opacity
+    
     # Определяем свойство для анимации
     opacity = pyqtProperty(float, opacity, setOpacity)
     
     def _setup_auto_hide(self):
         """Настраивает автоматическое скрытие скроллбара"""
-        from PyQt6.QtCore import QPropertyAnimation, QEasingCurve, QTimer
+        from PyQt6.QtCore import QEasingCurve
         
-        # Таймер для скрытия скроллбара
-        self._hide_timer = QTimer(self)
-        self._hide_timer.setSingleShot(True)
-        self._hide_timer.timeout.connect(self.hide_scrollbar)
+        # Таймер для скрытия скроллбара (отсчитывается общим движком анимаций)
+        self._hide_timer = ScrollBarDelayTimer(self.hide_scrollbar, pausable=True)
         
         # Анимации для показа и скрытия
-        self._show_animation = QPropertyAnimation(self, b"opacity")
-        self._show_animation.setDuration(300)
-        self._show_animation.setStartValue(0.0)
-        self._show_animation.setEndValue(1.0)
-        self._show_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        
-        self._hide_animation = QPropertyAnimation(self, b"opacity")
-        self._hide_animation.setDuration(1000)
-        self._hide_animation.setStartValue(1.0)
-        self._hide_animation.setEndValue(0.0)
-        self._hide_animation.setEasingCurve(QEasingCurve.Type.InCubic)
+        self._show_animation = ScrollBarOpacityAnimation(
+            self, 300, 0.0, 1.0, QEasingCurve.Type.OutCubic)
+        self._hide_animation = ScrollBarOpacityAnimation(
+            self, 1000, 1.0, 0.0, QEasingCurve.Type.InCubic)
+    
+    def _ensure_auto_hide(self):
+        """Создает анимации и таймер скрытия при первом обращении"""
+        if self._hide_timer is None:
+            self._setup_auto_hide()
     
     def show_scrollbar(self):
         """Показывает скроллбар с анимацией"""
-        if not hasattr(self, '_hide_timer'):
+        if not self._auto_hide:
             return
+        self._ensure_auto_hide()
             
         # Останавливаем таймер и анимацию скрытия
         self._hide_timer.stop()
@@ -442,43 +636,142 @@ class GraphicsViewScrollBar(QScrollBar):
             self._show_animation.setStartValue(current_opacity)
             self._show_animation.start()
     
+    def _is_hover_shown(self):
+        """Проверяет, что скроллбар показан (или показывается) и скрытие не запланировано"""
+        if self._hide_timer is None:
+            return False
+        if self._hide_timer.isActive() or self._hide_animation.state() == self._hide_animation.State.Running:
+            return False
+        return self._opacity >= 1.0 or self._show_animation.state() == self._show_animation.State.Running
+    
+    def handle_hover_move(self):
+        """Обрабатывает движение мыши над view
+        
+        Пока скроллбар показан и скрытие не запланировано, движение ничего
+        не меняет и сразу отбрасывается. В остальных случаях показ
+        выполняется не чаще одного раза за кадр движка анимаций.
+        """
+        self._hover_moves += 1
+        if self._is_hover_shown():
+            return
+        
+        now = ScrollBarAnimationEngine.instance().now()
+        if now - self._last_hover_action < ScrollBarAnimationEngine.FRAME_INTERVAL:
+            return
+        self._last_hover_action = now
+        self._hover_actions += 1
+        self.show_scrollbar()
+    
+    def get_hover_stats(self):
+        """Возвращает количество движений мыши и выполненных по ним показов"""
+        return {
+            "mouse_moves": self._hover_moves,
+            "hover_actions": self._hover_actions
+        }
+    
+    def reset_hover_stats(self):
+        """Сбрасывает статистику движений мыши"""
+        self._hover_moves = 0
+        self._hover_actions = 0
+    
     def start_hide_timer(self):
         """Запускает таймер для скрытия скроллбара"""
-        if not hasattr(self, '_hide_timer'):
+        if not self._auto_hide:
+            return
+        # Скроллбар еще ни разу не показывался - скрывать нечего
+        if self._hide_timer is None and self._opacity <= 0.0:
             return
+        self._ensure_auto_hide()
             
         self._hide_timer.start(1000)  # Задержка в мс
     
     def hide_scrollbar(self):
         """Скрывает скроллбар с анимацией"""
-        if not hasattr(self, '_hide_animation'):
+        if not self._auto_hide:
             return
             
         current_opacity = self._opacity
         if current_opacity > 0.0:
+            self._ensure_auto_hide()
             self._hide_animation.setStartValue(current_opacity)
             self._hide_animation.start()  # Запускаем анимацию скрытия
 
-    def _update_visibility(self):
-        """Обновление видимости скроллбара"""
-        if not self._view or not self._native_scrollbar:
+    def invalidate_visibility(self):
+        """Помечает кэш необходимости скроллбара как устаревший"""
+        self._visibility_dirty = True
+    
+    def _on_scene_rect_changed(self, rect):
+        """Обрабатывает изменение границ сцены"""
+        self._visibility_dirty = True
+        self._update_visibility()
+    
+    def _track_scene(self):
+        """Подключается к sceneRectChanged текущей сцены view"""
+        scene = self._view.scene()
+        if scene is self._scene:
             return
-
-        # Получаем размеры сцены и viewport
-        scene_rect = self._view.scene().sceneRect()
-        viewport_rect = self._view.viewport().rect()
         
-        # Получаем матрицу преобразования для учета масштабирования
-        transform = self._view.transform()
+        if self._scene is not None:
+            try:
+                self._scene.sceneRectChanged.disconnect(self._on_scene_rect_changed)
+            except (TypeError, RuntimeError):
+                pass
+        self._scene = scene
+        if scene is not None:
+            scene.sceneRectChanged.connect(self._on_scene_rect_changed)
+        self._visibility_dirty = True
+    
+    def _compute_is_needed(self):
+        """Вычисляет, нужен ли скроллбар, по размерам сцены и viewport"""
+        if self._scene is None:
+            return False
+        
+        # Получаем размеры сцены и viewport (без явного sceneRect сцена
+        # обходит индекс элементов, поэтому запрос выполняется только при
+        # изменении сцены, трансформации или размера viewport)
+        self._scene_queries += 1
+        scene_rect = self._scene.sceneRect()
+        viewport_rect = self._view.viewport().rect()
         
         # Применяем преобразование к размерам сцены
-        mapped_rect = transform.mapRect(scene_rect)
+        mapped_rect = self._cached_transform.mapRect(scene_rect)
         
         # Проверяем, нужен ли скроллбар с учетом масштабирования
         if self._orientation == Qt.Orientation.Horizontal:
-            is_needed = mapped_rect.width() > viewport_rect.width()
-        else:
-            is_needed = mapped_rect.height() > viewport_rect.height()
+            return mapped_rect.width() > viewport_rect.width()
+        return mapped_rect.height() > viewport_rect.height()
+    
+    def get_visibility_stats(self):
+        """Возвращает количество проверок видимости и запросов к сцене"""
+        return {
+            "visibility_checks": self._visibility_checks,
+            "scene_queries": self._scene_queries
+        }
+    
+    def reset_visibility_stats(self):
+        """Сбрасывает статистику проверок видимости"""
+        self._visibility_checks = 0
+        self._scene_queries = 0
+    
+    def _update_visibility(self):
+        """Обновление видимости скроллбара"""
+        if not self._view or not self._native_scrollbar:
+            return
+        
+        self._visibility_checks += 1
+        self._track_scene()
+        
+        # Трансформация не имеет сигнала изменения, поэтому сравниваем ее
+        # с сохраненной (это дешево в отличие от запроса sceneRect)
+        transform = self._view.transform()
+        if transform != self._cached_transform:
+            self._cached_transform = transform
+            self._visibility_dirty = True
+        
+        if self._visibility_dirty:
+            self._is_needed = self._compute_is_needed()
+            self._visibility_dirty = False
+        is_needed = self._is_needed
 
         if is_needed:
             if not self.isVisible():
@@ -503,6 +796,27 @@ class GraphicsViewScrollBar(QScrollBar):
         self._init_colors()
         self.update()
     
+    def applyStyle(self, use_dark_theme=None, bg_alpha=None, handle_alpha=None,
+                   hover_alpha=None, pressed_alpha=None):
+        """Изменяет тему и прозрачность с одним пересчетом цветов и перерисовкой
+        
+        Совпадает по интерфейсу с BaseScrollBar.applyStyle(), что позволяет
+        ScrollBarRegistry менять стиль скроллбаров обоих модулей. Параметры
+        со значением None не изменяются.
+        """
+        if use_dark_theme is not None:
+            self._theme = "dark" if use_dark_theme else "light"
+        if bg_alpha is not None:
+            self._bg_alpha = bg_alpha
+        if handle_alpha is not None:
+            self._handle_alpha = handle_alpha
+        if hover_alpha is not None:
+            self._hover_alpha = hover_alpha
+        if pressed_alpha is not None:
+            self._pressed_alpha = pressed_alpha
+        self._init_colors()
+        self.update()
+    
     def toggle_theme(self):
         """Переключает тему скроллбара"""
         new_theme = "dark" if self._theme == "light" else "light"
@@ -513,24 +827,35 @@ class GraphicsViewVerticalScrollBar(GraphicsViewScrollBar):
     """Вертикальный скроллбар для QGraphicsView"""
     
     def __init__(self, bg_alpha=30, handle_alpha=80, hover_alpha=120, pressed_alpha=160,
-                 scroll_bar_width=8, use_dark_theme=False, auto_hide=True):
+                 scroll_bar_width=8, use_dark_theme=False, auto_hide=True,
+                 opacity_levels=0):
         super().__init__(Qt.Orientation.Vertical, bg_alpha, handle_alpha, 
                         hover_alpha, pressed_alpha, scroll_bar_width, 
-                        use_dark_theme, auto_hide)
+                        use_dark_theme, auto_hide, opacity_levels)
 
 
 class GraphicsViewHorizontalScrollBar(GraphicsViewScrollBar):
     """Горизонтальный скроллбар для QGraphicsView"""
     
     def __init__(self, bg_alpha=30, handle_alpha=80, hover_alpha=120, pressed_alpha=160,
-                 scroll_bar_width=8, use_dark_theme=False, auto_hide=True):
+                 scroll_bar_width=8, use_dark_theme=False, auto_hide=True,
+                 opacity_levels=0):
         super().__init__(Qt.Orientation.Horizontal, bg_alpha, handle_alpha, 
                         hover_alpha, pressed_alpha, scroll_bar_width, 
-                        use_dark_theme, auto_hide)
+                        use_dark_theme, auto_hide, opacity_levels)
 
 
 class GraphicsViewScrollManager(QObject):
-    """Менеджер для совместного управления скроллбарами QGraphicsView"""
+    """Менеджер для совместного управления скроллбарами QGraphicsView
+    
+    Единственный фильтр событий view и его viewport: обрабатывает только
+    нужные типы событий и передает их обоим скроллбарам.
+    """
+    
+    # Типы событий, на которые реагирует менеджер
+    _VIEW_EVENTS = frozenset({QEvent.Type.Resize, QEvent.Type.Enter, QEvent.Type.Leave})
+    _VIEWPORT_EVENTS = frozenset({QEvent.Type.Resize, QEvent.Type.Enter, QEvent.Type.Leave,
+                                  QEvent.Type.MouseMove})
     
     def __init__(self, view, vsb, hsb):
         super().__init__(view)
@@ -541,51 +866,136 @@ class GraphicsViewScrollManager(QObject):
         # Флаг для отслеживания удаления view
         self._view_deleted = False
         
+        # Статистика фильтра событий
+        self._filter_calls = 0
+        self._dispatched_events = 0
+        
+        # Флаг устаревшей геометрии: один отложенный проход на view
+        self._geometry_pass_pending = False
+        self._geometry_requests = 0
+        self._geometry_scheduled = 0
+        self._geometry_executed = 0
+        
         # Отслеживаем уничтожение view
         view.destroyed.connect(self._on_view_destroyed)
         
         # Устанавливаем фильтр событий для QGraphicsView и его viewport
+        self._viewport = view.viewport()
         view.installEventFilter(self)
-        view.viewport().installEventFilter(self)
+        self._viewport.installEventFilter(self)
     
     def _on_view_destroyed(self):
         """Обработчик события уничтожения view"""
         self._view_deleted = True
         self.view = None
+        self._viewport = None
     
     def eventFilter(self, obj, event):
         """Фильтр событий для QGraphicsView и его viewport"""
+        if not ScrollBarTracer.enabled:
+            return self._filterEvent(obj, event)
+        
+        start = time.perf_counter_ns()
+        result = self._filterEvent(obj, event)
+        ScrollBarTracer.record("eventFilter", "event", start, owner=self,
+                               args={"event": event.type().name})
+        return result
+    
+    def _filterEvent(self, obj, event):
+        """Отбрасывает ненужные события и передает остальные скроллбарам"""
+        self._filter_calls += 1
         if self._view_deleted:
             return False
-            
+        
+        # Быстро отбрасываем события, которые не нужны ни одному скроллбару
+        event_type = event.type()
+        if obj is self._viewport:
+            if event_type not in self._VIEWPORT_EVENTS:
+                return False
+            on_viewport = True
+        elif obj is self.view:
+            if event_type not in self._VIEW_EVENTS:
+                return False
+            on_viewport = False
+        else:
+            return False
+        
+        self._dispatched_events += 1
         try:
-            # Проверяем, существует ли view и что obj есть view
-            if self.view and obj is self.view:
-                # Показываем скроллбары при входе курсора и движении мыши
-                if event.type() in [event.Type.Enter, event.Type.MouseMove]:
-                    self._showScrollbars()
-                # Запускаем таймер скрытия при выходе курсора
-                elif event.type() == event.Type.Leave:
-                    # Не скрываем, если курсор находится над одним из скроллбаров
-                    if not (self.vsb.underMouse() or self.hsb.underMouse()):
-                        self._startHideTimer()
-            # Проверяем, существует ли view и viewport и что obj есть viewport
-            elif self.view and hasattr(self.view, 'viewport') and obj is self.view.viewport():
-                # Показываем скроллбары при входе курсора и движении мыши
-                if event.type() in [event.Type.Enter, event.Type.MouseMove]:
-                    self._showScrollbars()
-                # Запускаем таймер скрытия при выходе курсора
-                elif event.type() == event.Type.Leave:
-                    # Не скрываем, если курсор находится над одним из скроллбаров
-                    if not (self.vsb.underMouse() or self.hsb.underMouse()):
-                        self._startHideTimer()
+            if event_type == QEvent.Type.MouseMove:
+                # Движение мыши обрабатывается только при смене состояния
+                self._hoverScrollbars()
+            elif event_type == QEvent.Type.Resize:
+                self._scheduleGeometryPass()
+            elif event_type == QEvent.Type.Enter:
+                # Показываем скроллбары при входе курсора
+                self._showScrollbars()
+            else:
+                # Не скрываем, если курсор находится над одним из скроллбаров
+                # (или, при выходе из viewport, над самим QGraphicsView)
+                if not (self.vsb.underMouse() or self.hsb.underMouse() or
+                        (on_viewport and self.view.underMouse())):
+                    self._startHideTimer()
         except RuntimeError:
             # Если произошла ошибка доступа к удаленному C++ объекту
             self._view_deleted = True
             self.view = None
-            return False
+            self._viewport = None
         
-        return super().eventFilter(obj, event)
+        return False
+    
+    def _scheduleGeometryPass(self):
+        """Помечает геометрию view как устаревшую и планирует один проход"""
+        self._geometry_requests += 1
+        self.vsb.invalidate_visibility()
+        self.hsb.invalidate_visibility()
+        
+        if self._geometry_pass_pending:
+            return
+        self._geometry_pass_pending = True
+        self._geometry_scheduled += 1
+        QTimer.singleShot(0, self._runGeometryPass)
+    
+    def _runGeometryPass(self):
+        """Обновляет геометрию и видимость обоих скроллбаров"""
+        self._geometry_pass_pending = False
+        if self._view_deleted:
+            return
+        
+        try:
+            self.vsb._run_geometry_pass()
+            self.hsb._run_geometry_pass()
+        except RuntimeError:
+            # Игнорируем ошибки при доступе к удаленным объектам
+            return
+        self._geometry_executed += 1
+    
+    def getGeometryStats(self):
+        """Возвращает статистику запрошенных, запланированных и выполненных проходов геометрии"""
+        return {
+            "requests": self._geometry_requests,
+            "scheduled": self._geometry_scheduled,
+            "executed": self._geometry_executed,
+            "pending": self._geometry_pass_pending
+        }
+    
+    def resetGeometryStats(self):
+        """Сбрасывает статистику проходов геометрии"""
+        self._geometry_requests = 0
+        self._geometry_scheduled = 0
+        self._geometry_executed = 0
+    
+    def getEventStats(self):
+        """Возвращает количество вызовов фильтра и переданных скроллбарам событий"""
+        return {
+            "filter_calls": self._filter_calls,
+            "dispatched_events": self._dispatched_events
+        }
+    
+    def resetEventStats(self):
+        """Сбрасывает статистику фильтра событий"""
+        self._filter_calls = 0
+        self._dispatched_events = 0
     
     def _showScrollbars(self):
         """Показывает оба скроллбара"""
@@ -603,6 +1013,15 @@ class GraphicsViewScrollManager(QObject):
             # Игнорируем ошибки при доступе к удаленным объектам
             pass
     
+    def _hoverScrollbars(self):
+        """Передает движение мыши обоим скроллбарам"""
+        try:
+            self.vsb.handle_hover_move()
+            self.hsb.handle_hover_move()
+        except RuntimeError:
+            # Игнорируем ошибки при доступе к удаленным объектам
+            pass
+    
     def _startHideTimer(self):
         """Запускает таймер скрытия для обоих скроллбаров"""
         try:
@@ -639,7 +1058,7 @@ class GraphicsViewScrollManager(QObject):
 def apply_scrollbars_to_graphics_view(view, bg_alpha=30, handle_alpha=80, 
                                      hover_alpha=120, pressed_alpha=160,
                                      scroll_bar_width=8, use_dark_theme=False, 
-                                     auto_hide=True):
+                                     auto_hide=True, opacity_levels=0):
     """
     Применяет настраиваемые скроллбары к QGraphicsView
     
@@ -652,6 +1071,7 @@ def apply_scrollbars_to_graphics_view(view, bg_alpha=30, handle_alpha=80,
         scroll_bar_width: Ширина скроллбаров
         use_dark_theme: Использовать темную тему
         auto_hide: Автоматически скрывать скроллбары
+        opacity_levels: Число уровней прозрачности анимации (0 - без квантования)
     
     Returns:
         tuple: (vertical_scrollbar, horizontal_scrollbar)
@@ -659,22 +1079,21 @@ def apply_scrollbars_to_graphics_view(view, bg_alpha=30, handle_alpha=80,
     # Создаем скроллбары
     vsb = GraphicsViewVerticalScrollBar(
         bg_alpha, handle_alpha, hover_alpha, pressed_alpha,
-        scroll_bar_width, use_dark_theme, auto_hide
+        scroll_bar_width, use_dark_theme, auto_hide, opacity_levels
     )
     
     hsb = GraphicsViewHorizontalScrollBar(
         bg_alpha, handle_alpha, hover_alpha, pressed_alpha,
-        scroll_bar_width, use_dark_theme, auto_hide
+        scroll_bar_width, use_dark_theme, auto_hide, opacity_levels
     )
     
-    # Связываем с GraphicsView
-    vsb.setGraphicsView(view)
-    hsb.setGraphicsView(view)
+    # Связываем с GraphicsView (события передает менеджер)
+    vsb.setGraphicsView(view, install_event_filter=False)
+    hsb.setGraphicsView(view, install_event_filter=False)
     
-    # Создаем менеджер для совместной работы скроллбаров
-    if auto_hide:
-        # Сохраняем ссылку на менеджер в атрибуте view для защиты от сборщика мусора
-        view._scroll_manager = GraphicsViewScrollManager(view, vsb, hsb)
+    # Создаем менеджер - единственный фильтр событий view и viewport
+    # Сохраняем ссылку на менеджер в атрибуте view для защиты от сборщика мусора
+    view._scroll_manager = GraphicsViewScrollManager(view, vsb, hsb)
     
     return (vsb, hsb)
 
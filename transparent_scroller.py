@@ -1,6 +1,18 @@
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QScrollArea, QFrame, QScrollBar, QApplication, QHBoxLayout)
-from PyQt6.QtCore import Qt, QRect, QPoint, QTimer, QEvent, QObject, pyqtSignal, QPropertyAnimation, QEasingCurve, pyqtProperty
-from PyQt6.QtGui import QPainter, QColor, QPen, QPaintEvent, QPixmap
+import json
+import math
+import os
+import threading
+import time
+import weakref
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from itertools import accumulate
+
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QScrollArea, QFrame, QScrollBar, QAbstractSlider, QApplication, QHBoxLayout, QToolTip)
+from PyQt6.QtCore import Qt, QRect, QRectF, QPoint, QTimer, QElapsedTimer, QEvent, QObject, pyqtSignal, QAbstractAnimation, QEasingCurve, pyqtProperty
+from PyQt6.QtGui import QPainter, QColor, QPen, QPaintEvent, QPixmap, QCursor, QInputDevice
 
 # Предопределенные цвета для тем
 LIGHT_THEME = {
@@ -33,13 +45,702 @@ class ScrollBarThemeManager:
             scrollbar.setTheme(use_dark_theme)
 
 
+class ScrollBarPalette:
+    """Неизменяемая палитра скроллбара: цвета темы с примененной прозрачностью
+    
+    Палитры интернируются: на каждое сочетание базовых цветов темы и
+    прозрачностей создается один экземпляр, общий для всех скроллбаров.
+    Поэтому смена темы не создает QColor для каждого скроллбара. Палитра
+    хранит цвета как целые значения ARGB: отрисовка передает их в кэш
+    пиксмапов как есть, а QColor создается только при растеризации нового
+    фрагмента. Свойства цветов возвращают новые QColor, поэтому изменение
+    полученного цвета (setAlpha и т. п.) не затрагивает палитру и другие
+    скроллбары.
+    """
+    
+    __slots__ = ("_rgba", "__weakref__")
+    
+    # Имена цветов в словаре темы
+    COLOR_NAMES = ("bg_color", "handle_color", "hover_color", "pressed_color")
+    
+    # Индексы значений в rgba
+    BG, HANDLE, HOVER, PRESSED = range(4)
+    
+    # Интернированные палитры (ключ - базовые цвета и прозрачности). Палитра
+    # живет, пока ее используют скроллбары, поэтому словарь не растет с каждым
+    # новым сочетанием прозрачностей
+    _palettes = weakref.WeakValueDictionary()
+    _created = 0
+    
+    def __init__(self, theme, alphas):
+        rgba = tuple((alpha & 0xFF) << 24 | (theme[name].rgb() & 0xFFFFFF)
+                     for name, alpha in zip(self.COLOR_NAMES, alphas))
+        object.__setattr__(self, "_rgba", rgba)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("ScrollBarPalette не изменяется")
+    
+    @property
+    def rgba(self):
+        """Возвращает значения ARGB цветов в порядке COLOR_NAMES"""
+        return self._rgba
+    
+    @property
+    def bg_color(self):
+        """Возвращает новый QColor фона"""
+        return QColor.fromRgba(self._rgba[0])
+    
+    @property
+    def handle_color(self):
+        """Возвращает новый QColor ползунка"""
+        return QColor.fromRgba(self._rgba[1])
+    
+    @property
+    def hover_color(self):
+        """Возвращает новый QColor ползунка при наведении"""
+        return QColor.fromRgba(self._rgba[2])
+    
+    @property
+    def pressed_color(self):
+        """Возвращает новый QColor ползунка при нажатии"""
+        return QColor.fromRgba(self._rgba[3])
+    
+    def handleRgba(self, pressed, hover):
+        """Возвращает значение ARGB ползунка для состояния нажатия и наведения"""
+        if pressed:
+            return self._rgba[self.PRESSED]
+        if hover:
+            return self._rgba[self.HOVER]
+        return self._rgba[self.HANDLE]
+    
+    @staticmethod
+    def faded(rgba, factor):
+        """Возвращает значение ARGB с прозрачностью, умноженной на factor"""
+        alpha = round(((rgba >> 24) & 0xFF) * factor)
+        return max(0, min(255, alpha)) << 24 | (rgba & 0xFFFFFF)
+    
+    @classmethod
+    def get(cls, theme, bg_alpha, handle_alpha, hover_alpha, pressed_alpha):
+        """Возвращает общую палитру для словаря темы и прозрачностей состояний"""
+        alphas = (bg_alpha, handle_alpha, hover_alpha, pressed_alpha)
+        key = (theme["bg_color"].rgb(), theme["handle_color"].rgb(),
+               theme["hover_color"].rgb(), theme["pressed_color"].rgb()) + alphas
+        palette = cls._palettes.get(key)
+        if palette is None:
+            palette = cls(theme, alphas)
+            cls._palettes[key] = palette
+            cls._created += 1
+        return palette
+    
+    @classmethod
+    def getStats(cls):
+        """Возвращает количество живых и всего созданных палитр"""
+        return {
+            "palettes": len(cls._palettes),
+            "created": cls._created
+        }
+
+
+class ScrollBarPixmapCache:
+    """Общий для процесса LRU-кэш отрисованных фрагментов скроллбаров
+    
+    Хранит фрагменты дорожки и ползунка, ключом служат размеры, радиус,
+    цвет (целое значение ARGB) и devicePixelRatio. Скроллбары одинакового размера и цвета
+    используют одни и те же пиксмапы вместо собственных копий размером
+    с виджет. Объем кэша ограничен бюджетом памяти в байтах.
+    """
+    
+    # Бюджет памяти по умолчанию (байт)
+    DEFAULT_MEMORY_BUDGET = 8 * 1024 * 1024
+    
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        """Возвращает единственный экземпляр кэша"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET):
+        self._tiles = OrderedDict()
+        self._bytes = 0
+        self._memory_budget = memory_budget
+        
+        # Статистика использования кэша
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    def setMemoryBudget(self, memory_budget):
+        """Устанавливает бюджет памяти кэша в байтах"""
+        self._memory_budget = max(0, int(memory_budget))
+        self._evict()
+    
+    def memoryBudget(self):
+        """Возвращает бюджет памяти кэша в байтах"""
+        return self._memory_budget
+    
+    def trackTile(self, width, height, rgba, dpr=1.0):
+        """Возвращает фрагмент дорожки скроллбара цвета rgba (значение ARGB)"""
+        key = ("track", width, height, rgba, dpr)
+        return self._lookup(key, lambda: self._renderTrack(width, height, rgba, dpr))
+    
+    def handleSlices(self, thickness, radius, rgba, dpr=1.0, vertical=True):
+        """Возвращает исходный фрагмент ползунка для отрисовки по схеме nine-slice
+        
+        Фрагмент содержит оба закругленных конца и однопиксельную середину,
+        поэтому не зависит от длины ползунка и растеризуется один раз.
+        """
+        cap = math.ceil(radius)
+        if vertical:
+            width, height = thickness, 2 * cap + 1
+        else:
+            width, height = 2 * cap + 1, thickness
+        key = ("handle", thickness, radius, rgba, dpr, vertical)
+        return self._lookup(key, lambda: self._renderHandle(width, height, radius, rgba, dpr))
+    
+    @staticmethod
+    def drawHandle(painter, rect, slices, radius, vertical=True):
+        """Рисует ползунок произвольной длины из фрагмента handleSlices()
+        
+        Концы копируются как есть, а однопиксельная середина растягивается
+        на оставшуюся длину.
+        """
+        cap = math.ceil(radius)
+        length = rect.height() if vertical else rect.width()
+        middle = length - 2 * cap
+        
+        # Ползунок короче закругленных концов - просто масштабируем фрагмент
+        if middle < 0:
+            painter.drawPixmap(QRectF(rect), slices, QRectF(slices.rect()))
+            return
+        
+        # Координаты источника задаются в физических пикселях фрагмента
+        dpr = slices.devicePixelRatio()
+        thickness = (rect.width() if vertical else rect.height()) * dpr
+        x, y = rect.x(), rect.y()
+        
+        if vertical:
+            parts = [
+                (QRectF(x, y, rect.width(), cap), QRectF(0, 0, thickness, cap * dpr)),
+                (QRectF(x, y + cap, rect.width(), middle), QRectF(0, cap * dpr, thickness, dpr)),
+                (QRectF(x, y + cap + middle, rect.width(), cap), QRectF(0, (cap + 1) * dpr, thickness, cap * dpr))
+            ]
+        else:
+            parts = [
+                (QRectF(x, y, cap, rect.height()), QRectF(0, 0, cap * dpr, thickness)),
+                (QRectF(x + cap, y, middle, rect.height()), QRectF(cap * dpr, 0, dpr, thickness)),
+                (QRectF(x + cap + middle, y, cap, rect.height()), QRectF((cap + 1) * dpr, 0, cap * dpr, thickness))
+            ]
+        
+        for target, source in parts:
+            if target.width() > 0 and target.height() > 0:
+                painter.drawPixmap(target, slices, source)
+    
+    def clear(self):
+        """Очищает кэш"""
+        self._tiles.clear()
+        self._bytes = 0
+    
+    def getStats(self):
+        """Возвращает статистику использования кэша"""
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": (self._hits / total * 100) if total > 0 else 0,
+            "entries": len(self._tiles),
+            "bytes": self._bytes,
+            "memory_budget": self._memory_budget
+        }
+    
+    def resetStats(self):
+        """Сбрасывает статистику кэша"""
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    def _lookup(self, key, render):
+        """Возвращает фрагмент из кэша, отрисовывая его при промахе"""
+        pixmap = self._tiles.get(key)
+        if pixmap is not None:
+            self._hits += 1
+            self._tiles.move_to_end(key)
+            return pixmap
+        
+        self._misses += 1
+        pixmap = render()
+        self._tiles[key] = pixmap
+        self._bytes += self._pixmapBytes(pixmap)
+        self._evict()
+        return pixmap
+    
+    def _evict(self):
+        """Удаляет давно не использованные фрагменты сверх бюджета"""
+        while self._bytes > self._memory_budget and self._tiles:
+            _, pixmap = self._tiles.popitem(last=False)
+            self._bytes -= self._pixmapBytes(pixmap)
+            self._evictions += 1
+    
+    @staticmethod
+    def _pixmapBytes(pixmap):
+        """Оценивает объем памяти пиксмапа (ARGB32)"""
+        return pixmap.width() * pixmap.height() * 4
+    
+    @staticmethod
+    def _createPixmap(width, height, dpr):
+        """Создает прозрачный пиксмап в физическом разрешении"""
+        pixmap = QPixmap(math.ceil(width * dpr), math.ceil(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap
+    
+    @classmethod
+    def _renderTrack(cls, width, height, rgba, dpr):
+        """Отрисовывает фрагмент дорожки"""
+        pixmap = cls._createPixmap(width, height, dpr)
+        painter = QPainter(pixmap)
+        painter.fillRect(QRect(0, 0, width, height), QColor.fromRgba(rgba))
+        painter.end()
+        return pixmap
+    
+    @classmethod
+    def _renderHandle(cls, width, height, radius, rgba, dpr):
+        """Отрисовывает фрагмент ползунка"""
+        pixmap = cls._createPixmap(width, height, dpr)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor.fromRgba(rgba))
+        painter.drawRoundedRect(QRect(0, 0, width, height), radius, radius)
+        painter.end()
+        return pixmap
+
+
+class ScrollBarPaintStats:
+    """Замеры отрисовки одного скроллбара (заполняются только при включенных замерах)"""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Сбрасывает замеры"""
+        self.paints = 0
+        self.renders = 0
+        self.paint_time_ns = 0
+        self.max_paint_time_ns = 0
+        self.pixmaps = ()
+    
+    def recordPaint(self, elapsed_ns):
+        """Учитывает одну отрисовку длительностью elapsed_ns"""
+        self.paints += 1
+        self.paint_time_ns += elapsed_ns
+        if elapsed_ns > self.max_paint_time_ns:
+            self.max_paint_time_ns = elapsed_ns
+    
+    def recordRender(self, pixmaps):
+        """Учитывает получение фрагментов и запоминает используемые пиксмапы"""
+        self.renders += 1
+        self.pixmaps = tuple(pixmap for pixmap in pixmaps if pixmap is not None)
+    
+    def pixmapBytes(self):
+        """Возвращает объем пиксмапов, используемых скроллбаром (байт)"""
+        return sum(ScrollBarPixmapCache._pixmapBytes(pixmap) for pixmap in self.pixmaps)
+    
+    def toDict(self):
+        """Возвращает замеры в виде словаря"""
+        return {
+            "paints": self.paints,
+            "renders": self.renders,
+            "total_paint_us": self.paint_time_ns / 1000,
+            "avg_paint_us": (self.paint_time_ns / self.paints / 1000) if self.paints > 0 else 0,
+            "max_paint_us": self.max_paint_time_ns / 1000,
+            "pixmap_bytes": self.pixmapBytes()
+        }
+
+
+class ScrollBarRegistry:
+    """Реестр всех живых скроллбаров процесса
+    
+    BaseScrollBar и GraphicsViewScrollBar регистрируются при создании в слабом
+    множестве, поэтому реестр не продлевает им жизнь, а число живых экземпляров
+    подходит для поиска утечек. Массовые setTheme() и setAlpha() не применяются
+    сразу: изменения накапливаются и применяются одним проходом по таймеру
+    с нулевой задержкой, так что каждый скроллбар один раз пересчитывает цвета
+    и перерисовывается в том же кадре, что и остальные.
+    """
+    
+    _scroll_bars = weakref.WeakSet()
+    
+    # Отложенные изменения стиля (слабая ссылка -> параметры applyStyle).
+    # Ключ - сама слабая ссылка, а не id(): после сборки скроллбара его id
+    # может достаться новому, а мертвая ссылка равна только самой себе
+    _pending = {}
+    _flush_pending = False
+    
+    # Статистика массовых операций
+    _requested = 0
+    _applied = 0
+    _flushes = 0
+    
+    @classmethod
+    def register(cls, scroll_bar):
+        """Регистрирует скроллбар"""
+        cls._scroll_bars.add(scroll_bar)
+    
+    @classmethod
+    def liveScrollBars(cls):
+        """Возвращает список живых зарегистрированных скроллбаров"""
+        return cls._collect()[0]
+    
+    @classmethod
+    def _collect(cls):
+        """Возвращает живые скроллбары и количество оберток удаленных объектов Qt"""
+        scroll_bars = []
+        deleted = 0
+        for scroll_bar in list(cls._scroll_bars):
+            try:
+                scroll_bar.isVisible()
+            except RuntimeError:
+                # Объект Qt уже удален, а обертка Python еще жива
+                deleted += 1
+                continue
+            scroll_bars.append(scroll_bar)
+        return scroll_bars, deleted
+    
+    @classmethod
+    def liveCounts(cls):
+        """Возвращает количество живых скроллбаров по классам
+        
+        deleted_wrappers - обертки Python, пережившие свой объект Qt
+        (на них кто-то держит ссылку).
+        """
+        scroll_bars, deleted = cls._collect()
+        by_class = {}
+        for scroll_bar in scroll_bars:
+            name = type(scroll_bar).__name__
+            by_class[name] = by_class.get(name, 0) + 1
+        return {
+            "total": len(scroll_bars),
+            "by_class": by_class,
+            "deleted_wrappers": deleted
+        }
+    
+    @classmethod
+    def setTheme(cls, use_dark_theme, scroll_bars=None):
+        """Планирует смену темы скроллбаров (по умолчанию всех живых)"""
+        cls._schedule(scroll_bars, {"use_dark_theme": bool(use_dark_theme)})
+    
+    @classmethod
+    def setAlpha(cls, bg_alpha=None, handle_alpha=None, hover_alpha=None, pressed_alpha=None,
+                 scroll_bars=None):
+        """Планирует изменение прозрачности скроллбаров (None - без изменений)"""
+        alphas = {"bg_alpha": bg_alpha, "handle_alpha": handle_alpha,
+                  "hover_alpha": hover_alpha, "pressed_alpha": pressed_alpha}
+        cls._schedule(scroll_bars, {name: alpha for name, alpha in alphas.items() if alpha is not None})
+    
+    @classmethod
+    def _schedule(cls, scroll_bars, changes):
+        """Добавляет изменения стиля к ожидающим применения"""
+        if scroll_bars is None:
+            scroll_bars = cls.liveScrollBars()
+        for scroll_bar in scroll_bars:
+            cls._requested += 1
+            ref = weakref.ref(scroll_bar)
+            entry = cls._pending.get(ref)
+            if entry is None:
+                cls._pending[ref] = dict(changes)
+            else:
+                entry.update(changes)
+        
+        # Таймер запускается один раз на проход, а не на каждый скроллбар
+        if cls._pending and not cls._flush_pending:
+            cls._flush_pending = True
+            QTimer.singleShot(0, cls._flush)
+    
+    @classmethod
+    def flush(cls):
+        """Немедленно применяет ожидающие изменения стиля"""
+        cls._flush()
+    
+    @classmethod
+    def _flush(cls):
+        """Применяет все накопленные изменения стиля одним проходом"""
+        cls._flush_pending = False
+        if not cls._pending:
+            return
+        
+        pending = cls._pending
+        cls._pending = {}
+        cls._flushes += 1
+        
+        owners = {}
+        for ref, changes in pending.items():
+            scroll_bar = ref()
+            if scroll_bar is None:
+                continue
+            try:
+                scroll_bar.applyStyle(**changes)
+            except RuntimeError:
+                # Скроллбар был удален до прохода
+                continue
+            cls._applied += 1
+            
+            owner = scroll_bar._style_owner() if scroll_bar._style_owner is not None else None
+            if owner is not None:
+                owners.setdefault(owner, {}).update(changes)
+        
+        # Владельцы запоминают новый стиль, иначе их собственная смена темы
+        # или созданные ими скроллбары вернули бы прежний
+        for owner, changes in owners.items():
+            try:
+                owner._styleApplied(changes)
+            except RuntimeError:
+                continue
+    
+    @classmethod
+    def pauseAnimations(cls):
+        """Приостанавливает анимации прозрачности и скрытие всех скроллбаров"""
+        ScrollBarAnimationEngine.instance().pause()
+    
+    @classmethod
+    def resumeAnimations(cls):
+        """Продолжает приостановленные анимации"""
+        ScrollBarAnimationEngine.instance().resume()
+    
+    @classmethod
+    def isAnimationsPaused(cls):
+        """Проверяет, приостановлены ли анимации"""
+        return ScrollBarAnimationEngine.instance().isPaused()
+    
+    @classmethod
+    def getStats(cls):
+        """Возвращает статистику массовых операций"""
+        return {
+            "requested": cls._requested,
+            "applied": cls._applied,
+            "flushes": cls._flushes,
+            "pending": len(cls._pending)
+        }
+    
+    @classmethod
+    def resetStats(cls):
+        """Сбрасывает статистику массовых операций"""
+        cls._requested = 0
+        cls._applied = 0
+        cls._flushes = 0
+
+
+class ScrollBarInstrumentation:
+    """Необязательные замеры отрисовки всех скроллбаров процесса
+    
+    По умолчанию выключены: paintEvent только проверяет атрибут класса
+    enabled и не обращается к таймеру. Замеры всех живых скроллбаров из
+    ScrollBarRegistry собираются одним вызовом aggregateStats().
+    """
+    
+    enabled = False
+    
+    @classmethod
+    def setEnabled(cls, enabled):
+        """Включает или выключает замеры отрисовки"""
+        cls.enabled = bool(enabled)
+    
+    @classmethod
+    def isEnabled(cls):
+        """Возвращает True, если замеры включены"""
+        return cls.enabled
+    
+    @classmethod
+    def aggregateStats(cls):
+        """Возвращает суммарные замеры всех живых скроллбаров
+        
+        pixmap_bytes суммирует объем по экземплярам, а unique_pixmap_bytes
+        учитывает разделяемые фрагменты общего кэша один раз.
+        """
+        scroll_bars = ScrollBarRegistry.liveScrollBars()
+        paints = renders = paint_time_ns = max_paint_time_ns = pixmap_bytes = 0
+        unique_pixmaps = {}
+        for scroll_bar in scroll_bars:
+            stats = scroll_bar._paint_stats
+            paints += stats.paints
+            renders += stats.renders
+            paint_time_ns += stats.paint_time_ns
+            max_paint_time_ns = max(max_paint_time_ns, stats.max_paint_time_ns)
+            pixmap_bytes += stats.pixmapBytes()
+            for pixmap in stats.pixmaps:
+                unique_pixmaps[pixmap.cacheKey()] = pixmap
+        
+        return {
+            "enabled": cls.enabled,
+            "instances": len(scroll_bars),
+            "paints": paints,
+            "renders": renders,
+            "total_paint_us": paint_time_ns / 1000,
+            "avg_paint_us": (paint_time_ns / paints / 1000) if paints > 0 else 0,
+            "max_paint_us": max_paint_time_ns / 1000,
+            "pixmap_bytes": pixmap_bytes,
+            "unique_pixmap_bytes": sum(ScrollBarPixmapCache._pixmapBytes(pixmap)
+                                       for pixmap in unique_pixmaps.values())
+        }
+    
+    @classmethod
+    def resetStats(cls):
+        """Сбрасывает замеры всех живых скроллбаров"""
+        for scroll_bar in ScrollBarRegistry.liveScrollBars():
+            scroll_bar._paint_stats.reset()
+
+
+class ScrollBarTracer:
+    """Запись интервалов работы скроллбаров для просмотра в trace viewer
+    
+    По умолчанию выключена: отслеживаемые методы только проверяют атрибут
+    класса enabled. При включении интервалы (_updateScrollBars, отрисовка,
+    получение фрагментов, кадры движка анимаций, фильтры событий) пишутся
+    в кольцевой буфер фиксированного размера, старые записи вытесняются.
+    Буфер экспортируется в формате Chrome trace JSON (chrome://tracing,
+    Perfetto). Время берется из time.perf_counter_ns(), поэтому интервалы
+    приложения, записанные через span() или record(), совпадают по шкале.
+    """
+    
+    enabled = False
+    
+    # Размер кольцевого буфера по умолчанию (записей)
+    DEFAULT_CAPACITY = 10000
+    
+    _events = deque(maxlen=DEFAULT_CAPACITY)
+    _recorded = 0
+    
+    @classmethod
+    def setEnabled(cls, enabled, capacity=None):
+        """Включает или выключает запись; capacity задает размер буфера"""
+        if capacity is not None:
+            cls.setCapacity(capacity)
+        cls.enabled = bool(enabled)
+    
+    @classmethod
+    def isEnabled(cls):
+        """Возвращает True, если запись включена"""
+        return cls.enabled
+    
+    @classmethod
+    def setCapacity(cls, capacity):
+        """Изменяет размер кольцевого буфера, сохраняя последние записи"""
+        cls._events = deque(cls._events, maxlen=max(1, int(capacity)))
+    
+    @classmethod
+    def capacity(cls):
+        """Возвращает размер кольцевого буфера"""
+        return cls._events.maxlen
+    
+    @classmethod
+    def clear(cls):
+        """Очищает буфер и счетчик записей"""
+        cls._events.clear()
+        cls._recorded = 0
+    
+    @staticmethod
+    def now():
+        """Возвращает время шкалы трассировки (нс)"""
+        return time.perf_counter_ns()
+    
+    @classmethod
+    def record(cls, name, category, start_ns, end_ns=None, owner=None, args=None):
+        """Записывает интервал [start_ns, end_ns] (по умолчанию до текущего момента)
+        
+        owner - объект, выполнявший работу: в экспорт попадают имя его класса
+        и адрес, чтобы отличать экземпляры.
+        """
+        if end_ns is None:
+            end_ns = time.perf_counter_ns()
+        owner_info = None if owner is None else (type(owner).__name__, id(owner))
+        cls._events.append((name, category, start_ns, end_ns - start_ns,
+                            threading.get_ident(), owner_info, args))
+        cls._recorded += 1
+    
+    @classmethod
+    @contextmanager
+    def span(cls, name, category="app", args=None):
+        """Контекстный менеджер для записи интервала приложения"""
+        if not cls.enabled:
+            yield
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            cls.record(name, category, start, args=args)
+    
+    @classmethod
+    def getStats(cls):
+        """Возвращает заполнение буфера и количество вытесненных записей"""
+        return {
+            "enabled": cls.enabled,
+            "capacity": cls._events.maxlen,
+            "events": len(cls._events),
+            "recorded": cls._recorded,
+            "dropped": cls._recorded - len(cls._events)
+        }
+    
+    @classmethod
+    def chromeTrace(cls):
+        """Возвращает содержимое буфера в формате Chrome trace (словарь)"""
+        pid = os.getpid()
+        trace_events = []
+        for name, category, start_ns, duration_ns, tid, owner_info, args in list(cls._events):
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start_ns / 1000,
+                "dur": duration_ns / 1000,
+                "pid": pid,
+                "tid": tid
+            }
+            event_args = dict(args) if args else {}
+            if owner_info is not None:
+                event_args["object"] = f"{owner_info[0]}@{owner_info[1]:#x}"
+            if event_args:
+                event["args"] = event_args
+            trace_events.append(event)
+        
+        return {
+            "traceEvents": trace_events,
+            "displayTimeUnit": "ms",
+            "otherData": {"clock": "perf_counter", "dropped_events": cls._recorded - len(cls._events)}
+        }
+    
+    @classmethod
+    def exportChromeTrace(cls, destination):
+        """Сохраняет буфер в файл Chrome trace JSON
+        
+        destination - путь к файлу или открытый текстовый файл.
+        """
+        trace = cls.chromeTrace()
+        if hasattr(destination, "write"):
+            json.dump(trace, destination)
+        else:
+            with open(destination, "w", encoding="utf-8") as trace_file:
+                json.dump(trace, trace_file)
+        return len(trace["traceEvents"])
+
+
 class BaseScrollBar(QScrollBar):
     """Базовый класс для прозрачных скроллбаров с общей функциональностью"""
     
+    # Логическая позиция (int или float произвольной величины)
+    logicalValueChanged = pyqtSignal(object)
+    
+    # Разрешение целочисленного диапазона QScrollBar в логическом режиме
+    LOGICAL_RESOLUTION = 1 << 30
+    
     def __init__(self, orientation, bg_alpha=30, handle_alpha=80, 
                  hover_alpha=120, pressed_alpha=160,
                  scroll_bar_width=8, use_dark_theme=False,
-                 auto_hide=True, show_duration=300, hide_duration=1000, hide_delay=1000):
+                 auto_hide=True, show_duration=300, hide_duration=1000, hide_delay=1000,
+                 quantize_repaints=False, opacity_levels=0):
         super().__init__(orientation)
         
         # Устанавливаем ориентацию
@@ -54,6 +755,13 @@ class BaseScrollBar(QScrollBar):
         # Значение прозрачности для анимации (от 0 до 1)
         self._opacity = 1.0
         
+        # Квантование прозрачности: при opacity_levels > 0 прозрачность
+        # отображается одним из N уровней, а кадры анимации с тем же
+        # уровнем не перерисовываются
+        self._opacity_levels = opacity_levels
+        self._opacity_level = None
+        self._skipped_opacity_repaints = 0
+        
         # Устанавливаем тему
         self.use_dark_theme = use_dark_theme
         
@@ -86,15 +794,46 @@ class BaseScrollBar(QScrollBar):
         self._cache_hits = 0
         self._cache_misses = 0
         
+        # Перерисовка при изменении значения только при сдвиге ползунка на пиксель
+        self._quantized_repaint = quantize_repaints
+        self._suppressed_repaints = 0
+        
+        # Статистика композиции: число отрисовок и отрисованных пикселей
+        self._paint_count = 0
+        self._composited_pixels = 0
+        
+        # Замеры времени отрисовки (только при ScrollBarInstrumentation.enabled)
+        self._paint_stats = ScrollBarPaintStats()
+        ScrollBarRegistry.register(self)
+        
+        # Слабая ссылка на владельца (OverlayScrollArea), которому реестр
+        # сообщает о массовой смене стиля, чтобы его настройки не устарели
+        self._style_owner = None
+        
+        # Логический диапазон (minimum, maximum, page_step) для содержимого,
+        # не помещающегося в int QScrollBar; None - обычный режим
+        self._logical_range = None
+        self._logical_value = 0
+        self._logical_single_step = 0
+        # Обычный диапазон (minimum, maximum, page_step, single_step, value)
+        # до включения логического, восстанавливается при отключении
+        self._native_range = None
+        self._setting_logical = False
+        
         # Соединяем сигналы, которые влияют на геометрию ползунка
-        self.valueChanged.connect(self._invalidateCache)
+        self.valueChanged.connect(self._onValueChanged)
         self.rangeChanged.connect(self._invalidateCache)
+        self.actionTriggered.connect(self._onActionTriggered)
+        self.sliderMoved.connect(self._onSliderMoved)
         
-        # Кэширование рендеринга
+        # Кэширование рендеринга (ссылки на фрагменты общего кэша)
         self._pixmap_cache = None
         self._pixmap_cache_dirty = True
         self._last_state = None
         
+        # Окно, на смену экрана которого подписан скроллбар
+        self._screen_window = None
+        
         # Менеджер анимаций
         self.animation_manager = ScrollBarAnimationManager(
             self, auto_hide, show_duration, hide_duration, hide_delay
@@ -115,31 +854,332 @@ class BaseScrollBar(QScrollBar):
         self._cached_params = None
         self._cached_ratios = None
     
+    def _onValueChanged(self, value):
+        """Обработка изменения значения скроллбара"""
+        # Прямоугольник ползунка уже пересчитан в sliderChange. В режиме
+        # квантования пиксмап помечается устаревшим только при сдвиге ползунка
+        if not self._quantized_repaint:
+            self._pixmap_cache_dirty = True
+        
+        # Значение изменено пользователем (перетаскивание, колесо, клавиши)
+        if self._logical_range is not None and not self._setting_logical:
+            self.logicalValueChanged.emit(self._logical_value)
+    
+    def _onSliderMoved(self, position):
+        """Перерисовка ползунка при перетаскивании без отслеживания
+        
+        При выключенном tracking значение не меняется до отпускания кнопки,
+        поэтому ползунок перерисовывается по sliderPosition().
+        """
+        if not self.hasTracking():
+            self._repaintHandle()
+    
+    def _isDeferredDrag(self):
+        """Проверяет, отстает ли значение от положения перетаскиваемого ползунка"""
+        return not self.hasTracking() and self.isSliderDown()
+    
+    def setLogicalRange(self, minimum, maximum, page_step=0, single_step=None):
+        """Включает логический диапазон произвольной величины
+        
+        Целочисленный диапазон QScrollBar используется только как прокси
+        с разрешением LOGICAL_RESOLUTION, а геометрия ползунка вычисляется
+        по логическим значениям. Позиция доступна через logicalValue()
+        и сигнал logicalValueChanged.
+        
+        Args:
+            minimum: Начало диапазона (int или float)
+            maximum: Конец диапазона (int или float)
+            page_step: Размер видимой части содержимого
+            single_step: Шаг прокрутки колесом и клавишами (по умолчанию
+                десятая часть страницы)
+        """
+        maximum = max(minimum, maximum)
+        if single_step is None:
+            # Целочисленный диапазон сохраняет целочисленный шаг: деление
+            # больших int через / теряет точность и переполняет float
+            integral = all(isinstance(bound, int) for bound in (minimum, maximum, page_step))
+            if page_step > 0:
+                single_step = page_step // 10 if integral else page_step / 10
+            else:
+                span = maximum - minimum
+                single_step = span // 1000 if integral else span / 1000
+        if self._logical_range is None:
+            self._native_range = (self.minimum(), self.maximum(), self.pageStep(),
+                                  self.singleStep(), self.value())
+        self._logical_range = (minimum, maximum, page_step)
+        self._logical_single_step = single_step
+        self._logical_value = min(max(self._logical_value, minimum), maximum)
+        
+        span = maximum - minimum
+        resolution = self.LOGICAL_RESOLUTION if span > 0 else 0
+        self._setting_logical = True
+        try:
+            self.setRange(0, resolution)
+            self.setPageStep(self._logicalToProxyStep(page_step))
+            self.setSingleStep(max(1, self._logicalToProxyStep(single_step)))
+            self.setValue(self._logicalToProxy(self._logical_value))
+        finally:
+            self._setting_logical = False
+        self._invalidateCache()
+        self.update()
+    
+    def clearLogicalRange(self):
+        """Возвращает скроллбар к обычному целочисленному диапазону
+        
+        Восстанавливает диапазон, шаги и значение, которые были у скроллбара
+        до setLogicalRange, вместо прокси-диапазона 0..LOGICAL_RESOLUTION.
+        """
+        if self._logical_range is None:
+            return
+        self._logical_range = None
+        self._logical_value = 0
+        minimum, maximum, page_step, single_step, value = self._native_range
+        self._native_range = None
+        self.setRange(minimum, maximum)
+        self.setPageStep(page_step)
+        self.setSingleStep(single_step)
+        self.setValue(value)
+        self._invalidateCache()
+        self.update()
+    
+    def hasLogicalRange(self):
+        """Проверяет, включен ли логический диапазон"""
+        return self._logical_range is not None
+    
+    def logicalMinimum(self):
+        """Возвращает начало логического диапазона"""
+        return self._logical_range[0] if self._logical_range is not None else self.minimum()
+    
+    def logicalMaximum(self):
+        """Возвращает конец логического диапазона"""
+        return self._logical_range[1] if self._logical_range is not None else self.maximum()
+    
+    def logicalPageStep(self):
+        """Возвращает размер страницы в логических единицах"""
+        return self._logical_range[2] if self._logical_range is not None else self.pageStep()
+    
+    def logicalSingleStep(self):
+        """Возвращает шаг прокрутки в логических единицах"""
+        return self._logical_single_step if self._logical_range is not None else self.singleStep()
+    
+    def logicalValue(self):
+        """Возвращает точную логическую позицию"""
+        return self._logical_value if self._logical_range is not None else self.value()
+    
+    def setLogicalValue(self, value):
+        """Устанавливает логическую позицию без потери точности"""
+        if self._logical_range is None:
+            self.setValue(int(value))
+            return
+        
+        minimum, maximum, _ = self._logical_range
+        value = min(max(value, minimum), maximum)
+        if value == self._logical_value:
+            return
+        
+        # Логическое значение сохраняется до изменения прокси, чтобы
+        # sliderChange пересчитал ползунок уже по нему
+        self._logical_value = value
+        proxy = self._logicalToProxy(value)
+        self._setting_logical = True
+        try:
+            if proxy != self.value():
+                self.setValue(proxy)
+            else:
+                # Прокси не изменился, но ползунок мог сдвинуться
+                self._repaintHandle()
+        finally:
+            self._setting_logical = False
+        self.logicalValueChanged.emit(value)
+    
+    def _onActionTriggered(self, action):
+        """Выполняет шаги прокрутки в логических единицах
+        
+        Шаг прокси-диапазона может быть больше логического шага, поэтому
+        клавиши и щелчки по дорожке сдвигают логическую позицию напрямую,
+        а не через значение прокси.
+        """
+        if self._logical_range is None:
+            return
+        
+        _, _, page_step = self._logical_range
+        Action = QAbstractSlider.SliderAction
+        # Сигнал actionTriggered передает действие как int
+        action = Action(action)
+        if action == Action.SliderSingleStepAdd:
+            delta = self._logical_single_step
+        elif action == Action.SliderSingleStepSub:
+            delta = -self._logical_single_step
+        elif action == Action.SliderPageStepAdd:
+            delta = page_step
+        elif action == Action.SliderPageStepSub:
+            delta = -page_step
+        else:
+            # Перетаскивание и переход к краям переводятся через прокси
+            return
+        
+        minimum, maximum, _ = self._logical_range
+        if isinstance(minimum, int) and isinstance(maximum, int):
+            delta = round(delta)
+        
+        # Отменяем сдвиг прокси, выполненный QAbstractSlider
+        self.setSliderPosition(self.value())
+        self.setLogicalValue(self._logical_value + delta)
+    
+    def wheelEvent(self, event):
+        """Обработка прокрутки колесом
+        
+        В логическом режиме прокрутка выполняется в логических шагах:
+        QAbstractSlider ограничивает ее страницей прокси-диапазона, которая
+        на огромном содержимом может быть меньше одного шага.
+        """
+        if self._logical_range is None:
+            super().wheelEvent(event)
+            return
+        
+        angle = event.angleDelta()
+        degrees = angle.y() if angle.y() != 0 else angle.x()
+        if degrees == 0:
+            event.ignore()
+            return
+        
+        _, _, page_step = self._logical_range
+        if event.modifiers() & (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier):
+            step = page_step
+        else:
+            step = QApplication.wheelScrollLines() * self._logical_single_step
+        delta = -degrees / 120 * step
+        
+        minimum, maximum, _ = self._logical_range
+        if isinstance(minimum, int) and isinstance(maximum, int):
+            delta = round(delta)
+        self.setLogicalValue(self._logical_value + delta)
+        event.accept()
+    
+    def _logicalToProxy(self, value):
+        """Переводит логическую позицию в значение прокси-диапазона"""
+        minimum, maximum, _ = self._logical_range
+        if maximum <= minimum:
+            return 0
+        return round((value - minimum) / (maximum - minimum) * self.LOGICAL_RESOLUTION)
+    
+    def _logicalToProxyStep(self, step):
+        """Переводит логический шаг в шаг прокси-диапазона"""
+        minimum, maximum, _ = self._logical_range
+        if maximum <= minimum:
+            return 0
+        return min(self.LOGICAL_RESOLUTION,
+                   round(step / (maximum - minimum) * self.LOGICAL_RESOLUTION))
+    
+    def _logicalFromProxy(self, proxy):
+        """Переводит значение прокси-диапазона в логическую позицию"""
+        minimum, maximum, _ = self._logical_range
+        # Целочисленный диапазон остается целочисленным без потери точности
+        if isinstance(minimum, int) and isinstance(maximum, int):
+            return minimum + (maximum - minimum) * proxy // self.LOGICAL_RESOLUTION
+        return minimum + (maximum - minimum) * proxy / self.LOGICAL_RESOLUTION
+    
+    def sliderChange(self, change):
+        """Обработка изменения параметров слайдера
+        
+        При изменении значения перерисовывается только область старого и нового
+        положения ползунка. В режиме квантования перерисовки изменение значения,
+        не сдвинувшее ползунок ни на один пиксель, не вызывает update() и не
+        перегенерирует пиксмап.
+        """
+        if change != QAbstractSlider.SliderChange.SliderValueChange:
+            super().sliderChange(change)
+            return
+        
+        # Значение прокси изменено пользователем - переводим его в логическую позицию
+        if self._logical_range is not None and not self._setting_logical:
+            self._logical_value = self._logicalFromProxy(self.value())
+        
+        self._repaintHandle()
+    
+    def _repaintHandle(self):
+        """Перерисовывает область старого и нового положения ползунка"""
+        # sliderChange вызывается до сигнала valueChanged, поэтому пересчитываем сами
+        old_rect = None if self._cache_dirty else self._cached_slider_rect
+        self._cache_dirty = True
+        new_rect = self._calculateSliderRect()
+        
+        # Без известного старого положения перерисовываем виджет целиком
+        if old_rect is None:
+            self.update()
+            return
+        
+        if new_rect == old_rect and self._quantized_repaint:
+            self._suppressed_repaints += 1
+            return
+        
+        self._pixmap_cache_dirty = True
+        # Запас в пиксель на сглаживание закругленных углов
+        self.update(old_rect.united(new_rect).adjusted(-1, -1, 1, 1))
+    
+    def setQuantizedRepaint(self, enabled):
+        """Включает перерисовку только при сдвиге ползунка хотя бы на пиксель"""
+        self._quantized_repaint = bool(enabled)
+        self._invalidateCache()
+    
+    def isQuantizedRepaint(self):
+        """Возвращает True, если включено квантование перерисовки"""
+        return self._quantized_repaint
+    
     def _initColors(self):
         """Инициализирует цвета скроллбара на основе темы"""
         theme = ScrollBarThemeManager.get_theme_colors(self.use_dark_theme)
         
-        # Базовые цвета
-        self._bg_color = QColor(theme["bg_color"])
-        self._handle_color = QColor(theme["handle_color"])
-        self._hover_color = QColor(theme["hover_color"])
-        self._pressed_color = QColor(theme["pressed_color"])
-        
-        # Применяем прозрачность
-        self._bg_color.setAlpha(self._bg_alpha)
-        self._handle_color.setAlpha(self._handle_alpha)
-        self._hover_color.setAlpha(self._hover_alpha)
-        self._pressed_color.setAlpha(self._pressed_alpha)
+        # Общая палитра с примененной прозрачностью (цвета не копируются)
+        self._palette = ScrollBarPalette.get(theme, self._bg_alpha, self._handle_alpha,
+                                             self._hover_alpha, self._pressed_alpha)
         
         # Инвалидируем кэш пиксмапа при изменении цветов
         self._pixmap_cache_dirty = True
     
+    # Копии цветов палитры. Отрисовка их не использует: в кэш пиксмапов
+    # передаются значения ARGB палитры, поэтому кадры не создают QColor
+    @property
+    def _bg_color(self):
+        return self._palette.bg_color
+    
+    @property
+    def _handle_color(self):
+        return self._palette.handle_color
+    
+    @property
+    def _hover_color(self):
+        return self._palette.hover_color
+    
+    @property
+    def _pressed_color(self):
+        return self._palette.pressed_color
+    
     def setTheme(self, use_dark_theme):
         """Изменение темы скроллбара"""
         self.use_dark_theme = use_dark_theme
         self._initColors()
         self.update()
     
+    def applyStyle(self, use_dark_theme=None, bg_alpha=None, handle_alpha=None,
+                   hover_alpha=None, pressed_alpha=None):
+        """Изменяет тему и прозрачность с одним пересчетом цветов и перерисовкой
+        
+        Параметры со значением None не изменяются.
+        """
+        if use_dark_theme is not None:
+            self.use_dark_theme = use_dark_theme
+        if bg_alpha is not None:
+            self._bg_alpha = bg_alpha
+        if handle_alpha is not None:
+            self._handle_alpha = handle_alpha
+        if hover_alpha is not None:
+            self._hover_alpha = hover_alpha
+        if pressed_alpha is not None:
+            self._pressed_alpha = pressed_alpha
+        self._initColors()
+        self.update()
+    
     def opacity(self):
         """Геттер для свойства прозрачности"""
         return self._opacity
@@ -147,8 +1187,39 @@ class BaseScrollBar(QScrollBar):
     def setOpacity(self, opacity):
         """Установка прозрачности скроллбара (0.0 - 1.0)"""
         self._opacity = max(0.0, min(1.0, opacity))
+        
+        # Перерисовываем только при смене квантованного уровня прозрачности
+        if self._opacity_levels > 0:
+            level = round(self._opacity * self._opacity_levels)
+            if level == self._opacity_level:
+                self._skipped_opacity_repaints += 1
+                return
+            self._opacity_level = level
+        
         self.update()
     
+    def setOpacityLevels(self, levels):
+        """Устанавливает число уровней прозрачности (0 - без квантования)
+        
+        При квантовании фрагменты ползунка для каждого уровня берутся из общего
+        кэша с уже примененной прозрачностью, поэтому при выводе не требуется
+        попиксельное умножение на прозрачность.
+        """
+        self._opacity_levels = max(0, int(levels))
+        self._opacity_level = None
+        self._pixmap_cache_dirty = True
+        self.setOpacity(self._opacity)
+    
+    def opacityLevels(self):
+        """Возвращает число уровней прозрачности"""
+        return self._opacity_levels
+    
+    def _displayOpacity(self):
+        """Возвращает прозрачность, с которой скроллбар выводится на экран"""
+        if self._opacity_levels > 0:
+            return round(self._opacity * self._opacity_levels) / self._opacity_levels
+        return self._opacity
+    
     # Определяем свойство для анимации
     opacity = pyqtProperty(float, opacity, setOpacity)
     
@@ -163,14 +1234,30 @@ class BaseScrollBar(QScrollBar):
             self._calculateSliderRect(),
             self._mouse_pressed,
             self._mouse_over,
-            self._opacity,
-            self.use_dark_theme
+            self._opacity_level,
+            self.use_dark_theme,
+            self.devicePixelRatioF()
         )
     
     def paintEvent(self, event):
         """Отрисовка скроллбара с кастомным стилем"""
+        if not (ScrollBarInstrumentation.enabled or ScrollBarTracer.enabled):
+            self._paintScrollBar(event)
+            return
+        
+        start = time.perf_counter_ns()
+        self._paintScrollBar(event)
+        end = time.perf_counter_ns()
+        if ScrollBarInstrumentation.enabled:
+            self._paint_stats.recordPaint(end - start)
+        if ScrollBarTracer.enabled:
+            ScrollBarTracer.record("paintEvent", "paint", start, end, self)
+    
+    def _paintScrollBar(self, event):
+        """Рисует скроллбар из фрагментов общего кэша"""
         # Если полностью прозрачный, не рисуем ничего
-        if self._opacity <= 0.01:
+        opacity = self._displayOpacity()
+        if opacity <= 0.01:
             return
             
         # Получаем текущее состояние
@@ -179,68 +1266,90 @@ class BaseScrollBar(QScrollBar):
         # Проверяем, нужно ли обновить кэш
         if self._pixmap_cache_dirty or self._pixmap_cache is None or self._last_state != current_state:
             # Определяем цвет ползунка в зависимости от состояния
-            if self._mouse_pressed:
-                handle_color = self._pressed_color
-            elif self._mouse_over:
-                handle_color = self._hover_color
-            else:
-                handle_color = self._handle_color
+            handle_rgba = self._palette.handleRgba(self._mouse_pressed, self._mouse_over)
             
-            # Рендерим виджет в пиксмап только если нужно отображать
-            self._pixmap_cache = self._renderToPixmap(handle_color)
+            # Получаем фрагменты из общего кэша только если нужно отображать
+            if ScrollBarTracer.enabled:
+                start = time.perf_counter_ns()
+                self._pixmap_cache = self._renderToPixmap(handle_rgba)
+                ScrollBarTracer.record("_renderToPixmap", "paint", start, owner=self)
+            else:
+                self._pixmap_cache = self._renderToPixmap(handle_rgba)
             self._pixmap_cache_dirty = False
             self._last_state = current_state
+            if ScrollBarInstrumentation.enabled:
+                self._paint_stats.recordRender(self._pixmap_cache)
+        
+        # Рисуем только открытую область
+        exposed = event.rect()
+        self._paint_count += 1
+        self._composited_pixels += exposed.width() * exposed.height()
+        
+        track_pixmap, handle_slices = self._pixmap_cache
+        if track_pixmap is None:
+            return
         
-        # Рисуем кэшированное изображение с учетом прозрачности
         painter = QPainter(self)
-        painter.setOpacity(self._opacity)
-        painter.drawPixmap(0, 0, self._pixmap_cache)
+        painter.setClipRect(exposed)
+        # Фрагмент дорожки один на размер и хранится без прозрачности уровня
+        painter.setOpacity(opacity)
+        painter.drawPixmap(0, 0, track_pixmap)
+        # При квантовании прозрачность уже учтена во фрагменте ползунка
+        if self._opacity_levels > 0:
+            painter.setOpacity(1.0)
+        if handle_slices is not None:
+            handle_rect = self._calculateSliderRect()
+            ScrollBarPixmapCache.drawHandle(painter, handle_rect, handle_slices,
+                                            self._handleRadius(handle_rect),
+                                            self._orientation == Qt.Orientation.Vertical)
+    
+    @staticmethod
+    def _handleRadius(handle_rect):
+        """Радиус закругления углов (пропорционально размеру ползунка)"""
+        return min(4, min(handle_rect.width(), handle_rect.height()) / 2)
     
-    def _renderToPixmap(self, handle_color):
-        """Отрисовывает скроллер в QPixmap для кэширования"""
+    def _renderToPixmap(self, handle_rgba):
+        """Получает фрагменты дорожки и ползунка из общего кэша пиксмапов
+        
+        Возвращает пару (дорожка, фрагмент ползунка для nine-slice). Пиксмапы
+        разделяются всеми скроллбарами с одинаковыми размерами и цветами,
+        а фрагмент ползунка не зависит от его длины. Цвет ползунка
+        handle_rgba передается как значение ARGB палитры.
+        """
         # Получаем размеры скроллбара
         size = self.size()
         
-        # Оптимизация: если размер слишком маленький, нет смысла кэшировать
+        # Оптимизация: если размер слишком маленький, нет смысла отрисовывать
         if size.width() <= 1 or size.height() <= 1:
-            return QPixmap()
-            
-        # Создаем пиксмап размером с виджет
-        pixmap = QPixmap(size)
-        pixmap.fill(Qt.GlobalColor.transparent)  # Прозрачный фон
+            return (None, None)
         
-        # Создаем QPainter для рисования на пиксмапе
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        cache = ScrollBarPixmapCache.instance()
+        dpr = self.devicePixelRatioF()
         
-        # Получаем размеры скроллбара
-        rect = self.rect()
+        # При квантовании прозрачности берем фрагмент ползунка с уже примененным
+        # уровнем. Дорожка размером с виджет хранится один раз без прозрачности
+        # уровня, чтобы уровни не вытесняли из бюджета кэша фрагменты ползунков
+        if self._opacity_levels > 0:
+            handle_rgba = ScrollBarPalette.faded(handle_rgba, self._displayOpacity())
         
-        # Рисуем фон скроллбара
-        painter.fillRect(rect, self._bg_color)
+        # Фрагмент дорожки размером с виджет
+        track_pixmap = cache.trackTile(size.width(), size.height(),
+                                       self._palette.rgba[ScrollBarPalette.BG], dpr)
         
         # Получаем размеры и положение ползунка
         handle_rect = self._calculateSliderRect()
         
         # Проверка размеров ползунка - если слишком маленький, пропускаем отрисовку
         if handle_rect.width() <= 1 or handle_rect.height() <= 1:
-            painter.end()
-            return pixmap
+            return (track_pixmap, None)
         
-        # Рисуем ползунок с закругленными углами
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(handle_color)
-        
-        # Радиус закругления углов (пропорционально размеру ползунка)
-        radius = min(4, min(handle_rect.width(), handle_rect.height()) / 2)
+        # Толщина ползунка поперек направления прокрутки
+        vertical = self._orientation == Qt.Orientation.Vertical
+        thickness = handle_rect.width() if vertical else handle_rect.height()
         
-        # Рисуем закругленный прямоугольник
-        painter.drawRoundedRect(handle_rect, radius, radius)
-        
-        # Завершаем рисование
-        painter.end()
-        
-        return pixmap
+        handle_slices = cache.handleSlices(thickness, self._handleRadius(handle_rect),
+                                           handle_rgba, dpr, vertical)
+        return (track_pixmap, handle_slices)
     
     def _calculateSliderRect(self):
         """Вычисляет прямоугольник ползунка скроллбара"""
@@ -254,11 +1363,18 @@ class BaseScrollBar(QScrollBar):
         self._cache_misses += 1
         
         # Получаем основные параметры скроллбара эффективным способом
-        # (значения сразу, без получения их через методы)
-        min_val = self.minimum()
-        max_val = self.maximum()
-        page_step = self.pageStep()
-        value = self.value()
+        # (значения сразу, без получения их через методы). В логическом
+        # режиме геометрия вычисляется по точным логическим значениям
+        # При перетаскивании без отслеживания ползунок следует за sliderPosition()
+        deferred_drag = self._isDeferredDrag()
+        if self._logical_range is not None:
+            min_val, max_val, page_step = self._logical_range
+            value = self._logicalFromProxy(self.sliderPosition()) if deferred_drag else self._logical_value
+        else:
+            min_val = self.minimum()
+            max_val = self.maximum()
+            page_step = self.pageStep()
+            value = self.sliderPosition() if deferred_drag else self.value()
         width = self.width()
         height = self.height()
         
@@ -304,9 +1420,22 @@ class BaseScrollBar(QScrollBar):
             "hits": self._cache_hits,
             "misses": self._cache_misses,
             "total": total,
-            "hit_rate": hit_rate
+            "hit_rate": hit_rate,
+            "suppressed_repaints": self._suppressed_repaints,
+            "skipped_opacity_repaints": self._skipped_opacity_repaints,
+            "paints": self._paint_count,
+            "composited_pixels": self._composited_pixels,
+            "pixels_per_paint": (self._composited_pixels / self._paint_count) if self._paint_count > 0 else 0
         }
     
+    def getPaintStats(self):
+        """Возвращает замеры отрисовки (при включенном ScrollBarInstrumentation)"""
+        return self._paint_stats.toDict()
+    
+    def resetPaintStats(self):
+        """Сбрасывает замеры отрисовки"""
+        self._paint_stats.reset()
+    
     def _updateMouseState(self, event, is_pressed=None, is_over=None):
         """Обновляет состояние мыши и инвалидирует кэш если необходимо"""
         update_needed = False
@@ -364,6 +1493,503 @@ class BaseScrollBar(QScrollBar):
         super().resizeEvent(event)
         # Инвалидируем кэш при изменении размера
         self._invalidateCache()
+    
+    def showEvent(self, event):
+        """Обработка показа виджета"""
+        super().showEvent(event)
+        
+        # Подписываемся на смену экрана окна, чтобы перейти на фрагменты
+        # с новым devicePixelRatio
+        window = self.window().windowHandle()
+        if window is not None and window is not self._screen_window:
+            if self._screen_window is not None:
+                try:
+                    self._screen_window.screenChanged.disconnect(self._onScreenChanged)
+                except (RuntimeError, TypeError):
+                    pass
+            window.screenChanged.connect(self._onScreenChanged)
+            self._screen_window = window
+    
+    def _onScreenChanged(self, screen):
+        """Обработка перемещения окна на другой экран"""
+        self._pixmap_cache_dirty = True
+        self.update()
+
+
+class ScrollBarAnimationEngine:
+    """Общий для процесса движок анимаций прозрачности скроллбаров
+    
+    Все анимации и задержки скрытия продвигаются от одного таймера: пока есть
+    активные анимации, он срабатывает раз в кадр и выставляет прозрачность
+    всем скроллбарам за один проход, так что их перерисовки объединяются
+    в одну. Если остались только задержки, таймер взводится до ближайшей
+    из них, а без анимаций и задержек полностью остановлен.
+    
+    pause() замораживает анимации прозрачности и задержки скрытия (объекты
+    с атрибутом _pausable): они не продвигаются до resume(), после чего
+    продолжаются с того же места. Плавная прокрутка и остальные задержки
+    продолжают работать.
+    """
+    
+    # Интервал кадра анимации (мс)
+    FRAME_INTERVAL = 16
+    
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        """Возвращает единственный экземпляр движка"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self):
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        
+        # Единственный таймер движка
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+        
+        # Активные анимации и задержки (id -> объект, с сохранением порядка)
+        self._animations = {}
+        self._delays = {}
+        
+        # Приостановка анимаций прозрачности и задержек скрытия
+        self._paused = False
+        self._paused_at = 0
+        
+        # Статистика кадров
+        self._frames = 0
+        self._frame_time_ns = 0
+        self._max_frame_time_ns = 0
+        self._last_frame_time_ns = 0
+    
+    def now(self):
+        """Возвращает время движка (мс)"""
+        return self._clock.elapsed()
+    
+    def registerAnimation(self, animation):
+        """Добавляет анимацию в список продвигаемых"""
+        self._animations[id(animation)] = animation
+        self._reschedule()
+    
+    def unregisterAnimation(self, animation):
+        """Убирает анимацию из списка продвигаемых"""
+        if self._animations.pop(id(animation), None) is not None:
+            self._reschedule()
+    
+    def registerDelay(self, delay):
+        """Добавляет отложенный вызов"""
+        self._delays[id(delay)] = delay
+        self._reschedule()
+    
+    def unregisterDelay(self, delay):
+        """Убирает отложенный вызов"""
+        if self._delays.pop(id(delay), None) is not None:
+            self._reschedule()
+    
+    def activeAnimationCount(self):
+        """Возвращает количество выполняющихся анимаций"""
+        return len(self._animations)
+    
+    def pendingDelayCount(self):
+        """Возвращает количество ожидающих отложенных вызовов"""
+        return len(self._delays)
+    
+    def isTicking(self):
+        """Проверяет, взведен ли таймер движка"""
+        return self._timer.isActive()
+    
+    def pause(self):
+        """Приостанавливает анимации прозрачности и задержки скрытия"""
+        if self._paused:
+            return
+        self._paused = True
+        self._paused_at = self.now()
+        self._timer.stop()
+        self._reschedule()
+    
+    def resume(self):
+        """Продолжает приостановленные анимации с того же места"""
+        if not self._paused:
+            return
+        self._paused = False
+        
+        # Сдвигаем время начала и сроки на длительность паузы
+        offset = self.now() - self._paused_at
+        for animation in self._animations.values():
+            if animation._pausable:
+                animation._shiftTime(offset)
+        for delay in self._delays.values():
+            if delay._pausable:
+                delay._deadline += offset
+        self._reschedule()
+    
+    def isPaused(self):
+        """Проверяет, приостановлены ли анимации"""
+        return self._paused
+    
+    def _reschedule(self):
+        """Взводит таймер на следующий кадр или ближайшую задержку"""
+        if self._paused:
+            # Приостановленные объекты не требуют пробуждений
+            animations = any(not animation._pausable for animation in self._animations.values())
+            delays = [delay for delay in self._delays.values() if not delay._pausable]
+        else:
+            animations = self._animations
+            delays = self._delays.values()
+        
+        if animations:
+            interval = self.FRAME_INTERVAL
+        elif delays:
+            deadline = min(delay._deadline for delay in delays)
+            interval = max(0, deadline - self.now())
+        else:
+            self._timer.stop()
+            return
+        
+        # Не сдвигаем уже взведенный таймер, если он сработает раньше
+        if self._timer.isActive() and self._timer.remainingTime() <= interval:
+            return
+        self._timer.start(interval)
+    
+    def _tick(self):
+        """Продвигает все анимации и выполняет наступившие задержки"""
+        start = time.perf_counter_ns()
+        now = self.now()
+        
+        if self._animations:
+            for animation in list(self._animations.values()):
+                if self._paused and animation._pausable:
+                    continue
+                try:
+                    finished = animation._advance(now)
+                except RuntimeError:
+                    # Скроллбар был удален во время анимации
+                    finished = True
+                if finished:
+                    self._animations.pop(id(animation), None)
+                    animation._state = QAbstractAnimation.State.Stopped
+            
+            elapsed = time.perf_counter_ns() - start
+            if ScrollBarTracer.enabled:
+                ScrollBarTracer.record("animationTick", "animation", start, start + elapsed,
+                                       args={"animations": len(self._animations)})
+            self._frames += 1
+            self._frame_time_ns += elapsed
+            self._last_frame_time_ns = elapsed
+            self._max_frame_time_ns = max(self._max_frame_time_ns, elapsed)
+        
+        for delay in [d for d in self._delays.values()
+                      if d._deadline <= now and not (self._paused and d._pausable)]:
+            self._delays.pop(id(delay), None)
+            try:
+                delay._callback()
+            except RuntimeError:
+                # Владелец задержки был удален
+                continue
+        
+        self._reschedule()
+    
+    def getStats(self):
+        """Возвращает количество активных анимаций и стоимость кадра"""
+        average = (self._frame_time_ns / self._frames / 1000) if self._frames > 0 else 0
+        return {
+            "active_animations": len(self._animations),
+            "pending_delays": len(self._delays),
+            "paused": self._paused,
+            "frames": self._frames,
+            "avg_frame_us": average,
+            "max_frame_us": self._max_frame_time_ns / 1000,
+            "last_frame_us": self._last_frame_time_ns / 1000
+        }
+    
+    def resetStats(self):
+        """Сбрасывает статистику кадров"""
+        self._frames = 0
+        self._frame_time_ns = 0
+        self._max_frame_time_ns = 0
+        self._last_frame_time_ns = 0
+
+
+class ScrollBarOpacityAnimation:
+    """Анимация прозрачности скроллбара, продвигаемая общим движком
+    
+    Повторяет используемую часть интерфейса QPropertyAnimation, но не является
+    QObject и не создает собственного таймера.
+    """
+    
+    State = QAbstractAnimation.State
+    
+    # Замораживается при ScrollBarAnimationEngine.pause()
+    _pausable = True
+    
+    def __init__(self, target, duration=250, start_value=0.0, end_value=1.0,
+                 easing_curve=QEasingCurve.Type.Linear):
+        self._target = target
+        self._duration = duration
+        self._start_value = start_value
+        self._end_value = end_value
+        self._easing_curve = QEasingCurve(easing_curve)
+        self._start_time = 0
+        self._state = QAbstractAnimation.State.Stopped
+    
+    def setDuration(self, duration):
+        """Устанавливает длительность анимации (мс)"""
+        self._duration = duration
+    
+    def duration(self):
+        """Возвращает длительность анимации (мс)"""
+        return self._duration
+    
+    def setStartValue(self, value):
+        """Устанавливает начальную прозрачность"""
+        self._start_value = value
+    
+    def startValue(self):
+        """Возвращает начальную прозрачность"""
+        return self._start_value
+    
+    def setEndValue(self, value):
+        """Устанавливает конечную прозрачность"""
+        self._end_value = value
+    
+    def endValue(self):
+        """Возвращает конечную прозрачность"""
+        return self._end_value
+    
+    def setEasingCurve(self, easing_curve):
+        """Устанавливает кривую анимации"""
+        self._easing_curve = QEasingCurve(easing_curve)
+    
+    def easingCurve(self):
+        """Возвращает кривую анимации"""
+        return self._easing_curve
+    
+    def state(self):
+        """Возвращает состояние анимации"""
+        return self._state
+    
+    def start(self):
+        """Запускает анимацию с начального значения"""
+        engine = ScrollBarAnimationEngine.instance()
+        self._start_time = engine.now()
+        self._state = QAbstractAnimation.State.Running
+        self._target.setOpacity(self._start_value)
+        engine.registerAnimation(self)
+    
+    def stop(self):
+        """Останавливает анимацию на текущем значении"""
+        if self._state == QAbstractAnimation.State.Running:
+            self._state = QAbstractAnimation.State.Stopped
+            ScrollBarAnimationEngine.instance().unregisterAnimation(self)
+    
+    def _shiftTime(self, offset):
+        """Сдвигает время начала после паузы движка"""
+        self._start_time += offset
+    
+    def _advance(self, now):
+        """Выставляет прозрачность для момента now; возвращает True по завершении"""
+        if self._duration <= 0:
+            progress = 1.0
+        else:
+            progress = min(1.0, (now - self._start_time) / self._duration)
+        eased = self._easing_curve.valueForProgress(progress)
+        self._target.setOpacity(self._start_value + (self._end_value - self._start_value) * eased)
+        return progress >= 1.0
+
+
+class ScrollBarDelayTimer:
+    """Однократная задержка, отсчитываемая общим движком анимаций
+    
+    Повторяет используемую часть интерфейса однократного QTimer. Задержки
+    с pausable=True (таймеры скрытия) замораживаются ScrollBarAnimationEngine.pause().
+    """
+    
+    def __init__(self, callback, pausable=False):
+        self._callback = callback
+        self._deadline = 0
+        self._active = False
+        self._pausable = pausable
+    
+    def start(self, msec):
+        """Запускает (или перезапускает) отсчет задержки"""
+        engine = ScrollBarAnimationEngine.instance()
+        self._deadline = engine.now() + msec
+        engine.registerDelay(self)
+    
+    def stop(self):
+        """Отменяет задержку"""
+        ScrollBarAnimationEngine.instance().unregisterDelay(self)
+    
+    def isActive(self):
+        """Проверяет, ожидает ли задержка срабатывания"""
+        return id(self) in ScrollBarAnimationEngine.instance()._delays
+
+
+class ScrollBarSmoothScroller:
+    """Плавная прокрутка скроллбара, продвигаемая общим движком анимаций
+    
+    Целевое значение интерполируется по кадрам с заданной кривой QEasingCurve.
+    Серия событий колесика объединяется в одну анимацию: каждое событие сдвигает
+    цель и перезапускает кривую с текущего значения, поэтому значение (и
+    раскладка содержимого) меняется не чаще раза в кадр. Для скроллбаров с
+    логическим диапазоном анимируется логическое значение.
+    """
+    
+    State = QAbstractAnimation.State
+    
+    # Прокрутка, начатая пользователем, не замораживается паузой движка
+    _pausable = False
+    
+    def __init__(self, scroll_bar, duration=200, easing_curve=QEasingCurve.Type.OutCubic):
+        self._scroll_bar = scroll_bar
+        self._duration = duration
+        self._easing_curve = QEasingCurve(easing_curve)
+        self._start_value = 0
+        self._target_value = 0
+        self._last_value = None
+        self._start_time = 0
+        self._last_frame_time = 0
+        self._state = QAbstractAnimation.State.Stopped
+        
+        # Статистика
+        self._scroll_requests = 0
+        self._animations = 0
+        self._frames = 0
+        self._dropped_frames = 0
+    
+    def setDuration(self, duration):
+        """Устанавливает длительность анимации (мс)"""
+        self._duration = duration
+    
+    def duration(self):
+        """Возвращает длительность анимации (мс)"""
+        return self._duration
+    
+    def setEasingCurve(self, easing_curve):
+        """Устанавливает кривую анимации"""
+        self._easing_curve = QEasingCurve(easing_curve)
+    
+    def easingCurve(self):
+        """Возвращает кривую анимации"""
+        return self._easing_curve
+    
+    def state(self):
+        """Возвращает состояние анимации"""
+        return self._state
+    
+    def targetValue(self):
+        """Возвращает значение, к которому идет анимация"""
+        return self._target_value if self._state == QAbstractAnimation.State.Running else self._value()
+    
+    def _isLogical(self):
+        """Проверяет, анимируется ли логическое значение скроллбара"""
+        has_logical_range = getattr(self._scroll_bar, "hasLogicalRange", None)
+        return has_logical_range is not None and has_logical_range()
+    
+    def _value(self):
+        if self._isLogical():
+            return self._scroll_bar.logicalValue()
+        return self._scroll_bar.value()
+    
+    def _setValue(self, value):
+        if self._isLogical():
+            self._scroll_bar.setLogicalValue(value)
+        else:
+            self._scroll_bar.setValue(int(round(value)))
+        self._last_value = self._value()
+    
+    def _bounds(self):
+        if self._isLogical():
+            return self._scroll_bar.logicalMinimum(), self._scroll_bar.logicalMaximum()
+        return self._scroll_bar.minimum(), self._scroll_bar.maximum()
+    
+    def singleStep(self):
+        """Возвращает шаг прокрутки скроллбара в единицах анимируемого значения"""
+        if self._isLogical():
+            return self._scroll_bar.logicalSingleStep()
+        return self._scroll_bar.singleStep()
+    
+    def scrollBy(self, delta):
+        """Сдвигает цель анимации на delta и запускает или продолжает анимацию"""
+        self._scroll_requests += 1
+        engine = ScrollBarAnimationEngine.instance()
+        current = self._value()
+        
+        # Значение изменили извне (перетаскивание, клавиши): цель отсчитываем заново
+        running = (self._state == QAbstractAnimation.State.Running and current == self._last_value)
+        base = self._target_value if running else current
+        minimum, maximum = self._bounds()
+        target = min(max(base + delta, minimum), maximum)
+        if isinstance(maximum, int):
+            target = int(round(target))
+        if target == current:
+            self.stop()
+            return
+        
+        self._start_value = current
+        self._target_value = target
+        self._start_time = engine.now()
+        self._last_value = current
+        if not running:
+            self._animations += 1
+            self._last_frame_time = self._start_time
+            self._state = QAbstractAnimation.State.Running
+            engine.registerAnimation(self)
+    
+    def stop(self):
+        """Останавливает анимацию на текущем значении"""
+        if self._state == QAbstractAnimation.State.Running:
+            self._state = QAbstractAnimation.State.Stopped
+            ScrollBarAnimationEngine.instance().unregisterAnimation(self)
+    
+    def _advance(self, now):
+        """Выставляет значение для момента now; возвращает True по завершении"""
+        # Значение изменили извне: уступаем пользователю
+        if self._value() != self._last_value:
+            return True
+        
+        # Кадры, пропущенные с момента предыдущего кадра или запуска анимации
+        interval = ScrollBarAnimationEngine.FRAME_INTERVAL
+        missed = int((now - self._last_frame_time + interval // 2) // interval) - 1
+        if missed > 0:
+            self._dropped_frames += missed
+        self._last_frame_time = now
+        self._frames += 1
+        
+        if self._duration <= 0:
+            progress = 1.0
+        else:
+            progress = min(1.0, (now - self._start_time) / self._duration)
+        eased = self._easing_curve.valueForProgress(progress)
+        value = self._start_value + (self._target_value - self._start_value) * eased
+        if isinstance(self._target_value, int) and not isinstance(value, int):
+            value = int(round(value))
+        if progress >= 1.0:
+            value = self._target_value
+        self._setValue(value)
+        return progress >= 1.0
+    
+    def getStats(self):
+        """Возвращает статистику плавной прокрутки"""
+        return {
+            "scroll_requests": self._scroll_requests,
+            "animations": self._animations,
+            "frames": self._frames,
+            "dropped_frames": self._dropped_frames,
+            "running": self._state == QAbstractAnimation.State.Running
+        }
+    
+    def resetStats(self):
+        """Сбрасывает статистику плавной прокрутки"""
+        self._scroll_requests = 0
+        self._animations = 0
+        self._frames = 0
+        self._dropped_frames = 0
 
 
 class ScrollBarAnimationManager:
@@ -381,13 +2007,18 @@ class ScrollBarAnimationManager:
         self.hide_animation = None
         self.hide_timer = None
         
-        # Инициализируем анимации только если нужно auto_hide
+        # Анимации и таймер создаются при первом показе (см. _ensureAnimations),
+        # чтобы скроллбары, которые так и не понадобились, ничего не создавали
         if self.auto_hide:
-            self._setup_animations()
-            self._setup_hide_timer()
             # Начальное состояние - скрытый скроллбар
             self.scroll_bar.setOpacity(0.0)
     
+    def _ensureAnimations(self):
+        """Создает анимации и таймер скрытия при первом обращении"""
+        if self.show_animation is None:
+            self._setup_animations()
+            self._setup_hide_timer()
+    
     def _setup_animations(self):
         """Настройка анимаций для показа и скрытия скроллбара"""
         # Анимация показа
@@ -398,38 +2029,31 @@ class ScrollBarAnimationManager:
     
     def _setup_show_animation(self):
         """Настройка анимации показа скроллбара"""
-        self.show_animation = QPropertyAnimation(self.scroll_bar, b"opacity")
-        self.show_animation.setDuration(self.show_duration)
-        self.show_animation.setStartValue(0.0)
-        self.show_animation.setEndValue(1.0)
         # Более быстрое начало анимации
-        self.show_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.show_animation = ScrollBarOpacityAnimation(
+            self.scroll_bar, self.show_duration, 0.0, 1.0, QEasingCurve.Type.OutCubic)
     
     def _setup_hide_animation(self):
         """Настройка анимации скрытия скроллбара"""
-        self.hide_animation = QPropertyAnimation(self.scroll_bar, b"opacity")
-        self.hide_animation.setDuration(self.hide_duration)
-        self.hide_animation.setStartValue(1.0)
-        self.hide_animation.setEndValue(0.0)
         # Более плавное начало анимации и быстрый конец
-        self.hide_animation.setEasingCurve(QEasingCurve.Type.InCubic)
+        self.hide_animation = ScrollBarOpacityAnimation(
+            self.scroll_bar, self.hide_duration, 1.0, 0.0, QEasingCurve.Type.InCubic)
     
     def _setup_hide_timer(self):
         """Настройка таймера для скрытия скроллбара"""
-        self.hide_timer = QTimer()
-        self.hide_timer.setSingleShot(True)
-        self.hide_timer.timeout.connect(self.start_hide_animation)
+        self.hide_timer = ScrollBarDelayTimer(self.start_hide_animation, pausable=True)
     
     def start_show_animation(self):
         """Запускает анимацию показа скроллбара"""
         if not self.auto_hide:
             return
+        self._ensureAnimations()
             
         # Останавливаем таймер и анимацию скрытия, если они активны
         if self.hide_timer.isActive():
             self.hide_timer.stop()
         
-        if self.hide_animation and self.hide_animation.state() == QPropertyAnimation.State.Running:
+        if self.hide_animation and self.hide_animation.state() == QAbstractAnimation.State.Running:
             self.hide_animation.stop()
         
         # Запускаем анимацию показа только если скроллбар не виден полностью
@@ -446,6 +2070,7 @@ class ScrollBarAnimationManager:
         # Запускаем анимацию скрытия только если скроллбар виден
         current_opacity = self.scroll_bar._opacity
         if current_opacity > 0.0:
+            self._ensureAnimations()
             self.hide_animation.setStartValue(current_opacity)
             self.hide_animation.start()
     
@@ -453,6 +2078,10 @@ class ScrollBarAnimationManager:
         """Перезапускает таймер для скрытия скроллбара"""
         if not self.auto_hide:
             return
+        # Скроллбар еще ни разу не показывался - скрывать нечего
+        if self.hide_timer is None and self.scroll_bar._opacity <= 0.0:
+            return
+        self._ensureAnimations()
             
         # Останавливаем предыдущий таймер, если он был активен
         if self.hide_timer.isActive():
@@ -483,10 +2112,12 @@ class VerticalScrollBar(BaseScrollBar):
     
     def __init__(self, bg_alpha=30, handle_alpha=80, hover_alpha=120, pressed_alpha=160,
                  scroll_bar_width=8, use_dark_theme=False, auto_hide=True,
-                 show_duration=300, hide_duration=1000, hide_delay=1000):
+                 show_duration=300, hide_duration=1000, hide_delay=1000,
+                 quantize_repaints=False, opacity_levels=0):
         super().__init__(Qt.Orientation.Vertical, bg_alpha, handle_alpha, 
                           hover_alpha, pressed_alpha, scroll_bar_width, use_dark_theme,
-                          auto_hide, show_duration, hide_duration, hide_delay)
+                          auto_hide, show_duration, hide_duration, hide_delay,
+                          quantize_repaints, opacity_levels)
     
     def _calculateOrientedRect(self, handle_size_ratio, position_ratio, margin, width, height):
         """Вычисляет прямоугольник ползунка для вертикального скроллбара"""
@@ -508,10 +2139,12 @@ class HorizontalScrollBar(BaseScrollBar):
     
     def __init__(self, bg_alpha=30, handle_alpha=80, hover_alpha=120, pressed_alpha=160,
                  scroll_bar_width=8, use_dark_theme=False, auto_hide=True,
-                 show_duration=300, hide_duration=1000, hide_delay=1000):
+                 show_duration=300, hide_duration=1000, hide_delay=1000,
+                 quantize_repaints=False, opacity_levels=0):
         super().__init__(Qt.Orientation.Horizontal, bg_alpha, handle_alpha, 
                           hover_alpha, pressed_alpha, scroll_bar_width, use_dark_theme,
-                          auto_hide, show_duration, hide_duration, hide_delay)
+                          auto_hide, show_duration, hide_duration, hide_delay,
+                          quantize_repaints, opacity_levels)
     
     def _calculateOrientedRect(self, handle_size_ratio, position_ratio, margin, width, height):
         """Вычисляет прямоугольник ползунка для горизонтального скроллбара"""
@@ -528,13 +2161,101 @@ class HorizontalScrollBar(BaseScrollBar):
         return QRect(handle_x, margin, handle_width, height - 2 * margin)
 
 
+class ScrollBarUpdateScheduler:
+    """Общий для процесса планировщик синхронизации скроллбаров
+    
+    Области прокрутки не синхронизируются сразу, а помечаются как требующие
+    обновления. Все помеченные области обновляются одним проходом
+    по таймеру с нулевой задержкой, повторные запросы до прохода объединяются.
+    """
+    
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        """Возвращает единственный экземпляр планировщика"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self):
+        # Области, ожидающие синхронизации (id -> область, с сохранением порядка)
+        self._dirty = {}
+        self._flush_pending = False
+        
+        # Статистика объединения запросов
+        self._requested = 0
+        self._executed = 0
+        self._flushes = 0
+    
+    def schedule(self, area):
+        """Помечает область как требующую синхронизации в ближайшем проходе"""
+        self._requested += 1
+        self._dirty[id(area)] = area
+        
+        # Таймер запускается один раз на проход, а не на каждый запрос
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(0, self._flush)
+    
+    def cancel(self, area):
+        """Снимает область с ожидания синхронизации"""
+        self._dirty.pop(id(area), None)
+    
+    def isScheduled(self, area):
+        """Проверяет, ожидает ли область синхронизации"""
+        return id(area) in self._dirty
+    
+    def flush(self):
+        """Немедленно синхронизирует все помеченные области"""
+        self._flush()
+    
+    def _flush(self):
+        """Выполняет один проход синхронизации для всех помеченных областей"""
+        self._flush_pending = False
+        if not self._dirty:
+            return
+        
+        dirty = self._dirty
+        self._dirty = {}
+        self._flushes += 1
+        
+        for area in dirty.values():
+            try:
+                area._updateScrollBars()
+            except RuntimeError:
+                # Область была удалена до прохода синхронизации
+                continue
+            self._executed += 1
+    
+    def getStats(self):
+        """Возвращает статистику запрошенных и выполненных синхронизаций"""
+        ratio = (self._requested / self._executed) if self._executed > 0 else 0
+        return {
+            "requested": self._requested,
+            "executed": self._executed,
+            "flushes": self._flushes,
+            "pending": len(self._dirty),
+            "coalescing_ratio": ratio
+        }
+    
+    def resetStats(self):
+        """Сбрасывает статистику планировщика"""
+        self._requested = 0
+        self._executed = 0
+        self._flushes = 0
+
+
 class OverlayScrollArea(QScrollArea):
     """Класс области прокрутки с накладываемыми пользовательскими скроллбарами"""
     
     def __init__(self, widget, bg_alpha=30, handle_alpha=80, 
                  hover_alpha=120, pressed_alpha=160,
                  scroll_bar_width=8, auto_hide=False, use_dark_theme=False,
-                 show_duration=300, hide_duration=1000, hide_delay=1000):
+                 show_duration=300, hide_duration=1000, hide_delay=1000,
+                 poll_interval=0, precise_sync=False, smooth_scroll=False,
+                 smooth_scroll_duration=200, smooth_scroll_easing=QEasingCurve.Type.OutCubic,
+                 deferred_drag=False, drag_update_interval=50, drag_tooltip=False):
         super().__init__()
         
         # Сохраняем параметры
@@ -574,6 +2295,8 @@ class OverlayScrollArea(QScrollArea):
         # Делаем скроллбары дочерними элементами этого виджета
         self._v_scroll.setParent(self)
         self._h_scroll.setParent(self)
+        self._v_scroll._style_owner = weakref.ref(self)
+        self._h_scroll._style_owner = weakref.ref(self)
         
         # Устанавливаем начальное положение скроллбаров
         self._v_scroll.move(self.width() - scroll_bar_width, 0)
@@ -583,14 +2306,33 @@ class OverlayScrollArea(QScrollArea):
         self._v_scroll.valueChanged.connect(self._scrollValueChanged)
         self._h_scroll.valueChanged.connect(self._scrollValueChanged)
         
-        # Привязываем сигналы стандартных скроллбаров к обновлениям
-        self.verticalScrollBar().valueChanged.connect(self._updateScrollBars)
-        self.horizontalScrollBar().valueChanged.connect(self._updateScrollBars)
-        
-        # Таймер для редкого обновления состояния скроллбаров (когда нет прокрутки)
-        self._update_timer = QTimer(self)
-        self._update_timer.timeout.connect(self._updateScrollBars)
-        self._update_timer.start(300)  # Обновляем каждые 300 мс вместо 100 мс
+        # Перетаскивание ползунков (отложенное отслеживание и статистика)
+        for scroll_bar in (self._v_scroll, self._h_scroll):
+            scroll_bar.sliderMoved.connect(self._onSliderMoved)
+            scroll_bar.sliderPressed.connect(self._onSliderPressed)
+            scroll_bar.sliderReleased.connect(self._onSliderReleased)
+        
+        # Привязываем сигналы стандартных скроллбаров к обновлениям:
+        # синхронизация полностью событийная, без периодического опроса
+        self.verticalScrollBar().valueChanged.connect(self._onNativeScrollBarChanged)
+        self.horizontalScrollBar().valueChanged.connect(self._onNativeScrollBarChanged)
+        self.verticalScrollBar().rangeChanged.connect(self._onNativeScrollBarChanged)
+        self.horizontalScrollBar().rangeChanged.connect(self._onNativeScrollBarChanged)
+        
+        # Резервный опрос (по умолчанию выключен). Таймер создается только
+        # при poll_interval > 0 и работает только пока область видима
+        self._poll_interval = poll_interval
+        self._update_timer = None
+        if poll_interval > 0:
+            self._update_timer = QTimer(self)
+            self._update_timer.timeout.connect(self._onPollTimeout)
+        
+        # Статистика пробуждений для контроля стоимости простоя
+        self._poll_wakeups = 0
+        self._signal_updates = 0
+        self._sync_requests = 0
+        self._sync_passes = 0
+        self._stats_started = time.monotonic()
         
         # Флаг для отслеживания необходимости обновления
         self._update_needed = True
@@ -608,8 +2350,39 @@ class OverlayScrollArea(QScrollArea):
         # Минимальная дельта для значимых изменений (в процентах)
         self._min_value_delta_percent = 1.0  # 1% от диапазона
         
-        # Обновляем скроллбары сразу после инициализации
-        QTimer.singleShot(0, self._updateScrollBars)
+        # Точная синхронизация: передаются все изменения значения
+        self._precise_sync = False
+        self.setPreciseSync(precise_sync)
+        
+        # Плавная прокрутка колесиком (анимации создаются при первом событии)
+        self._smooth_scroll = bool(smooth_scroll)
+        self._smooth_scroll_duration = smooth_scroll_duration
+        self._smooth_scroll_easing = smooth_scroll_easing
+        self._smooth_scrollers = {}
+        
+        # Накопитель pixelDelta тачпада: сдвиги объединяются в одну прокрутку за кадр
+        self._pending_pixel_dx = 0
+        self._pending_pixel_dy = 0
+        self._pixel_flush_timer = None
+        self._wheel_events = 0
+        self._pixel_events = 0
+        self._pixel_scrolls = 0
+        
+        # Отложенное перетаскивание: ползунок следует за мышью, а содержимое
+        # прокручивается не чаще раза в drag_update_interval мс (0 - при отпускании)
+        self._deferred_drag = False
+        self._drag_update_interval = drag_update_interval
+        self._drag_tooltip = drag_tooltip
+        self._drag_timer = None
+        self._pending_drag = {}
+        self._drag_started = None
+        self._drag_moves = 0
+        self._content_scrolls = 0
+        self._drag_time = 0.0
+        self.setDeferredDrag(deferred_drag)
+        
+        # Обновляем скроллбары в ближайшем проходе планировщика
+        self._requestUpdate()
     
     def setTheme(self, use_dark_theme):
         """Установка темы для всех скроллбаров"""
@@ -617,14 +2390,347 @@ class OverlayScrollArea(QScrollArea):
         self._v_scroll.setTheme(use_dark_theme)
         self._h_scroll.setTheme(use_dark_theme)
     
+    def isDarkTheme(self):
+        """Возвращает True, если скроллбары используют темную тему"""
+        return self._use_dark_theme
+    
+    def _styleApplied(self, changes):
+        """Запоминает стиль, примененный к скроллбарам через ScrollBarRegistry"""
+        self._use_dark_theme = changes.get("use_dark_theme", self._use_dark_theme)
+        self._bg_alpha = changes.get("bg_alpha", self._bg_alpha)
+        self._handle_alpha = changes.get("handle_alpha", self._handle_alpha)
+        self._hover_alpha = changes.get("hover_alpha", self._hover_alpha)
+        self._pressed_alpha = changes.get("pressed_alpha", self._pressed_alpha)
+    
+    def setPreciseSync(self, enabled):
+        """Включает точную синхронизацию положения ползунка
+        
+        В точном режиме оверлейные скроллбары получают каждое изменение
+        значения без порога _min_value_delta_percent, а перерисовка
+        выполняется только когда ползунок сдвигается хотя бы на пиксель.
+        """
+        self._precise_sync = bool(enabled)
+        self._v_scroll.setQuantizedRepaint(self._precise_sync)
+        self._h_scroll.setQuantizedRepaint(self._precise_sync)
+        self._update_needed = True
+    
+    def setOpacityLevels(self, levels):
+        """Устанавливает число уровней прозрачности анимации для обоих скроллбаров"""
+        self._v_scroll.setOpacityLevels(levels)
+        self._h_scroll.setOpacityLevels(levels)
+    
+    def isPreciseSync(self):
+        """Возвращает True, если включена точная синхронизация"""
+        return self._precise_sync
+    
+    def setSmoothScrolling(self, enabled, duration=None, easing_curve=None):
+        """Включает плавную прокрутку колесиком
+        
+        Args:
+            enabled: Включить плавную прокрутку
+            duration: Длительность анимации (мс), None - без изменений
+            easing_curve: Кривая анимации QEasingCurve.Type, None - без изменений
+        """
+        self._smooth_scroll = bool(enabled)
+        if duration is not None:
+            self._smooth_scroll_duration = duration
+        if easing_curve is not None:
+            self._smooth_scroll_easing = easing_curve
+        
+        for scroller in self._smooth_scrollers.values():
+            if not self._smooth_scroll:
+                scroller.stop()
+            scroller.setDuration(self._smooth_scroll_duration)
+            scroller.setEasingCurve(self._smooth_scroll_easing)
+    
+    def isSmoothScrolling(self):
+        """Возвращает True, если включена плавная прокрутка"""
+        return self._smooth_scroll
+    
+    def getSmoothScrollStats(self):
+        """Возвращает суммарную статистику плавной прокрутки по обоим направлениям"""
+        stats = {"scroll_requests": 0, "animations": 0, "frames": 0, "dropped_frames": 0, "running": False}
+        for scroller in self._smooth_scrollers.values():
+            scroller_stats = scroller.getStats()
+            for key in ("scroll_requests", "animations", "frames", "dropped_frames"):
+                stats[key] += scroller_stats[key]
+            stats["running"] = stats["running"] or scroller_stats["running"]
+        return stats
+    
+    def resetSmoothScrollStats(self):
+        """Сбрасывает статистику плавной прокрутки"""
+        for scroller in self._smooth_scrollers.values():
+            scroller.resetStats()
+    
+    def setDeferredDrag(self, enabled, update_interval=None, tooltip=None):
+        """Включает отложенное отслеживание при перетаскивании ползунка
+        
+        Ползунок следует за мышью на каждом движении, а содержимое
+        прокручивается не чаще раза в update_interval мс или только при
+        отпускании кнопки (update_interval=0).
+        
+        Args:
+            enabled: Включить отложенное отслеживание
+            update_interval: Минимальный интервал прокрутки содержимого (мс), None - без изменений
+            tooltip: Показывать подсказку с положением при перетаскивании, None - без изменений
+        """
+        self._deferred_drag = bool(enabled)
+        if update_interval is not None:
+            self._drag_update_interval = update_interval
+        if tooltip is not None:
+            self._drag_tooltip = tooltip
+        
+        self._v_scroll.setTracking(not self._deferred_drag)
+        self._h_scroll.setTracking(not self._deferred_drag)
+    
+    def isDeferredDrag(self):
+        """Возвращает True, если включено отложенное отслеживание"""
+        return self._deferred_drag
+    
+    def getDragStats(self):
+        """Возвращает статистику перетаскивания ползунков
+        
+        content_scrolls учитывает прокрутки содержимого, которые действительно
+        сдвинули его во время перетаскивания ползунка (включая итоговую при
+        отпускании), а content_scrolls_per_second относит их к суммарному
+        времени перетаскивания.
+        """
+        drag_time = self._drag_time
+        if self._drag_started is not None:
+            drag_time += time.perf_counter() - self._drag_started
+        return {
+            "drag_moves": self._drag_moves,
+            "content_scrolls": self._content_scrolls,
+            "drag_time": drag_time,
+            "content_scrolls_per_second": self._content_scrolls / drag_time if drag_time > 0 else 0
+        }
+    
+    def resetDragStats(self):
+        """Сбрасывает статистику перетаскивания"""
+        self._drag_moves = 0
+        self._content_scrolls = 0
+        self._drag_time = 0.0
+        if self._drag_started is not None:
+            self._drag_started = time.perf_counter()
+    
+    def _onSliderPressed(self):
+        """Начало перетаскивания ползунка"""
+        if self._drag_started is None:
+            self._drag_started = time.perf_counter()
+    
+    def _onSliderMoved(self, position):
+        """Ползунок сдвинут мышью: при отложенном отслеживании планируем прокрутку"""
+        self._drag_moves += 1
+        if not self._deferred_drag:
+            return
+        
+        scroll_bar = self.sender()
+        self._pending_drag[scroll_bar.orientation()] = position
+        if self._drag_tooltip:
+            QToolTip.showText(QCursor.pos(), self._dragTooltipText(scroll_bar, position), scroll_bar)
+        
+        # Только при отпускании
+        if self._drag_update_interval <= 0:
+            return
+        
+        if self._drag_timer is None:
+            self._drag_timer = ScrollBarDelayTimer(self._onDragTimeout)
+        if not self._drag_timer.isActive():
+            self._applyPendingDrag()
+    
+    def _onDragTimeout(self):
+        """Прокручивает содержимое к последнему положению ползунка за интервал"""
+        if self._pending_drag:
+            self._applyPendingDrag()
+    
+    def _applyPendingDrag(self):
+        """Прокручивает содержимое к накопленному положению и взводит интервал"""
+        pending = self._pending_drag
+        self._pending_drag = {}
+        for orientation, position in pending.items():
+            self._scrollContent(orientation, position)
+        self._drag_timer.start(self._drag_update_interval)
+    
+    def _onSliderReleased(self):
+        """Окончание перетаскивания: итоговое значение применяется через valueChanged"""
+        if self._drag_timer is not None:
+            self._drag_timer.stop()
+        self._pending_drag = {}
+        if self._deferred_drag:
+            # Итоговая прокрутка выполняется сразу, пока перетаскивание
+            # еще учитывается в статистике (иначе QAbstractSlider применит
+            # положение уже после sliderReleased)
+            scroll_bar = self.sender()
+            scroll_bar.setValue(scroll_bar.sliderPosition())
+        if self._drag_tooltip:
+            QToolTip.hideText()
+        if self._drag_started is not None:
+            self._drag_time += time.perf_counter() - self._drag_started
+            self._drag_started = None
+    
+    def _dragTooltipText(self, scroll_bar, position):
+        """Возвращает текст подсказки с положением ползунка"""
+        span = scroll_bar.maximum() - scroll_bar.minimum()
+        percent = 100 * (position - scroll_bar.minimum()) / span if span > 0 else 0
+        return f"{percent:.0f}%"
+    
+    def _scrollContent(self, orientation, value):
+        """Прокручивает содержимое к значению оверлейного скроллбара"""
+        if orientation == Qt.Orientation.Vertical:
+            scroll_bar = self.verticalScrollBar()
+        else:
+            scroll_bar = self.horizontalScrollBar()
+        previous = scroll_bar.value()
+        scroll_bar.setValue(value)
+        
+        # Учитываются только сдвиги содержимого во время перетаскивания
+        if self._drag_started is not None and scroll_bar.value() != previous:
+            self._content_scrolls += 1
+    
+    def _wheelScrollBar(self, orientation):
+        """Возвращает скроллбар, значение которого прокручивает колесико"""
+        if orientation == Qt.Orientation.Vertical:
+            return self.verticalScrollBar()
+        return self.horizontalScrollBar()
+    
+    def _smoothScroller(self, orientation):
+        """Возвращает (создавая при необходимости) анимацию прокрутки для направления"""
+        scroller = self._smooth_scrollers.get(orientation)
+        if scroller is None:
+            scroller = ScrollBarSmoothScroller(
+                self._wheelScrollBar(orientation),
+                self._smooth_scroll_duration, self._smooth_scroll_easing
+            )
+            self._smooth_scrollers[orientation] = scroller
+        return scroller
+    
+    def getWheelStats(self):
+        """Возвращает количество событий колесика и выполненных по ним прокруток тачпада"""
+        return {
+            "wheel_events": self._wheel_events,
+            "pixel_events": self._pixel_events,
+            "pixel_scrolls": self._pixel_scrolls,
+            "pending_pixels": (self._pending_pixel_dx, self._pending_pixel_dy)
+        }
+    
+    def resetWheelStats(self):
+        """Сбрасывает статистику колесика"""
+        self._wheel_events = 0
+        self._pixel_events = 0
+        self._pixel_scrolls = 0
+    
+    def _isPixelWheelEvent(self, event):
+        """Проверяет, относится ли событие к прокрутке тачпада в пикселях
+        
+        Завершающее событие серии (ScrollEnd) приходит без сдвига, но должно
+        применить остаток, накопленный за последний кадр.
+        """
+        if event.phase() == Qt.ScrollPhase.ScrollEnd:
+            return True
+        return not event.pixelDelta().isNull() and self._hasReliablePixelDelta(event)
+    
+    @staticmethod
+    def _hasReliablePixelDelta(event):
+        """Проверяет, можно ли доверять pixelDelta события
+        
+        На X11 pixelDelta зависит от драйвера и для колесика мыши бывает
+        произвольным, поэтому в пикселях прокручиваются только устройства
+        с точной прокруткой (тачпады), а на macOS - любые устройства.
+        """
+        device = event.device()
+        if device is not None:
+            if device.type() == QInputDevice.DeviceType.TouchPad:
+                return True
+            if device.capabilities() & QInputDevice.Capability.PixelScroll:
+                return True
+        return QApplication.platformName() == "cocoa"
+    
+    def _pixelWheelEvent(self, event):
+        """Накапливает pixelDelta тачпада и прокручивает не чаще раза в кадр
+        
+        Первое событие серии прокручивает сразу, события внутри следующего
+        кадра только накапливаются и применяются одним сдвигом по его окончании.
+        """
+        self._pixel_events += 1
+        delta = event.pixelDelta()
+        dx, dy = delta.x(), delta.y()
+        if event.modifiers() & Qt.KeyboardModifier.AltModifier:
+            dx, dy = dy, dx
+        self._pending_pixel_dx += dx
+        self._pending_pixel_dy += dy
+        
+        # Тачпад сам дает плавное движение, анимация колесика ему не нужна
+        for scroller in self._smooth_scrollers.values():
+            scroller.stop()
+        
+        if self._pixel_flush_timer is None:
+            self._pixel_flush_timer = ScrollBarDelayTimer(self._onPixelFlushTimeout)
+        if not self._pixel_flush_timer.isActive():
+            self._flushPixelDelta()
+        elif event.phase() == Qt.ScrollPhase.ScrollEnd:
+            self._pixel_flush_timer.stop()
+            self._flushPixelDelta()
+        event.accept()
+    
+    def _onPixelFlushTimeout(self):
+        """Применяет сдвиги, накопленные за кадр"""
+        if self._pending_pixel_dx or self._pending_pixel_dy:
+            self._flushPixelDelta()
+    
+    def _flushPixelDelta(self):
+        """Прокручивает содержимое на накопленный сдвиг и взводит ожидание кадра"""
+        dx, dy = self._pending_pixel_dx, self._pending_pixel_dy
+        self._pending_pixel_dx = 0
+        self._pending_pixel_dy = 0
+        
+        scrolled = False
+        for orientation, delta, overlay in ((Qt.Orientation.Vertical, dy, self._v_scroll),
+                                            (Qt.Orientation.Horizontal, dx, self._h_scroll)):
+            scroll_bar = self._wheelScrollBar(orientation)
+            if delta == 0 or scroll_bar is None:
+                continue
+            has_logical_range = getattr(scroll_bar, "hasLogicalRange", None)
+            if has_logical_range is not None and has_logical_range():
+                scroll_bar.setLogicalValue(scroll_bar.logicalValue() - delta)
+            else:
+                scroll_bar.setValue(scroll_bar.value() - delta)
+            overlay.handle_widget_event("scroll")
+            scrolled = True
+        
+        if scrolled:
+            self._pixel_scrolls += 1
+            self._update_needed = True
+            self._requestUpdate()
+        self._pixel_flush_timer.start(ScrollBarAnimationEngine.FRAME_INTERVAL)
+    
+    def _smoothWheelEvent(self, event):
+        """Переводит событие колесика в сдвиг цели плавной прокрутки"""
+        delta = event.angleDelta()
+        vertical = abs(delta.y()) >= abs(delta.x())
+        if event.modifiers() & Qt.KeyboardModifier.AltModifier:
+            vertical = not vertical
+        angle = delta.y() if abs(delta.y()) >= abs(delta.x()) else delta.x()
+        if angle == 0:
+            event.ignore()
+            return
+        
+        orientation = Qt.Orientation.Vertical if vertical else Qt.Orientation.Horizontal
+        if self._wheelScrollBar(orientation) is None:
+            event.ignore()
+            return
+        scroller = self._smoothScroller(orientation)
+        steps = angle / 120 * QApplication.wheelScrollLines()
+        scroller.scrollBy(-steps * scroller.singleStep())
+        event.accept()
+    
     def _scrollValueChanged(self, value):
         """Обработка изменения значения скроллбара"""
         sender = self.sender()
         
         if sender == self._v_scroll:
-            self.verticalScrollBar().setValue(value)
+            self._scrollContent(Qt.Orientation.Vertical, value)
         elif sender == self._h_scroll:
-            self.horizontalScrollBar().setValue(value)
+            self._scrollContent(Qt.Orientation.Horizontal, value)
         
         # Пометка, что требуется обновление
         self._update_needed = True
@@ -633,6 +2739,69 @@ class OverlayScrollArea(QScrollArea):
         self._v_scroll.handle_widget_event("scroll")
         self._h_scroll.handle_widget_event("scroll")
     
+    def _requestUpdate(self):
+        """Запрашивает синхронизацию скроллбаров в ближайшем проходе планировщика"""
+        self._sync_requests += 1
+        ScrollBarUpdateScheduler.instance().schedule(self)
+    
+    def _onNativeScrollBarChanged(self, *args):
+        """Обработка изменения диапазона или значения стандартного скроллбара"""
+        self._signal_updates += 1
+        self._requestUpdate()
+    
+    def _onPollTimeout(self):
+        """Резервная периодическая синхронизация (только при poll_interval > 0)"""
+        self._poll_wakeups += 1
+        self._requestUpdate()
+    
+    def eventFilter(self, obj, event):
+        """Отслеживает изменения геометрии содержимого
+        
+        QScrollArea сам устанавливает фильтр событий на виджет содержимого,
+        поэтому дополнительная установка фильтра не требуется.
+        """
+        start = time.perf_counter_ns() if ScrollBarTracer.enabled else 0
+        result = super().eventFilter(obj, event)
+        
+        # Фильтр может сработать еще до создания наших скроллбаров (из setWidget)
+        if not hasattr(self, '_v_scroll'):
+            return result
+        
+        if obj is self.widget() and event.type() in (QEvent.Type.Resize, QEvent.Type.LayoutRequest):
+            # Стандартные скроллбары уже пересчитаны базовым классом
+            self._update_needed = True
+            self._requestUpdate()
+        
+        if start:
+            ScrollBarTracer.record("eventFilter", "event", start, owner=self,
+                                   args={"event": event.type().name})
+        return result
+    
+    def getUpdateStats(self):
+        """Возвращает статистику синхронизации скроллбаров
+        
+        wakeups_per_second отражает только пробуждения резервного таймера,
+        поэтому в простое при выключенном опросе он равен нулю.
+        """
+        elapsed = max(1e-9, time.monotonic() - self._stats_started)
+        return {
+            "poll_active": self._update_timer is not None and self._update_timer.isActive(),
+            "poll_wakeups": self._poll_wakeups,
+            "signal_updates": self._signal_updates,
+            "sync_requests": self._sync_requests,
+            "sync_passes": self._sync_passes,
+            "elapsed": elapsed,
+            "wakeups_per_second": self._poll_wakeups / elapsed
+        }
+    
+    def resetUpdateStats(self):
+        """Сбрасывает статистику синхронизации скроллбаров"""
+        self._poll_wakeups = 0
+        self._signal_updates = 0
+        self._sync_requests = 0
+        self._sync_passes = 0
+        self._stats_started = time.monotonic()
+    
     def resizeEvent(self, event):
         """Обработка изменения размера области прокрутки"""
         super().resizeEvent(event)
@@ -646,12 +2815,26 @@ class OverlayScrollArea(QScrollArea):
     def showEvent(self, event):
         """Обработка показа виджета"""
         super().showEvent(event)
-        # Обновляем скроллбары при отображении
+        # Обновляем скроллбары при отображении сразу, без ожидания планировщика
+        ScrollBarUpdateScheduler.instance().cancel(self)
         self._update_needed = True
         self._updateScrollBars()
+        
+        # Резервный опрос работает только пока область видима
+        if self._update_timer is not None:
+            self._update_timer.start(self._poll_interval)
+    
+    def hideEvent(self, event):
+        """Обработка скрытия виджета"""
+        super().hideEvent(event)
+        if self._update_timer is not None:
+            self._update_timer.stop()
     
     def _updateScrollBars(self):
         """Обновляет параметры и состояние скроллбаров с оптимизацией количества обновлений"""
+        start = time.perf_counter_ns() if ScrollBarTracer.enabled else 0
+        self._sync_passes += 1
+        
         # Получаем стандартные скроллбары
         v_bar = self.verticalScrollBar()
         h_bar = self.horizontalScrollBar()
@@ -687,9 +2870,12 @@ class OverlayScrollArea(QScrollArea):
         visibility_changed = (v_visible != self._last_v_visible or 
                              h_visible != self._last_h_visible)
         
+        # В точном режиме значимо любое изменение значения
+        min_delta_percent = 0 if self._precise_sync else self._min_value_delta_percent
+        
         # Значительное изменение значения (больше минимальной дельты)
-        significant_value_change = (v_value_delta_percent > self._min_value_delta_percent or 
-                                   h_value_delta_percent > self._min_value_delta_percent)
+        significant_value_change = (v_value_delta_percent > min_delta_percent or 
+                                   h_value_delta_percent > min_delta_percent)
         
         # Обновляем только если есть значимые изменения или принудительное обновление
         if (self._update_needed or range_changed or page_step_changed or 
@@ -713,11 +2899,12 @@ class OverlayScrollArea(QScrollArea):
             
             # Обновляем значения, только если они значительно изменились
             if significant_value_change:
-                if v_value_delta_percent > self._min_value_delta_percent:
+                # Перетаскиваемый ползунок не возвращаем к отстающему значению содержимого
+                if v_value_delta_percent > min_delta_percent and not self._v_scroll.isSliderDown():
                     self._v_scroll.setValue(v_value)
                     self._last_v_value = v_value
                 
-                if h_value_delta_percent > self._min_value_delta_percent:
+                if h_value_delta_percent > min_delta_percent and not self._h_scroll.isSliderDown():
                     self._h_scroll.setValue(h_value)
                     self._last_h_value = h_value
             
@@ -733,6 +2920,9 @@ class OverlayScrollArea(QScrollArea):
             
             # Сбрасываем флаг необходимости обновления
             self._update_needed = False
+        
+        if start:
+            ScrollBarTracer.record("_updateScrollBars", "sync", start, owner=self)
     
     def _updateScrollBarsGeometry(self):
         """Обновляет геометрию скроллбаров"""
@@ -769,12 +2959,28 @@ class OverlayScrollArea(QScrollArea):
     
     def wheelEvent(self, event):
         """Обработка события колесика мыши"""
+        self._wheel_events += 1
+        
+        # Тачпад с высоким разрешением: прокрутка по накопленным пикселям
+        if self._isPixelWheelEvent(event):
+            self._pixelWheelEvent(event)
+            return
+        
+        # Плавная прокрутка: значение меняется по кадрам движка анимаций
+        if self._smooth_scroll:
+            self._smoothWheelEvent(event)
+            return
+        
         # Прокручиваем содержимое
-        super().wheelEvent(event)
+        self._stepWheelEvent(event)
         
-        # Обновляем отображение скроллбаров
+        # Запрашиваем обновление скроллбаров (объединяется с сигналами valueChanged)
         self._update_needed = True
-        self._updateScrollBars()
+        self._requestUpdate()
+    
+    def _stepWheelEvent(self, event):
+        """Прокручивает содержимое на шаги колесика без анимации"""
+        super().wheelEvent(event)
     
     def enterEvent(self, event):
         """Обработка входа курсора в область виджета"""
@@ -793,11 +2999,308 @@ class OverlayScrollArea(QScrollArea):
         self._h_scroll.handle_widget_event("leave")
 
 
+class VirtualOverlayScrollArea(OverlayScrollArea):
+    """Область прокрутки с виртуализацией строк
+    
+    Вместо реального виджета содержимого область знает только количество
+    элементов и высоту строк. Виджеты создаются только для видимых строк
+    с запасом (overscan) и переиспользуются при прокрутке, а позицией
+    управляет логический диапазон вертикального оверлейного скроллбара,
+    поэтому количество строк и высота содержимого не ограничены int.
+    
+    Args:
+        item_count: Количество элементов
+        create_item: Функция create_item(parent) -> QWidget, создающая виджет строки
+        bind_item: Функция bind_item(widget, index), заполняющая виджет данными элемента
+        row_height: Высота строки (int) или функция row_height(index) -> int
+        overscan: Количество дополнительных строк сверху и снизу видимой области
+        **kwargs: Параметры OverlayScrollArea
+    """
+    
+    # Свободные виджеты строк, сохраняемые для колебаний размера окна строк
+    FREE_ROWS_RESERVE = 2
+    
+    def __init__(self, item_count, create_item, bind_item, row_height=24, overscan=4, **kwargs):
+        # Контейнер строк занимает ровно видимую область
+        self._container = QWidget()
+        
+        self._create_item = create_item
+        self._bind_item = bind_item
+        self._overscan = overscan
+        self._item_count = 0
+        self._row_height = row_height
+        self._row_offsets = None
+        
+        # Виджеты строк: индекс -> виджет, и свободные для переиспользования
+        self._bound_rows = {}
+        self._free_rows = []
+        self._scroll_offset = 0
+        self._last_virtual_range = None
+        self._last_layout_key = None
+        
+        # Статистика виртуализации
+        self._bind_calls = 0
+        self._layout_passes = 0
+        
+        super().__init__(self._container, **kwargs)
+        
+        # Позицией управляет логический диапазон оверлейного скроллбара
+        self._v_scroll.logicalValueChanged.connect(self._onLogicalScroll)
+        self._h_scroll.setVisible(False)
+        
+        self.setItemCount(item_count)
+    
+    def setItemCount(self, count):
+        """Устанавливает количество элементов"""
+        self._item_count = max(0, count)
+        self._rebuildOffsets()
+        
+        # Все строки будут заново привязаны к данным
+        for widget in self._bound_rows.values():
+            widget.hide()
+            self._free_rows.append(widget)
+        self._bound_rows = {}
+        self._last_layout_key = None
+        
+        self._update_needed = True
+        self._requestUpdate()
+    
+    def itemCount(self):
+        """Возвращает количество элементов"""
+        return self._item_count
+    
+    def setRowHeight(self, row_height):
+        """Устанавливает высоту строк (int или функция от индекса)"""
+        self._row_height = row_height
+        self.setItemCount(self._item_count)
+    
+    def _rebuildOffsets(self):
+        """Строит смещения строк для переменной высоты"""
+        if callable(self._row_height):
+            self._row_offsets = array('q', accumulate(
+                (self._row_height(index) for index in range(self._item_count)), initial=0))
+        else:
+            self._row_offsets = None
+    
+    def _totalHeight(self):
+        """Возвращает полную высоту содержимого"""
+        if self._row_offsets is not None:
+            return self._row_offsets[-1]
+        return self._item_count * self._row_height
+    
+    def _rowTop(self, index):
+        """Возвращает верхнюю границу строки в координатах содержимого"""
+        if self._row_offsets is not None:
+            return self._row_offsets[index]
+        return index * self._row_height
+    
+    def _rowHeightAt(self, index):
+        """Возвращает высоту строки"""
+        if self._row_offsets is not None:
+            return self._row_offsets[index + 1] - self._row_offsets[index]
+        return self._row_height
+    
+    def _indexAt(self, y):
+        """Возвращает индекс строки, содержащей координату содержимого y"""
+        if self._item_count == 0:
+            return 0
+        if self._row_offsets is not None:
+            index = bisect_right(self._row_offsets, y) - 1
+        else:
+            index = y // self._row_height if self._row_height > 0 else 0
+        return int(min(max(index, 0), self._item_count - 1))
+    
+    def scrollOffset(self):
+        """Возвращает текущее смещение содержимого (пикселей)"""
+        return self._scroll_offset
+    
+    def setScrollOffset(self, offset):
+        """Прокручивает содержимое к смещению (пикселей)"""
+        self._v_scroll.setLogicalValue(offset)
+    
+    def scrollToIndex(self, index):
+        """Прокручивает содержимое так, чтобы элемент оказался вверху"""
+        if self._item_count == 0:
+            return
+        self.setScrollOffset(self._rowTop(min(max(index, 0), self._item_count - 1)))
+    
+    def visibleRange(self):
+        """Возвращает диапазон индексов (first, last) созданных строк"""
+        if not self._bound_rows:
+            return (0, -1)
+        return (min(self._bound_rows), max(self._bound_rows))
+    
+    def _onLogicalScroll(self, offset):
+        """Обработка изменения логической позиции скроллбара"""
+        if self._drag_started is not None:
+            self._content_scrolls += 1
+        self._scroll_offset = offset
+        self._layoutRows()
+        
+        # Уведомляем скроллбар о событии прокрутки
+        self._v_scroll.handle_widget_event("scroll")
+    
+    def _scrollValueChanged(self, value):
+        """Позиция передается через logicalValueChanged, стандартные скроллбары не используются"""
+        return
+    
+    def _scrollContent(self, orientation, value):
+        """Переводит положение перетаскиваемого ползунка в логическую позицию"""
+        if orientation == Qt.Orientation.Vertical:
+            self._v_scroll.setLogicalValue(self._v_scroll._logicalFromProxy(value))
+    
+    def _updateScrollBars(self):
+        """Обновляет логический диапазон скроллбара и раскладку строк"""
+        start = time.perf_counter_ns() if ScrollBarTracer.enabled else 0
+        self._sync_passes += 1
+        
+        viewport_height = self.viewport().height()
+        max_offset = max(0, self._totalHeight() - viewport_height)
+        single_step = self._rowHeightAt(0) if self._item_count > 0 else 1
+        
+        virtual_range = (max_offset, viewport_height, single_step)
+        if virtual_range != self._last_virtual_range:
+            self._last_virtual_range = virtual_range
+            self._v_scroll.setLogicalRange(0, max_offset, viewport_height, single_step)
+            
+            v_visible = max_offset > 0
+            if v_visible != self._last_v_visible:
+                self._v_scroll.setVisible(v_visible)
+                self._last_v_visible = v_visible
+                self._updateScrollBarsGeometry()
+        
+        self._scroll_offset = self._v_scroll.logicalValue()
+        self._layoutRows()
+        self._update_needed = False
+        
+        if start:
+            ScrollBarTracer.record("_updateScrollBars", "sync", start, owner=self)
+    
+    def _layoutRows(self):
+        """Создает, привязывает и размещает виджеты только для видимых строк"""
+        if self._item_count == 0:
+            self._trimFreeRows()
+            return
+        
+        # Раскладка не изменилась с прошлого прохода
+        offset = self._scroll_offset
+        viewport_height = self.viewport().height()
+        width = self._container.width()
+        layout_key = (offset, viewport_height, width)
+        if layout_key == self._last_layout_key:
+            return
+        self._last_layout_key = layout_key
+        self._layout_passes += 1
+        
+        first = max(0, self._indexAt(offset) - self._overscan)
+        last = min(self._item_count - 1, self._indexAt(offset + viewport_height) + self._overscan)
+        
+        # Освобождаем строки, вышедшие из окна
+        for index in [i for i in self._bound_rows if i < first or i > last]:
+            widget = self._bound_rows.pop(index)
+            widget.hide()
+            self._free_rows.append(widget)
+        
+        for index in range(first, last + 1):
+            widget = self._bound_rows.get(index)
+            if widget is None:
+                # Переиспользуем свободный виджет или создаем новый
+                if self._free_rows:
+                    widget = self._free_rows.pop()
+                else:
+                    widget = self._create_item(self._container)
+                    widget.setParent(self._container)
+                self._bind_item(widget, index)
+                self._bind_calls += 1
+                self._bound_rows[index] = widget
+            
+            widget.setGeometry(0, int(self._rowTop(index) - offset), width, int(self._rowHeightAt(index)))
+            if widget.isHidden():
+                widget.show()
+        
+        self._trimFreeRows()
+    
+    def _trimFreeRows(self):
+        """Удаляет свободные виджеты сверх запаса FREE_ROWS_RESERVE
+        
+        После уменьшения количества элементов или высоты области
+        свободных строк становится больше, чем понадобится при прокрутке.
+        """
+        while len(self._free_rows) > self.FREE_ROWS_RESERVE:
+            self._free_rows.pop().deleteLater()
+    
+    def _wheelScrollBar(self, orientation):
+        """Колесико прокручивает логический диапазон вертикального скроллбара"""
+        if orientation == Qt.Orientation.Vertical:
+            return self._v_scroll
+        return None
+    
+    def _stepWheelEvent(self, event):
+        """Шаги колесика прокручивают логический диапазон вертикального скроллбара"""
+        delta = event.angleDelta()
+        angle = delta.y() if abs(delta.y()) >= abs(delta.x()) else delta.x()
+        if angle == 0:
+            event.ignore()
+            return
+        
+        scroll_bar = self._v_scroll
+        if event.modifiers() & (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier):
+            step = scroll_bar.logicalPageStep()
+        else:
+            step = QApplication.wheelScrollLines() * scroll_bar.logicalSingleStep()
+        scroll_bar.setLogicalValue(scroll_bar.logicalValue() - round(angle / 120 * step))
+        event.accept()
+    
+    def keyPressEvent(self, event):
+        """Клавиши прокрутки перемещают логическую позицию
+        
+        Стандартный вертикальный скроллбар виртуальной области имеет
+        нулевой диапазон, поэтому обработка QScrollArea ничего не прокручивает.
+        """
+        scroll_bar = self._v_scroll
+        key = event.key()
+        if key == Qt.Key.Key_PageDown:
+            offset = scroll_bar.logicalValue() + scroll_bar.logicalPageStep()
+        elif key == Qt.Key.Key_PageUp:
+            offset = scroll_bar.logicalValue() - scroll_bar.logicalPageStep()
+        elif key == Qt.Key.Key_Down:
+            offset = scroll_bar.logicalValue() + scroll_bar.logicalSingleStep()
+        elif key == Qt.Key.Key_Up:
+            offset = scroll_bar.logicalValue() - scroll_bar.logicalSingleStep()
+        elif key == Qt.Key.Key_Home:
+            offset = scroll_bar.logicalMinimum()
+        elif key == Qt.Key.Key_End:
+            offset = scroll_bar.logicalMaximum()
+        else:
+            super().keyPressEvent(event)
+            return
+        scroll_bar.setLogicalValue(offset)
+        event.accept()
+    
+    def getVirtualStats(self):
+        """Возвращает статистику виртуализации"""
+        return {
+            "item_count": self._item_count,
+            "content_height": self._totalHeight(),
+            "bound_rows": len(self._bound_rows),
+            "instantiated_widgets": len(self._bound_rows) + len(self._free_rows),
+            "bind_calls": self._bind_calls,
+            "layout_passes": self._layout_passes
+        }
+    
+    def resetVirtualStats(self):
+        """Сбрасывает статистику виртуализации"""
+        self._bind_calls = 0
+        self._layout_passes = 0
+
+
 def apply_overlay_scrollbars(widget, bg_alpha=30, handle_alpha=80, 
                              hover_alpha=120, pressed_alpha=160,
                              scroll_bar_width=8, auto_hide=False,
                              use_dark_theme=False,
-                             show_duration=300, hide_duration=1000, hide_delay=1000):
+                             show_duration=300, hide_duration=1000, hide_delay=1000,
+                             poll_interval=0, precise_sync=False, smooth_scroll=False,
+                             deferred_drag=False):
     """
     Применяет настраиваемые прозрачные скроллбары к виджету
     
@@ -813,6 +3316,10 @@ def apply_overlay_scrollbars(widget, bg_alpha=30, handle_alpha=80,
         show_duration: Длительность анимации появления (мс)
         hide_duration: Длительность анимации исчезновения (мс)
         hide_delay: Задержка перед скрытием скроллбаров (мс)
+        poll_interval: Интервал резервного опроса (мс), 0 - только по сигналам
+        precise_sync: Передавать ползунку каждое изменение значения без порога 1%
+        smooth_scroll: Плавная прокрутка колесиком с анимацией по кадрам
+        deferred_drag: Прокручивать содержимое при перетаскивании ползунка не чаще раза в 50 мс
     
     Returns:
         OverlayScrollArea: Область прокрутки с настроенными скроллбарами
@@ -822,7 +3329,9 @@ def apply_overlay_scrollbars(widget, bg_alpha=30, handle_alpha=80,
         widget, bg_alpha, handle_alpha, 
         hover_alpha, pressed_alpha, scroll_bar_width,
         auto_hide, use_dark_theme,
-        show_duration, hide_duration, hide_delay
+        show_duration, hide_duration, hide_delay,
+        poll_interval, precise_sync, smooth_scroll,
+        deferred_drag=deferred_drag
     )
     
     return scroll_area